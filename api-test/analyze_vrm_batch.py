@@ -0,0 +1,297 @@
+"""
+VRM 일괄 분석 — 파일 수천 개의 GLB 헤더 + JSON 청크만 읽어 한 표(CSV/Parquet)로 정리
+
+analyze_vrm.py 는 파일 하나를 출력해 보는 용도이고, 이 스크립트는 회귀 세트 전체를
+한 번에 훑는다. 파일마다 읽는 것은:
+    - GLB 헤더 12 바이트 + JSON 청크 (+ BIN 청크 헤더 8 바이트)
+    - 이미지마다 앞부분 몇 바이트 (PNG IHDR / JPEG SOF → 텍스처 해상도)
+BIN 본문 (메시/텍스처 데이터) 은 읽지 않으므로 400 MB 아바타도 수 ms 안에 끝난다.
+JSON 파싱이 CPU 를 쓰므로 프로세스 풀로 병렬 처리한다.
+
+한 행 = 파일 하나. 열:
+    file, file_size, glb_version, json_bytes, bin_bytes, generator,
+    vrm_spec (0.x / 1.0), title, model_version, author, license,
+    humanoid_bones, blend_shapes, meshes, primitives, vertices, morph_targets,
+    materials, textures, images, max_image_px, nodes, skins, animations,
+    bytes_image, bytes_vertex, bytes_index, bytes_morph, bytes_skin, bytes_animation, bytes_other,
+    error
+bytes_* 는 bufferView 를 용도별로 나눈 바이트 합 (어디에 용량이 쓰였는지).
+
+Usage:
+    python analyze_vrm_batch.py downloads/ --out vrm_stats.csv --jobs 8
+    python analyze_vrm_batch.py a.vrm b.vrm --out vrm_stats.parquet   # pyarrow 필요
+"""
+
+import argparse
+import csv
+import importlib.util
+import json
+import os
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+COLUMNS = [
+    'file', 'file_size', 'glb_version', 'json_bytes', 'bin_bytes', 'generator',
+    'vrm_spec', 'title', 'model_version', 'author', 'license',
+    'humanoid_bones', 'blend_shapes', 'meshes', 'primitives', 'vertices', 'morph_targets',
+    'materials', 'textures', 'images', 'max_image_px', 'nodes', 'skins', 'animations',
+    'bytes_image', 'bytes_vertex', 'bytes_index', 'bytes_morph', 'bytes_skin', 'bytes_animation', 'bytes_other',
+    'error',
+]
+BYTE_CATEGORIES = ['image', 'vertex', 'index', 'morph', 'skin', 'animation', 'other']
+JPEG_SCAN_BYTES = 64 * 1024
+VRM_EXTENSIONS = ('.vrm', '.glb')
+
+
+# ── GLB ──
+
+def read_glb_json(f):
+    """(glb version, gltf dict, json chunk length, bin chunk length) from an open GLB file."""
+    head = f.read(20)
+    if len(head) < 20 or head[:4] != b'glTF':
+        raise ValueError('not a GLB file')
+    version = struct.unpack_from('<I', head, 4)[0]
+    json_len, chunk_type = struct.unpack_from('<I4s', head, 12)
+    if chunk_type != b'JSON':
+        raise ValueError(f'first chunk is {chunk_type!r}, expected JSON')
+    gltf = json.loads(f.read(json_len).decode('utf-8'))
+    bin_head = f.read(8)
+    bin_len = struct.unpack_from('<I', bin_head, 0)[0] if len(bin_head) == 8 and bin_head[4:8] == b'BIN\x00' else 0
+    return version, gltf, json_len, bin_len
+
+
+def image_size(f, offset, length):
+    """(width, height) of a PNG/JPEG stored at [offset, offset + length) of the BIN chunk, or None."""
+    f.seek(offset)
+    head = f.read(min(length, JPEG_SCAN_BYTES) if length > 24 else length)
+    if head[:8] == b'\x89PNG\r\n\x1a\n' and len(head) >= 24:
+        return struct.unpack('>II', head[16:24])
+    if head[:2] == b'\xff\xd8':
+        i = 2
+        while i + 9 <= len(head):
+            if head[i] != 0xFF:
+                i += 1
+                continue
+            marker = head[i + 1]
+            if marker in (0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF):
+                height, width = struct.unpack('>HH', head[i + 5:i + 9])
+                return width, height
+            if marker == 0xD8 or 0xD0 <= marker <= 0xD7 or marker == 0x01 or marker == 0xFF:
+                i += 2 if marker != 0xFF else 1
+                continue
+            i += 2 + struct.unpack('>H', head[i + 2:i + 4])[0]
+    return None
+
+
+def buffer_view_categories(gltf):
+    """bufferView index -> category (first use wins: image > index > morph > skin > animation > vertex)."""
+    accessors = gltf.get('accessors', [])
+    categories = {}
+
+    def mark(accessor_idx, category):
+        if accessor_idx is not None and accessor_idx < len(accessors):
+            view = accessors[accessor_idx].get('bufferView')
+            if view is not None:
+                categories.setdefault(view, category)
+
+    for image in gltf.get('images', []):
+        if image.get('bufferView') is not None:
+            categories.setdefault(image['bufferView'], 'image')
+    for mesh in gltf.get('meshes', []):
+        for prim in mesh.get('primitives', []):
+            mark(prim.get('indices'), 'index')
+            for target in prim.get('targets', []):
+                for accessor_idx in target.values():
+                    mark(accessor_idx, 'morph')
+    for skin in gltf.get('skins', []):
+        mark(skin.get('inverseBindMatrices'), 'skin')
+    for animation in gltf.get('animations', []):
+        for sampler in animation.get('samplers', []):
+            mark(sampler.get('input'), 'animation')
+            mark(sampler.get('output'), 'animation')
+    for mesh in gltf.get('meshes', []):
+        for prim in mesh.get('primitives', []):
+            for accessor_idx in prim.get('attributes', {}).values():
+                mark(accessor_idx, 'vertex')
+    return categories
+
+
+def vrm_fields(gltf):
+    """VRM 1.0 (VRMC_vrm) or 0.x (VRM) meta / humanoid / expression counts."""
+    extensions = gltf.get('extensions', {})
+    vrmc = extensions.get('VRMC_vrm')
+    if vrmc:
+        meta = vrmc.get('meta', {})
+        expressions = vrmc.get('expressions', {})
+        return {
+            'vrm_spec': vrmc.get('specVersion', '1.0'),
+            'title': meta.get('name', ''),
+            'model_version': meta.get('version', ''),
+            'author': ', '.join(meta.get('authors', [])),
+            'license': meta.get('licenseUrl', ''),
+            'humanoid_bones': len(vrmc.get('humanoid', {}).get('humanBones', {})),
+            'blend_shapes': len(expressions.get('preset', {})) + len(expressions.get('custom', {})),
+        }
+    vrm = extensions.get('VRM')
+    if vrm:
+        meta = vrm.get('meta', {})
+        return {
+            'vrm_spec': vrm.get('specVersion', '0.0'),
+            'title': meta.get('title', ''),
+            'model_version': meta.get('version', ''),
+            'author': meta.get('author', ''),
+            'license': meta.get('licenseName', ''),
+            'humanoid_bones': len(vrm.get('humanoid', {}).get('humanBones', [])),
+            'blend_shapes': len(vrm.get('blendShapeMaster', {}).get('blendShapeGroups', [])),
+        }
+    return {'vrm_spec': '', 'title': '', 'model_version': '', 'author': '', 'license': '',
+            'humanoid_bones': 0, 'blend_shapes': 0}
+
+
+def analyze_file(path):
+    """One table row for a VRM/GLB file (errors are reported in the 'error' column)."""
+    row = dict.fromkeys(COLUMNS, '')
+    row['file'] = path
+    try:
+        row['file_size'] = os.path.getsize(path)
+        with open(path, 'rb') as f:
+            version, gltf, json_len, bin_len = read_glb_json(f)
+            row.update(glb_version=version, json_bytes=json_len, bin_bytes=bin_len,
+                       generator=gltf.get('asset', {}).get('generator', ''))
+            row.update(vrm_fields(gltf))
+
+            meshes = gltf.get('meshes', [])
+            accessors = gltf.get('accessors', [])
+            primitives = [p for m in meshes for p in m.get('primitives', [])]
+            positions = [p.get('attributes', {}).get('POSITION') for p in primitives]
+            row.update(
+                meshes=len(meshes),
+                primitives=len(primitives),
+                vertices=sum(accessors[a].get('count', 0) for a in positions if a is not None and a < len(accessors)),
+                morph_targets=sum(len(p.get('targets', [])) for p in primitives),
+                materials=len(gltf.get('materials', [])),
+                textures=len(gltf.get('textures', [])),
+                images=len(gltf.get('images', [])),
+                nodes=len(gltf.get('nodes', [])),
+                skins=len(gltf.get('skins', [])),
+                animations=len(gltf.get('animations', [])),
+            )
+
+            views = gltf.get('bufferViews', [])
+            categories = buffer_view_categories(gltf)
+            totals = dict.fromkeys(BYTE_CATEGORIES, 0)
+            for i, view in enumerate(views):
+                totals[categories.get(i, 'other')] += view.get('byteLength', 0)
+            row.update({f'bytes_{name}': size for name, size in totals.items()})
+
+            # 텍스처 해상도: 이미지 앞부분만 읽음 (BIN 본문 = header 12 + JSON 청크 + BIN 청크 헤더 8 이후)
+            bin_start = 20 + json_len + 8
+            max_px = 0
+            for image in gltf.get('images', []):
+                view_idx = image.get('bufferView')
+                if bin_len and view_idx is not None and view_idx < len(views):
+                    view = views[view_idx]
+                    size = image_size(f, bin_start + view.get('byteOffset', 0), view.get('byteLength', 0))
+                    if size:
+                        max_px = max(max_px, *size)
+            row['max_image_px'] = max_px
+    except (OSError, ValueError, KeyError, TypeError, struct.error) as e:
+        row['error'] = f'{type(e).__name__}: {e}'
+    return row
+
+
+# ── Batch ──
+
+def collect_files(paths):
+    """VRM/GLB files from file and folder arguments (folders are searched recursively)."""
+    files = []
+    for p in paths:
+        if os.path.isdir(p):
+            for root, _, names in os.walk(p):
+                files.extend(os.path.join(root, n) for n in sorted(names) if n.lower().endswith(VRM_EXTENSIONS))
+        else:
+            files.append(p)
+    return files
+
+
+def analyze_files(files, jobs=None, progress=None):
+    """Rows for all files in input order, parsed on a process pool."""
+    rows = []
+    chunksize = max(1, min(32, len(files) // ((jobs or os.cpu_count() or 1) * 4)))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for row in pool.map(analyze_file, files, chunksize=chunksize):
+            rows.append(row)
+            if progress:
+                progress(row)
+    return rows
+
+
+def write_table(rows, out_path):
+    """CSV, or Parquet when out_path ends with .parquet (needs pyarrow)."""
+    if out_path.lower().endswith('.parquet'):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        columns = {name: [row[name] if row[name] != '' else None for row in rows] for name in COLUMNS}
+        pq.write_table(pa.table(columns), out_path)
+        return
+    with open(out_path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def print_outliers(rows, top):
+    ok = [r for r in rows if not r['error']]
+    if not ok:
+        return
+    print('\nLargest files:')
+    for r in sorted(ok, key=lambda r: r['file_size'], reverse=True)[:top]:
+        print(f"  {r['file_size'] / 1024 / 1024:8.1f} MB  images {r['bytes_image'] / 1024 / 1024:6.1f} MB"
+              f"  max {r['max_image_px']:>5} px  {os.path.basename(r['file'])}")
+    print('\nMost vertices:')
+    for r in sorted(ok, key=lambda r: r['vertices'], reverse=True)[:top]:
+        print(f"  {r['vertices']:>9,}  {r['meshes']} meshes / {r['morph_targets']} morphs  {os.path.basename(r['file'])}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Summarize many VRM/GLB files into one table')
+    parser.add_argument('paths', nargs='+', help='VRM/GLB files or folders')
+    parser.add_argument('--out', default='vrm_stats.csv', help='Output table (.csv or .parquet)')
+    parser.add_argument('--jobs', '-j', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--top', type=int, default=10, help='Outliers to print (default: 10, 0 = none)')
+    args = parser.parse_args(argv)
+
+    # pyarrow 유무는 분석 전에 확인
+    if args.out.lower().endswith('.parquet') and importlib.util.find_spec('pyarrow') is None:
+        print('Error: Parquet output needs pyarrow (pip install pyarrow), or use a .csv path')
+        sys.exit(1)
+
+    files = collect_files(args.paths)
+    if not files:
+        print('Error: no .vrm/.glb files found')
+        sys.exit(1)
+
+    total = len(files)
+    done = [0]
+    step = max(1, total // 20)
+
+    def report(row):
+        done[0] += 1
+        if row['error']:
+            print(f"  {os.path.basename(row['file'])}: {row['error']}")
+        if done[0] % step == 0 or done[0] == total:
+            print(f'[{done[0]}/{total}]')
+
+    start = time.perf_counter()
+    rows = analyze_files(files, args.jobs, progress=report)
+    write_table(rows, args.out)
+    failed = sum(1 for r in rows if r['error'])
+    print(f'\n=== {total - failed}/{total} files analyzed in {time.perf_counter() - start:.1f}s → {args.out} ===')
+    if args.top:
+        print_outliers(rows, args.top)
+
+
+if __name__ == '__main__':
+    main()
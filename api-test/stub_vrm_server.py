@@ -0,0 +1,175 @@
+"""
+VRM 생성 API 스텁 서버 — vrm_api_client.py 로컬 테스트용 (실제 API/토큰 불필요)
+
+    POST /generate  {"zepetoId": "<id>"}  →  {"url": "http://<host>/files/<id>.vrm"}
+    HEAD/GET /files/<id>.vrm              →  Accept-Ranges: bytes, Range 요청은 206
+
+파일 내용은 zepetoId 로 정해지는 의사난수 바이트 (--size-mb) 이거나, --template 으로 준
+실제 VRM 파일 (모든 id 에 같은 내용 → analyze_vrm.py 등으로 확인 가능).
+
+장애 주입:
+    --drop-rate 0..1   GET 응답을 중간에 끊음 (이어받기 확인)
+    --fail-rate 0..1   /generate 가 503 (재시도 확인)
+    --no-ranges        Range 무시, 항상 200 전체 (단일 스트림 fallback 확인)
+
+Usage:
+    python stub_vrm_server.py --port 8765 --size-mb 64 --drop-rate 0.3
+    python vrm_api_client.py a b c --url http://127.0.0.1:8765/generate --out downloads
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+RANGE_RE = re.compile(r'bytes=(\d*)-(\d*)$')
+
+
+class StubContent:
+    """Deterministic bytes per file name (32-byte SHA-256 blocks), or one template file for all."""
+
+    def __init__(self, size, template=None):
+        self.template = template
+        self.size = len(template) if template is not None else size
+
+    def read(self, name, start, end):
+        """Bytes [start, end] (inclusive)."""
+        if self.template is not None:
+            return self.template[start:end + 1]
+        seed = name.encode('utf-8')
+        first, last = start // 32, end // 32
+        blob = b''.join(hashlib.sha256(seed + i.to_bytes(8, 'little')).digest() for i in range(first, last + 1))
+        return blob[start - first * 32:end - first * 32 + 1]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive: 클라이언트 커넥션 풀 재사용 확인용
+    content = None
+    options = None
+
+    def log_message(self, format, *args):
+        if not self.options.quiet:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, data):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        try:
+            data = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            data = {}
+        if self.path.rstrip('/') != '/generate':
+            self._send_json(404, {'error': 'not found'})
+            return
+        if random.random() < self.options.fail_rate:
+            self._send_json(503, {'error': 'simulated overload'})
+            return
+        zepeto_id = data.get('zepetoId')
+        if not zepeto_id:
+            self._send_json(400, {'error': 'zepetoId is required'})
+            return
+        host = self.headers.get('Host', f'127.0.0.1:{self.server.server_port}')
+        self._send_json(200, {'url': f'http://{host}/files/{zepeto_id}.vrm', 'zepetoId': zepeto_id})
+
+    def _file_request(self):
+        """(name, start, end, partial) for /files/<name>, or None after sending an error."""
+        match = re.match(r'/files/([^/]+)$', self.path)
+        if not match:
+            self.send_error(404)
+            return None
+        size = self.content.size
+        start, end, partial = 0, size - 1, False
+        range_header = self.headers.get('Range')
+        if range_header and not self.options.no_ranges:
+            m = RANGE_RE.match(range_header.strip())
+            if m and (m.group(1) or m.group(2)):
+                if m.group(1):
+                    start = int(m.group(1))
+                    end = min(int(m.group(2)), size - 1) if m.group(2) else size - 1
+                else:  # suffix range: last N bytes
+                    start = max(size - int(m.group(2)), 0)
+                if start >= size or start > end:
+                    self.send_response(416)
+                    self.send_header('Content-Range', f'bytes */{size}')
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return None
+                partial = True
+        return match.group(1), start, end, partial
+
+    def _send_file_headers(self, start, end, partial):
+        self.send_response(206 if partial else 200)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Length', str(end - start + 1))
+        if not self.options.no_ranges:
+            self.send_header('Accept-Ranges', 'bytes')
+        if partial:
+            self.send_header('Content-Range', f'bytes {start}-{end}/{self.content.size}')
+        self.end_headers()
+
+    def do_HEAD(self):
+        request = self._file_request()
+        if request:
+            name, start, end, partial = request
+            self._send_file_headers(start, end, partial)
+
+    def do_GET(self):
+        request = self._file_request()
+        if not request:
+            return
+        name, start, end, partial = request
+        self._send_file_headers(start, end, partial)
+        # 끊김 주입: 본문 일부만 보내고 연결 종료
+        cut = end + 1
+        if end > start and random.random() < self.options.drop_rate:
+            cut = random.randint(start + 1, end)
+        pos = start
+        while pos < cut:
+            chunk_end = min(pos + 256 * 1024, cut) - 1
+            self.wfile.write(self.content.read(name, pos, chunk_end))
+            pos = chunk_end + 1
+        if cut <= end:
+            self.close_connection = True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Local stub of the VRM generation API')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--size-mb', type=float, default=8, help='Size of generated files (default: 8)')
+    parser.add_argument('--template', help='Serve this VRM file for every id instead of random bytes')
+    parser.add_argument('--drop-rate', type=float, default=0.0, help='Chance to cut a GET response short')
+    parser.add_argument('--fail-rate', type=float, default=0.0, help='Chance for /generate to answer 503')
+    parser.add_argument('--no-ranges', action='store_true', help='Ignore Range headers')
+    parser.add_argument('--quiet', action='store_true', help='No per-request log lines')
+    args = parser.parse_args(argv)
+
+    template = None
+    if args.template:
+        with open(args.template, 'rb') as f:
+            template = f.read()
+    StubHandler.content = StubContent(int(args.size_mb * 1024 * 1024), template)
+    StubHandler.options = args
+
+    server = ThreadingHTTPServer((args.host, args.port), StubHandler)
+    print(f'Stub VRM API on http://{args.host}:{args.port}/generate '
+          f'({StubHandler.content.size / 1024 / 1024:.1f} MB files, drop {args.drop_rate}, fail {args.fail_rate})')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,9 @@
 import requests
 import json
-import os
 from datetime import datetime
 
+from vrm_api_client import DownloadError, VrmApiClient
+
 # API 엔드포인트
 url = ''
 
@@ -46,16 +47,12 @@ try:
         print(f"Downloading VRM file from: {vrm_url}")
         print(f"Saving as: {filename}")
 
-        download_response = requests.get(vrm_url, timeout=60)
-
-        if download_response.status_code == 200:
-            with open(filename, 'wb') as f:
-                f.write(download_response.content)
+        # 스트리밍 + 이어받기 (vrm_api_client.py), 메모리에 파일 전체를 올리지 않음
+        with VrmApiClient(url) as client:
+            result = client.download(vrm_url, filename)
 
-            file_size = os.path.getsize(filename)
-            print(f"Download complete! File size: {file_size:,} bytes ({file_size/1024/1024:.2f} MB)")
-        else:
-            print(f"Download failed with status code: {download_response.status_code}")
+        file_size = result['size']
+        print(f"Download complete! File size: {file_size:,} bytes ({file_size/1024/1024:.2f} MB)")
 
-except requests.exceptions.RequestException as e:
+except (requests.exceptions.RequestException, DownloadError) as e:
     print(f"Error occurred: {e}")
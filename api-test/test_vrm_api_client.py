@@ -0,0 +1,154 @@
+"""
+vrm_api_client.py 테스트 — stub_vrm_server.py 를 스레드로 띄워서 확인 (네트워크/토큰 불필요)
+
+    - 단일 스트림 / 구간 병렬 다운로드 내용이 스텁과 바이트 단위로 같은지
+    - .part 가 남아 있으면 그 크기부터 이어받는지, 연결이 중간에 끊겨도 완성되는지
+    - 서버가 Range 를 무시하면 (--no-ranges) 단일 스트림으로 처음부터 받는지
+    - POST /generate 가 503 에 재시도되지 않는지 (멱등이 아님)
+    - fetch 가 이미 받은 <id>.vrm 을 건너뛰는지
+
+Usage:
+    python -m unittest test_vrm_api_client -v
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import ThreadingHTTPServer
+
+import requests
+
+from stub_vrm_server import StubContent, StubHandler
+from vrm_api_client import VrmApiClient, bulk_download
+
+FILE_SIZE = 256 * 1024 + 123  # 구간 경계가 32 바이트 블록과 어긋나도록
+
+
+class StubServer:
+    """stub_vrm_server on a free port in a background thread; counts POST /generate calls."""
+
+    def __init__(self, size=FILE_SIZE, drop_rate=0.0, fail_rate=0.0, no_ranges=False):
+        options = argparse.Namespace(drop_rate=drop_rate, fail_rate=fail_rate, no_ranges=no_ranges, quiet=True)
+        self.content = StubContent(size)
+        self.posts = 0
+        server = self
+
+        class Handler(StubHandler):
+            def do_POST(self):
+                server.posts += 1
+                super().do_POST()
+
+        Handler.content = self.content
+        Handler.options = options
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.base = f'http://127.0.0.1:{self.httpd.server_port}'
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def expected(self, name):
+        return self.content.read(name, 0, self.content.size - 1)
+
+
+class VrmApiClientTest(unittest.TestCase):
+
+    def setUp(self):
+        self.out = tempfile.mkdtemp(prefix='vrm_api_client_test_')
+
+    def tearDown(self):
+        shutil.rmtree(self.out, ignore_errors=True)
+
+    def _read(self, path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def _client(self, stub, **kwargs):
+        kwargs.setdefault('timeout', (2, 5))
+        return VrmApiClient(f'{stub.base}/generate', **kwargs)
+
+    def test_single_stream(self):
+        with StubServer() as stub, self._client(stub) as client:
+            dest = os.path.join(self.out, 'a.vrm')
+            result = client.download(f'{stub.base}/files/a.vrm', dest)
+            self.assertEqual(result['parts'], 1)
+            self.assertEqual(self._read(dest), stub.expected('a.vrm'))
+            self.assertFalse(os.path.exists(dest + '.part'))
+
+    def test_parallel_ranges(self):
+        with StubServer() as stub, self._client(stub, parallel_threshold=1024, parallel_parts=4) as client:
+            dest = os.path.join(self.out, 'b.vrm')
+            result = client.download(f'{stub.base}/files/b.vrm', dest)
+            self.assertEqual(result['parts'], 4)
+            self.assertEqual(self._read(dest), stub.expected('b.vrm'))
+            self.assertEqual([n for n in os.listdir(self.out) if '.part' in n], [])
+
+    def test_resume_from_part_file(self):
+        with StubServer() as stub, self._client(stub) as client:
+            dest = os.path.join(self.out, 'c.vrm')
+            have = 100_000
+            with open(dest + '.part', 'wb') as f:
+                f.write(stub.expected('c.vrm')[:have])
+            result = client.download(f'{stub.base}/files/c.vrm', dest)
+            self.assertEqual(result['resumed'], have)
+            self.assertEqual(self._read(dest), stub.expected('c.vrm'))
+
+    def test_resume_parallel_part_files(self):
+        with StubServer() as stub, self._client(stub, parallel_threshold=1024, parallel_parts=4) as client:
+            dest = os.path.join(self.out, 'd.vrm')
+            data = stub.expected('d.vrm')
+            # 두 번째 구간만 절반 받아 둔 상태
+            start = FILE_SIZE // 4
+            with open(dest + '.part1', 'wb') as f:
+                f.write(data[start:start + 1000])
+            result = client.download(f'{stub.base}/files/d.vrm', dest)
+            self.assertEqual(result['resumed'], 1000)
+            self.assertEqual(self._read(dest), data)
+
+    def test_dropped_connections(self):
+        with StubServer(drop_rate=0.5) as stub, \
+                self._client(stub, retries=30, parallel_threshold=1024, parallel_parts=4) as client:
+            for name in ('e.vrm', 'f.vrm'):
+                dest = os.path.join(self.out, name)
+                client.download(f'{stub.base}/files/{name}', dest)
+                self.assertEqual(self._read(dest), stub.expected(name))
+
+    def test_no_ranges_fallback(self):
+        with StubServer(no_ranges=True) as stub, self._client(stub, parallel_threshold=1024) as client:
+            dest = os.path.join(self.out, 'g.vrm')
+            # 이어받을 수 없으므로 남은 .part 는 버리고 처음부터
+            with open(dest + '.part', 'wb') as f:
+                f.write(b'stale bytes')
+            result = client.download(f'{stub.base}/files/g.vrm', dest)
+            self.assertEqual(result['parts'], 1)
+            self.assertEqual(result['resumed'], 0)
+            self.assertEqual(self._read(dest), stub.expected('g.vrm'))
+
+    def test_generate_is_not_retried_on_5xx(self):
+        with StubServer(fail_rate=1.0) as stub, self._client(stub, retries=3) as client:
+            with self.assertRaises(requests.exceptions.HTTPError):
+                client.generate('h')
+            self.assertEqual(stub.posts, 1)
+
+    def test_bulk_fetch_skips_existing(self):
+        with StubServer() as stub, self._client(stub) as client:
+            ids = ['i1', 'i2', 'i3']
+            first = bulk_download(client, ids, self.out, jobs=3)
+            self.assertEqual([r['status'] for r in first], ['ok'] * 3)
+            for zid in ids:
+                self.assertEqual(self._read(os.path.join(self.out, f'{zid}.vrm')), stub.expected(f'{zid}.vrm'))
+            second = bulk_download(client, ids, self.out, jobs=3)
+            self.assertEqual([r['status'] for r in second], ['skipped'] * 3)
+            self.assertEqual(stub.posts, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,275 @@
+"""
+VRM 생성 API 클라이언트 — 세션 재사용, 스트리밍 다운로드, 이어받기, 병렬 구간, 일괄 작업
+
+- 하나의 requests.Session (HTTPAdapter 커넥션 풀 + 재시도)을 모든 요청이 공유한다.
+- VRM은 메모리에 올리지 않고 CHUNK_SIZE 단위로 <파일>.part 에 스트리밍한 뒤 완료 시 rename.
+- 연결이 끊기면 .part 크기부터 `Range: bytes=<n>-` 로 이어받는다 (서버가 Range를 지원할 때).
+- PARALLEL_THRESHOLD 이상 파일은 PARALLEL_PARTS 개 구간을 동시에 받아 합친다
+  (구간마다 .partN 파일이라 구간 단위로도 이어받기 가능).
+- 여러 zepetoId 는 bulk_download()가 스레드 풀로 jobs 개씩 처리한다.
+  이미 받은 <zepetoId>.vrm 은 건너뛰므로 중단된 일괄 작업은 같은 명령으로 다시 돌리면 된다.
+
+로컬 테스트는 stub_vrm_server.py (Range 지원, 끊김/실패 주입) 를 띄워서 한다.
+자동 확인: python -m unittest test_vrm_api_client (스텁을 스레드로 띄워 이어받기/구간 병렬/Range 미지원 확인).
+
+Usage:
+    python vrm_api_client.py crepusculo_90 other_id --url <generate endpoint> --token <token> --out downloads
+    python vrm_api_client.py --ids-file ids.txt --url http://127.0.0.1:8765/generate --out downloads --jobs 8
+
+    with VrmApiClient(url, token) as client:
+        result = client.fetch('crepusculo_90', 'downloads')
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+CHUNK_SIZE = 1024 * 1024
+PARALLEL_THRESHOLD = 32 * 1024 * 1024
+PARALLEL_PARTS = 4
+DEFAULT_JOBS = 4
+DEFAULT_RETRIES = 3
+DEFAULT_TIMEOUT = (10, 60)  # (connect, read) seconds
+
+# 스트리밍 도중 끊긴 경우 — 이어받기로 재시도
+STREAM_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError,
+                 requests.exceptions.Timeout)
+
+
+class DownloadError(Exception):
+    pass
+
+
+class VrmApiClient:
+    """Pooled session for the VRM generation API and its file downloads."""
+
+    def __init__(self, url, token='', pool_size=16, retries=DEFAULT_RETRIES, timeout=DEFAULT_TIMEOUT,
+                 parallel_threshold=PARALLEL_THRESHOLD, parallel_parts=PARALLEL_PARTS):
+        self.url = url
+        self.retries = retries
+        self.timeout = timeout
+        self.parallel_threshold = parallel_threshold
+        self.parallel_parts = parallel_parts
+
+        self.session = requests.Session()
+        # 연결 실패/5xx/429 는 어댑터가 백오프 재시도 (스트림 중간 끊김은 download()가 이어받기로 처리).
+        # POST /generate 는 멱등이 아니므로 5xx/429/읽기 오류로는 재시도하지 않는다 —
+        # urllib3 는 allowed_methods 에 없는 메서드도 연결 실패 (요청 전송 전) 만은 재시도한다.
+        retry = Retry(total=retries, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=frozenset(['GET', 'HEAD']))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers['Content-Type'] = 'application/json'
+        if token:
+            self.session.headers['Authorization'] = token
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    # ── API ──
+
+    def generate(self, zepeto_id, **params):
+        """POST {'zepetoId': ...} to the generate endpoint; returns the response JSON (contains 'url')."""
+        response = self.session.post(self.url, json={'zepetoId': zepeto_id, **params}, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    # ── Download ──
+
+    def _probe(self, url):
+        """(total size or None, server accepts byte ranges)"""
+        try:
+            response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
+        except requests.exceptions.RequestException:
+            return None, False
+        if response.status_code != 200:
+            return None, False
+        length = response.headers.get('Content-Length')
+        ranges = response.headers.get('Accept-Ranges', '').lower() == 'bytes'
+        return (int(length) if length is not None else None), ranges
+
+    def _stream_range(self, url, part_path, start, end, use_range):
+        """
+        Append bytes [start + len(part), end] of url to part_path, resuming after dropped connections.
+
+        end is inclusive; None means to the end of the file.
+        """
+        for attempt in range(self.retries + 1):
+            have = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            if end is not None and start + have > end:
+                return
+            headers = {}
+            if use_range and (have or start or end is not None):
+                headers['Range'] = f'bytes={start + have}-' + ('' if end is None else str(end))
+            try:
+                with self.session.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+                    if response.status_code == 416 and end is None and have:
+                        return  # 이미 끝까지 받음
+                    response.raise_for_status()
+                    mode = 'ab'
+                    if headers and response.status_code != 206:
+                        if start or end is not None:
+                            raise DownloadError(f'server ignored Range for {url}')
+                        mode = 'wb'  # 서버가 Range 무시 → 처음부터
+                    elif not headers:
+                        mode = 'wb'
+                    with open(part_path, mode) as f:
+                        for chunk in response.iter_content(CHUNK_SIZE):
+                            f.write(chunk)
+                return
+            except STREAM_ERRORS:
+                # Range 미지원 서버면 다음 시도는 처음부터 (headers 없음 → 'wb')
+                if attempt == self.retries:
+                    raise
+                time.sleep(0.5 * (attempt + 1))
+
+    def download(self, url, dest_path):
+        """
+        Stream url to dest_path (via dest_path.part / .partN, renamed when complete).
+
+        Returns:
+            dict: path, size, parts (1 = single stream), resumed (bytes already on disk)
+        """
+        total, ranges = self._probe(url)
+        part_path = dest_path + '.part'
+        parts = self.parallel_parts if (ranges and total and total >= self.parallel_threshold) else 1
+
+        if parts == 1:
+            resumed = os.path.getsize(part_path) if (ranges and os.path.exists(part_path)) else 0
+            if not ranges and os.path.exists(part_path):
+                os.remove(part_path)
+            self._stream_range(url, part_path, 0, None, ranges)
+        else:
+            # 구간별 .partN 파일 → 각 구간 이어받기 가능, 다 받으면 순서대로 합침
+            bounds = [(total * i // parts, total * (i + 1) // parts - 1) for i in range(parts)]
+            paths = [f'{part_path}{i}' for i in range(parts)]
+            resumed = sum(os.path.getsize(p) for p in paths if os.path.exists(p))
+            with ThreadPoolExecutor(max_workers=parts) as pool:
+                futures = [pool.submit(self._stream_range, url, p, s, e, True) for p, (s, e) in zip(paths, bounds)]
+                for future in futures:
+                    future.result()
+            with open(part_path, 'wb') as out:
+                for p in paths:
+                    with open(p, 'rb') as f:
+                        shutil.copyfileobj(f, out, CHUNK_SIZE)
+            for p in paths:
+                os.remove(p)
+
+        size = os.path.getsize(part_path)
+        if total is not None and size != total:
+            raise DownloadError(f'size mismatch for {url}: got {size:,} of {total:,} bytes')
+        os.replace(part_path, dest_path)
+        return {'path': dest_path, 'size': size, 'parts': parts, 'resumed': resumed}
+
+    def fetch(self, zepeto_id, out_dir, overwrite=False):
+        """Generate + download one avatar to <out_dir>/<zepetoId>.vrm (skipped if it already exists)."""
+        dest_path = os.path.join(out_dir, f'{zepeto_id}.vrm')
+        result = {'zepeto_id': zepeto_id, 'status': 'ok', 'path': dest_path, 'size': 0, 'parts': 0,
+                  'resumed': 0, 'seconds': 0.0, 'error': ''}
+        if os.path.exists(dest_path) and not overwrite:
+            result.update(status='skipped', size=os.path.getsize(dest_path))
+            return result
+        start = time.perf_counter()
+        try:
+            response_data = self.generate(zepeto_id)
+            if 'url' not in response_data:
+                raise DownloadError(f'no url in response: {json.dumps(response_data, ensure_ascii=False)[:200]}')
+            result.update(self.download(response_data['url'], dest_path))
+        except (requests.exceptions.RequestException, DownloadError, OSError, ValueError) as e:
+            result.update(status='failed', error=str(e))
+        result['seconds'] = round(time.perf_counter() - start, 2)
+        return result
+
+
+def bulk_download(client, zepeto_ids, out_dir, jobs=DEFAULT_JOBS, progress=None, overwrite=False):
+    """
+    Fetch many avatars, at most `jobs` at a time.
+
+    Args:
+        progress: Called with each result dict as it finishes
+
+    Returns:
+        list of result dicts in input order (see VrmApiClient.fetch)
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    results = [None] * len(zepeto_ids)
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(client.fetch, zid, out_dir, overwrite): i for i, zid in enumerate(zepeto_ids)}
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            if progress:
+                progress(result)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate and download VRMs for many zepetoIds')
+    parser.add_argument('zepeto_ids', nargs='*', help='zepetoIds to fetch')
+    parser.add_argument('--ids-file', help='Text file with one zepetoId per line')
+    parser.add_argument('--url', required=True, help='Generate endpoint (POST)')
+    parser.add_argument('--token', default=os.environ.get('VRM_API_TOKEN', ''),
+                        help='Authorization header (default: $VRM_API_TOKEN)')
+    parser.add_argument('--out', default='downloads', help='Output folder (default: downloads)')
+    parser.add_argument('--jobs', '-j', type=int, default=DEFAULT_JOBS,
+                        help=f'Avatars in flight at once (default: {DEFAULT_JOBS})')
+    parser.add_argument('--overwrite', action='store_true', help='Download again even if <id>.vrm exists')
+    parser.add_argument('--manifest', help='Write per-avatar results to this JSON file')
+    args = parser.parse_args(argv)
+
+    zepeto_ids = list(args.zepeto_ids)
+    if args.ids_file:
+        with open(args.ids_file, 'r', encoding='utf-8') as f:
+            zepeto_ids += [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    zepeto_ids = list(dict.fromkeys(zepeto_ids))
+    if not zepeto_ids:
+        print('Error: no zepetoIds given')
+        sys.exit(1)
+
+    total = len(zepeto_ids)
+    done = [0]
+
+    def report(r):
+        done[0] += 1
+        if r['status'] == 'failed':
+            print(f"[{done[0]}/{total}] FAILED {r['zepeto_id']}: {r['error']}")
+        elif r['status'] == 'skipped':
+            print(f"[{done[0]}/{total}] {r['zepeto_id']}: already downloaded")
+        else:
+            resumed = f", resumed {r['resumed'] / 1024 / 1024:.1f} MB" if r['resumed'] else ''
+            print(f"[{done[0]}/{total}] {r['zepeto_id']}: {r['size'] / 1024 / 1024:.2f} MB in {r['seconds']:.1f}s"
+                  f" ({r['parts']} part(s){resumed})")
+
+    start = time.perf_counter()
+    # 풀 크기: 동시 아바타 수 x 구간 수 만큼 연결을 재사용
+    with VrmApiClient(args.url, args.token, pool_size=max(args.jobs * PARALLEL_PARTS, 10)) as client:
+        results = bulk_download(client, zepeto_ids, args.out, args.jobs, progress=report, overwrite=args.overwrite)
+
+    if args.manifest:
+        with open(args.manifest, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+    failed = sum(1 for r in results if r['status'] == 'failed')
+    downloaded = sum(r['size'] for r in results if r['status'] == 'ok')
+    print(f"\n=== {total - failed}/{total} ok ({downloaded / 1024 / 1024:.1f} MB downloaded) "
+          f"in {time.perf_counter() - start:.1f}s ===")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -70,6 +70,10 @@ def main():
         "--no-spring", action="store_true",
         help="Skip spring bone conversion",
     )
+    parser.add_argument(
+        "--layout", default="shared", choices=["shared", "interleaved", "compact"],
+        help="Vertex buffer layout (default: shared)",
+    )
     args = parser.parse_args()
 
     from . import pmx_reader, gltf_builder, bone_mapping, spring_converter, vrm_builder
@@ -88,20 +92,21 @@ def main():
 
     # 2. Build glTF skeleton / mesh / textures
     print("Building glTF skeleton/mesh/textures...")
-    gltf_data = gltf_builder.build(pmx_data)
+    gltf_data = gltf_builder.build(pmx_data, layout=args.layout)
 
     # 3. Map bones to VRM humanoid
     print("Mapping bones to VRM humanoid...")
     humanoid_bones = bone_mapping.map_bones(
         pmx_data["bones"],
-        pmx_data["skinned_bone_indices"],
+        pmx_data["skinned_bone_mask"],
     )
+    skinned = pmx_data["skinned_bone_mask"]
     print(f"  Mapped {len(humanoid_bones)} humanoid bones")
-    print(f"  Skinned bones in model: {len(pmx_data['skinned_bone_indices'])} / {len(pmx_data['bones'])}")
+    print(f"  Skinned bones in model: {int(skinned.sum())} / {len(pmx_data['bones'])}")
     skinnless = [
-        b["name"] for i, b in enumerate(pmx_data["bones"])
-        if i not in pmx_data["skinned_bone_indices"]
-        and any(e["node"] == i for e in humanoid_bones)
+        pmx_data["bones"][i]["name"]
+        for i in sorted({e["node"] for e in humanoid_bones})
+        if not skinned[i]
     ]
     if skinnless:
         print(f"  Warning: humanoid bone(s) with no skinning: {skinnless}")
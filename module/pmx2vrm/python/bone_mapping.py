@@ -137,13 +137,13 @@ VRM_REQUIRED_BONES = {
 }
 
 
-def map_bones(bones, skinned_bone_indices=None):
+def map_bones(bones, skinned_bone_mask=None):
     """Map PMX bones to VRM humanoid bones.
 
     Args:
         bones: List of bone dicts with 'name' field (PMX Japanese names).
-        skinned_bone_indices: Optional set of bone indices that actually
-            drive vertices (weight > 0).  When provided, the bone with real
+        skinned_bone_mask: Optional bool array, one entry per bone, True where
+            the bone actually drives vertices (weight > 0).  When provided, the bone with real
             skinning data is preferred over a name-only match when multiple
             PMX bones compete for the same VRM slot (e.g. 左足 vs 左足D).
 
@@ -151,7 +151,7 @@ def map_bones(bones, skinned_bone_indices=None):
         List of dicts: [{"bone": "hips", "node": 0, "useDefaultValues": True}, ...]
 
     Selection priority per VRM slot (highest first):
-        1. Bone with skinning data  (node_index in skinned_bone_indices)
+        1. Bone with skinning data  (skinned_bone_mask[node_index])
         2. First name match in bone list order (fallback)
     """
     from collections import defaultdict
@@ -177,7 +177,7 @@ def map_bones(bones, skinned_bone_indices=None):
         if name in PMX_BONE_REPLACEMENTS:
             continue  # Skip D-bones / EX bones — use standard bones only
         vrm_names = mapping.get(name, [])
-        has_skin = (skinned_bone_indices is None) or (node_index in skinned_bone_indices)
+        has_skin = skinned_bone_mask is None or bool(skinned_bone_mask[node_index])
         for vrm_name in vrm_names:
             candidates[vrm_name].append((node_index, has_skin))
 
@@ -193,7 +193,7 @@ def map_bones(bones, skinned_bone_indices=None):
         # Prefer skinned bone; among ties, first occurrence (lowest node index)
         skinned = [c for c in cands if c[1]]
         node_index, _ = skinned[0] if skinned else cands[0]
-        if skinned_bone_indices is not None and not skinned:
+        if skinned_bone_mask is not None and not skinned:
             print(f"  Note: '{vrm_name}' mapped to node {node_index} (no skinning data found)")
         humanoid_bones.append({
             "bone": vrm_name,
@@ -0,0 +1,218 @@
+"""Read-only GLB/VRM access layer — parse once, memory-map, slice without copying.
+
+The header and chunk table are parsed once on open. File input is memory-mapped,
+so bufferViews, images and accessors come back as memoryview windows into the
+BIN chunk: pulling a thumbnail out of a 100 MB VRM touches only the pages that
+hold the thumbnail. The JSON chunk is decoded on first access and cached.
+
+Header problems that make the file unreadable raise GlbFormatError with a message
+fit for a report; recoverable ones (declared length mismatch, unexpected second
+chunk) are collected in GlbFile.warnings. vrm_validator builds its GLB layer on
+these.
+
+Usage (API):
+    from glb_reader import GlbFile
+    with GlbFile("model.vrm") as glb:
+        meta = glb.json["extensions"]["VRM"]["meta"]
+        png = bytes(glb.thumbnail())
+        positions = glb.accessor(0)          # memoryview cast to 'f'
+"""
+
+import json
+import mmap
+import struct
+from functools import cached_property
+from pathlib import Path
+
+GLB_MAGIC = 0x46546C67
+CHUNK_JSON = 0x4E4F534A
+CHUNK_BIN = 0x004E4942
+
+# glTF accessor componentType → struct/memoryview format
+_COMPONENT_FORMATS = {
+    5120: "b", 5121: "B", 5122: "h", 5123: "H", 5125: "I", 5126: "f",
+}
+_TYPE_COMPONENTS = {
+    "SCALAR": 1, "VEC2": 2, "VEC3": 3, "VEC4": 4, "MAT2": 4, "MAT3": 9, "MAT4": 16,
+}
+
+
+def map_file(path):
+    """Memory-map a file read-only. Empty files map to b"" (mmap rejects size 0)."""
+    with open(path, "rb") as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return b""
+
+
+class GlbFormatError(ValueError):
+    """Data is not a readable GLB 2.0 container."""
+
+    def __init__(self, message, warnings=()):
+        super().__init__(message)
+        self.warnings = list(warnings)  # Noticed before the fatal problem
+
+
+class GlbFile:
+    """Parsed GLB container over a memory-mapped file or an in-memory buffer.
+
+    Views returned by this class point into the mapping. Copy them with bytes()
+    if they must outlive close().
+    """
+
+    def __init__(self, source):
+        """Open *source* (path or bytes-like) and parse the chunk table.
+
+        Raises:
+            GlbFormatError: If the data is not a GLB 2.0 container.
+        """
+        if isinstance(source, (str, Path)):
+            self.path = Path(source)
+            self._mmap = map_file(self.path)
+            self._buf = memoryview(self._mmap)
+        else:
+            self.path = None
+            self._mmap = None
+            self._buf = memoryview(source)
+        self.warnings = []
+        try:
+            self._parse()
+        except ValueError as e:
+            self.close()
+            raise GlbFormatError(str(e), self.warnings) from None
+
+    def _parse(self):
+        buf = self._buf
+        if len(buf) < 12:
+            raise ValueError("File too small for GLB header (< 12 bytes)")
+        magic, self.version, self.total_length = struct.unpack_from("<III", buf, 0)
+        if magic != GLB_MAGIC:
+            raise ValueError(f"Invalid GLB magic: 0x{magic:08X} (expected 0x{GLB_MAGIC:08X} 'glTF')")
+        if self.version != 2:
+            raise ValueError(f"Unsupported GLB version: {self.version} (expected 2)")
+        if self.total_length > len(buf):
+            self.warnings.append(
+                f"GLB header declares {self.total_length} bytes but file is {len(buf)} bytes")
+
+        if len(buf) < 20:
+            raise ValueError("File too small for JSON chunk header")
+        json_len, json_type = struct.unpack_from("<II", buf, 12)
+        if json_type != CHUNK_JSON:
+            raise ValueError(
+                f"First chunk is not JSON: 0x{json_type:08X} (expected 0x{CHUNK_JSON:08X})")
+        json_end = 20 + json_len
+        if json_end > len(buf):
+            raise ValueError("JSON chunk extends beyond file")
+        self._json_span = (20, json_end)
+
+        self._bin_span = None
+        if json_end + 8 <= len(buf):
+            bin_len, bin_type = struct.unpack_from("<II", buf, json_end)
+            if bin_type == CHUNK_BIN:
+                start = json_end + 8
+                self._bin_span = (start, min(start + bin_len, len(buf)))
+            else:
+                self.warnings.append(f"Second chunk is not BIN: 0x{bin_type:08X}")
+        elif json_end < len(buf):
+            self.warnings.append("Trailing bytes after JSON chunk but too small for BIN chunk header")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Release the mapping. Views still held by callers keep it alive."""
+        self._buf.release()
+        if self._mmap:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass  # Caller still holds a view; mapping closes when it is dropped
+
+    # ── Chunks ──
+
+    @cached_property
+    def json(self):
+        """Decoded JSON chunk (parsed once, then cached).
+
+        Raises:
+            ValueError: If the chunk is not valid UTF-8 JSON.
+        """
+        start, end = self._json_span
+        return json.loads(bytes(self._buf[start:end]).decode("utf-8"))
+
+    @property
+    def json_length(self):
+        return self._json_span[1] - self._json_span[0]
+
+    @property
+    def bin(self):
+        """BIN chunk as a memoryview (empty if the file has no BIN chunk)."""
+        if self._bin_span is None:
+            return self._buf[0:0]
+        start, end = self._bin_span
+        return self._buf[start:end]
+
+    # ── glTF objects ──
+
+    def buffer_view(self, index):
+        """Bytes of bufferViews[index] as a memoryview into the BIN chunk."""
+        bv = self.json["bufferViews"][index]
+        if bv.get("buffer", 0) != 0:
+            raise ValueError(f"bufferView {index} references an external buffer")
+        offset = bv.get("byteOffset", 0)
+        return self.bin[offset:offset + bv["byteLength"]]
+
+    def image(self, index):
+        """Embedded image bytes for images[index], or None for URI images.
+
+        Returns:
+            (memoryview, mime_type) or None.
+        """
+        images = self.json.get("images", [])
+        if index is None or not 0 <= index < len(images):
+            return None
+        img = images[index]
+        if img.get("bufferView") is None:
+            return None
+        return self.buffer_view(img["bufferView"]), img.get("mimeType")
+
+    def accessor(self, index):
+        """Data window of accessors[index].
+
+        Tightly packed accessors are returned as a flat memoryview cast to the
+        component type (count * components items). Interleaved accessors
+        (byteStride wider than one element) return the raw byte window starting
+        at the first element; the caller steps through it with the stride.
+        """
+        acc = self.json["accessors"][index]
+        fmt = _COMPONENT_FORMATS[acc["componentType"]]
+        components = _TYPE_COMPONENTS[acc["type"]]
+        elem_size = struct.calcsize(fmt) * components
+        view = self.buffer_view(acc["bufferView"])
+        stride = self.json["bufferViews"][acc["bufferView"]].get("byteStride") or elem_size
+        start = acc.get("byteOffset", 0)
+        count = acc["count"]
+        if stride == elem_size:
+            return view[start:start + count * elem_size].cast(fmt)
+        return view[start:start + (count - 1) * stride + elem_size]
+
+    # ── VRM helpers ──
+
+    def thumbnail(self):
+        """Embedded VRM thumbnail bytes (VRM 1.0 or 0.x), or None."""
+        ext = self.json.get("extensions", {})
+        vrmc = ext.get("VRMC_vrm")
+        if vrmc:
+            img_idx = vrmc.get("meta", {}).get("thumbnailImage")
+        else:
+            tex_idx = ext.get("VRM", {}).get("meta", {}).get("texture")
+            textures = self.json.get("textures", [])
+            if tex_idx is None or not 0 <= tex_idx < len(textures):
+                return None
+            img_idx = textures[tex_idx].get("source")
+        found = self.image(img_idx)
+        return found[0] if found else None
@@ -12,6 +12,32 @@ UNSIGNED_INT = 5125
 ARRAY_BUFFER = 34962
 ELEMENT_ARRAY_BUFFER = 34963
 
+# Vertex buffer layouts:
+#   "shared"      — one tightly packed bufferView per attribute; every primitive
+#                   references the full vertex range (default).
+#   "interleaved" — one ARRAY_BUFFER bufferView with byteStride; attributes are
+#                   byteOffset windows into each vertex record.
+#   "compact"     — interleaved, and vertices are reordered so each material's
+#                   vertices are contiguous; each primitive's accessors cover only
+#                   its own range (vertices shared between materials are duplicated).
+LAYOUTS = ("shared", "interleaved", "compact")
+
+# Interleaved vertex record (56 bytes, every field 4-byte aligned)
+_VERTEX_DTYPE = np.dtype([
+    ("POSITION", "<f4", 3),
+    ("NORMAL", "<f4", 3),
+    ("TEXCOORD_0", "<f4", 2),
+    ("JOINTS_0", "<u2", 4),
+    ("WEIGHTS_0", "<f4", 4),
+])
+_ATTRIBUTE_TYPES = {
+    "POSITION": (FLOAT, "VEC3"),
+    "NORMAL": (FLOAT, "VEC3"),
+    "TEXCOORD_0": (FLOAT, "VEC2"),
+    "JOINTS_0": (UNSIGNED_SHORT, "VEC4"),
+    "WEIGHTS_0": (FLOAT, "VEC4"),
+}
+
 
 def _pad4(buf, pad_byte=b"\x00"):
     """Pad bytearray to 4-byte alignment in-place."""
@@ -20,12 +46,19 @@ def _pad4(buf, pad_byte=b"\x00"):
         buf.extend(pad_byte * (4 - remainder))
 
 
-def build(pmx_data):
+def build(pmx_data, layout="shared"):
     """Build glTF 2.0 structure from normalized PMX data.
 
+    Args:
+        pmx_data: dict from pmx_reader.read().
+        layout: Vertex buffer layout, one of LAYOUTS (see above).
+
     Returns:
         dict: {"json": gltf_json_dict, "bin": binary_blob_bytes}
     """
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unknown vertex layout: {layout} (expected one of {LAYOUTS})")
+
     bones = pmx_data["bones"]
     positions = pmx_data["positions"]
     normals_arr = pmx_data["normals"]
@@ -88,24 +121,29 @@ def build(pmx_data):
     buffer_views = []
     accessors = []
 
-    def add_bv(data_bytes, target=None):
+    def add_bv(data_bytes, target=None, stride=None):
         offset = len(buf)
         buf.extend(data_bytes)
         _pad4(buf)
         bv = {"buffer": 0, "byteOffset": offset, "byteLength": len(data_bytes)}
+        if stride is not None:
+            bv["byteStride"] = stride
         if target is not None:
             bv["target"] = target
         idx = len(buffer_views)
         buffer_views.append(bv)
         return idx
 
-    def add_acc(bv_idx, comp_type, count, acc_type, min_v=None, max_v=None):
+    def add_acc(bv_idx, comp_type, count, acc_type, min_v=None, max_v=None,
+                byte_offset=0):
         acc = {
             "bufferView": bv_idx,
             "componentType": comp_type,
             "count": count,
             "type": acc_type,
         }
+        if byte_offset:
+            acc["byteOffset"] = byte_offset
         if min_v is not None:
             acc["min"] = min_v
         if max_v is not None:
@@ -114,23 +152,95 @@ def build(pmx_data):
         accessors.append(acc)
         return idx
 
-    # Vertex attributes (shared across all primitives)
-    pos_bv = add_bv(positions.tobytes(), ARRAY_BUFFER)
-    pos_min = positions.min(axis=0).tolist()
-    pos_max = positions.max(axis=0).tolist()
-    pos_acc = add_acc(pos_bv, FLOAT, num_verts, "VEC3", pos_min, pos_max)
-
-    norm_bv = add_bv(normals_arr.tobytes(), ARRAY_BUFFER)
-    norm_acc = add_acc(norm_bv, FLOAT, num_verts, "VEC3")
-
-    uv_bv = add_bv(uvs.tobytes(), ARRAY_BUFFER)
-    uv_acc = add_acc(uv_bv, FLOAT, num_verts, "VEC2")
-
-    joint_bv = add_bv(joint_indices.tobytes(), ARRAY_BUFFER)
-    joint_acc = add_acc(joint_bv, UNSIGNED_SHORT, num_verts, "VEC4")
+    # Split the index buffer into per-material ranges
+    mat_index_ranges = []
+    idx_offset = 0
+    for mat in materials:
+        count = mat["vertex_count"]
+        mat_index_ranges.append(all_indices[idx_offset:idx_offset + count])
+        idx_offset += count
 
-    weight_bv = add_bv(skin_weights.tobytes(), ARRAY_BUFFER)
-    weight_acc = add_acc(weight_bv, FLOAT, num_verts, "VEC4")
+    # Vertex attributes
+    # prim_vertices[p] = (first_vertex, vertex_count, global_vertex_ids or None,
+    #                     primitive-local indices)
+    prim_vertices = []
+    if layout == "shared":
+        pos_bv = add_bv(positions.tobytes(), ARRAY_BUFFER)
+        pos_min = positions.min(axis=0).tolist()
+        pos_max = positions.max(axis=0).tolist()
+        pos_acc = add_acc(pos_bv, FLOAT, num_verts, "VEC3", pos_min, pos_max)
+
+        norm_bv = add_bv(normals_arr.tobytes(), ARRAY_BUFFER)
+        norm_acc = add_acc(norm_bv, FLOAT, num_verts, "VEC3")
+
+        uv_bv = add_bv(uvs.tobytes(), ARRAY_BUFFER)
+        uv_acc = add_acc(uv_bv, FLOAT, num_verts, "VEC2")
+
+        joint_bv = add_bv(joint_indices.tobytes(), ARRAY_BUFFER)
+        joint_acc = add_acc(joint_bv, UNSIGNED_SHORT, num_verts, "VEC4")
+
+        weight_bv = add_bv(skin_weights.tobytes(), ARRAY_BUFFER)
+        weight_acc = add_acc(weight_bv, FLOAT, num_verts, "VEC4")
+
+        shared_attributes = {
+            "POSITION": pos_acc,
+            "NORMAL": norm_acc,
+            "TEXCOORD_0": uv_acc,
+            "JOINTS_0": joint_acc,
+            "WEIGHTS_0": weight_acc,
+        }
+        prim_attributes = [shared_attributes] * len(materials)
+    else:
+        if layout == "compact":
+            # Each material gets its own contiguous copy of the vertices it uses
+            order_parts = []
+            first = 0
+            for mat_indices in mat_index_ranges:
+                used, local = np.unique(mat_indices, return_inverse=True)
+                prim_vertices.append((first, len(used), used, local))
+                order_parts.append(used)
+                first += len(used)
+            order = (np.concatenate(order_parts) if order_parts
+                     else np.zeros(0, dtype=np.int64))
+        else:
+            order = None
+            prim_vertices = [(0, num_verts, None, mat_indices)
+                             for mat_indices in mat_index_ranges]
+
+        sources = {
+            "POSITION": positions,
+            "NORMAL": normals_arr,
+            "TEXCOORD_0": uvs,
+            "JOINTS_0": joint_indices,
+            "WEIGHTS_0": skin_weights,
+        }
+        records = np.empty(num_verts if order is None else len(order), dtype=_VERTEX_DTYPE)
+        for attr, src in sources.items():
+            records[attr] = src if order is None else src[order]
+
+        stride = _VERTEX_DTYPE.itemsize
+        vtx_bv = add_bv(records.tobytes(), ARRAY_BUFFER, stride=stride)
+
+        def add_vertex_accessors(first, count):
+            attrs = {}
+            for attr, (comp_type, acc_type) in _ATTRIBUTE_TYPES.items():
+                min_v = max_v = None
+                if attr == "POSITION" and count:
+                    window = records["POSITION"][first:first + count]
+                    min_v = window.min(axis=0).tolist()
+                    max_v = window.max(axis=0).tolist()
+                attrs[attr] = add_acc(
+                    vtx_bv, comp_type, count, acc_type, min_v, max_v,
+                    byte_offset=first * stride + _VERTEX_DTYPE.fields[attr][1],
+                )
+            return attrs
+
+        if layout == "compact":
+            prim_attributes = [add_vertex_accessors(first, count)
+                               for first, count, _, _ in prim_vertices]
+        else:
+            shared_attributes = add_vertex_accessors(0, num_verts)
+            prim_attributes = [shared_attributes] * len(materials)
 
     # Images & textures
     gltf_samplers = []
@@ -151,26 +261,18 @@ def build(pmx_data):
         gltf_textures.append({"sampler": 0, "source": len(gltf_images) - 1})
 
     # Per-material primitives & materials
-    idx_offset = 0
     primitives = []
     gltf_materials = []
 
-    for mat in materials:
-        count = mat["vertex_count"]
-        mat_indices = all_indices[idx_offset:idx_offset + count]
-        idx_offset += count
+    for mat_i, mat in enumerate(materials):
+        mat_indices = (prim_vertices[mat_i][3] if prim_vertices
+                       else mat_index_ranges[mat_i])
 
         idx_bv = add_bv(mat_indices.astype(np.uint32).tobytes(), ELEMENT_ARRAY_BUFFER)
         idx_acc = add_acc(idx_bv, UNSIGNED_INT, len(mat_indices), "SCALAR")
 
         primitives.append({
-            "attributes": {
-                "POSITION": pos_acc,
-                "NORMAL": norm_acc,
-                "TEXCOORD_0": uv_acc,
-                "JOINTS_0": joint_acc,
-                "WEIGHTS_0": weight_acc,
-            },
+            "attributes": dict(prim_attributes[mat_i]),
             "indices": idx_acc,
             "material": len(gltf_materials),
             "mode": 4,
@@ -219,7 +321,7 @@ def build(pmx_data):
     # base data = all-zero (no bufferView needed), non-zero entries stored sparsely.
     morphs = pmx_data.get("morphs", [])
     target_names = []
-    morph_acc_indices = []  # accessor index per morph (None = all-zero, skip)
+    morph_data = []  # (sorted vertex indices, offsets) per kept morph
 
     for morph in morphs:
         offsets = morph["offsets"]
@@ -246,14 +348,15 @@ def build(pmx_data):
         vis = vis[order]
         vals = vals[order]
 
-        idx_bv = add_bv(vis.tobytes())   # UNSIGNED_INT indices
-        val_bv = add_bv(vals.tobytes())  # FLOAT VEC3 values
-
-        acc = {
-            "componentType": FLOAT,
-            "count": num_verts,
-            "type": "VEC3",
-            "sparse": {
+        target_names.append(morph["name"])
+        morph_data.append((vis, vals))
+
+    def add_sparse_target(count, vis, vals):
+        acc = {"componentType": FLOAT, "count": count, "type": "VEC3"}
+        if len(vis):
+            idx_bv = add_bv(vis.tobytes())   # UNSIGNED_INT indices
+            val_bv = add_bv(vals.tobytes())  # FLOAT VEC3 values
+            acc["sparse"] = {
                 "count": int(len(vis)),
                 "indices": {
                     "bufferView": idx_bv,
@@ -262,16 +365,27 @@ def build(pmx_data):
                 "values": {
                     "bufferView": val_bv,
                 },
-            },
-        }
+            }
+        # No sparse entries: no bufferView either, so the target is all zeros
         acc_idx = len(accessors)
         accessors.append(acc)
-        target_names.append(morph["name"])
-        morph_acc_indices.append(acc_idx)
-
-    # Attach targets to every primitive (all share the same vertex buffer)
-    if morph_acc_indices:
-        morph_targets = [{"POSITION": ai} for ai in morph_acc_indices]
+        return acc_idx
+
+    if morph_data and layout == "compact":
+        # Every primitive has its own vertex range, so each gets its own targets
+        # with indices remapped to primitive-local space. glTF requires the same
+        # target count on every primitive, so untouched ranges get zero targets.
+        for prim, (_, count, used, _) in zip(primitives, prim_vertices):
+            targets = []
+            for vis, vals in morph_data:
+                inside = np.isin(vis, used)
+                local = np.searchsorted(used, vis[inside]).astype(np.uint32)
+                targets.append({"POSITION": add_sparse_target(count, local, vals[inside])})
+            prim["targets"] = targets
+    elif morph_data:
+        # Attach targets to every primitive (all share the same vertex buffer)
+        morph_targets = [{"POSITION": add_sparse_target(num_verts, vis, vals)}
+                         for vis, vals in morph_data]
         for prim in primitives:
             prim["targets"] = morph_targets
 
@@ -9,6 +9,7 @@ Usage:
     python -m python.intake ./models-folder
     python -m python.intake model.zip --output ./out
     python -m python.intake model.zip --scale 0.08 --no-spring --no-rename --no-validate
+    python -m python.intake --watch ./inbox --output ./out --jobs 4
 """
 
 import argparse
@@ -165,19 +166,17 @@ def _extract_with_encoding_fix(zf, dest_dir):
 
 
 def _scan_bones(pmx_bytes):
-    """Extract bone names from raw PMX bytes."""
+    """Extract bone names from raw PMX bytes (header-level parse, no vertex decode)."""
     from .pmx_reader import PmxReader
 
     try:
-        reader = PmxReader(pmx_bytes)
-        raw = reader.read()
-        return [b["name"] for b in raw["bones_raw"]]
+        return PmxReader(pmx_bytes).read_summary()["bone_names"]
     except Exception:
         return []
 
 
-def is_humanoid(pmx_bytes):
-    """Check if PMX binary contains a humanoid skeleton.
+def map_required_bones(bone_names):
+    """Classify a PMX bone-name list as humanoid or not.
 
     Returns:
         (bool, set): Whether all required bones are mapped, and the set of mapped bones.
@@ -188,10 +187,6 @@ def is_humanoid(pmx_bytes):
         VRM_REQUIRED_BONES,
     )
 
-    bone_names = _scan_bones(pmx_bytes)
-    if not bone_names:
-        return False, set()
-
     mapped = set()
     for name in bone_names:
         lookup = PMX_BONE_REPLACEMENTS.get(name, name)
@@ -203,6 +198,18 @@ def is_humanoid(pmx_bytes):
     return len(mapped) >= len(VRM_REQUIRED_BONES), mapped
 
 
+def is_humanoid(pmx_bytes):
+    """Check if PMX binary contains a humanoid skeleton.
+
+    Returns:
+        (bool, set): Whether all required bones are mapped, and the set of mapped bones.
+    """
+    bone_names = _scan_bones(pmx_bytes)
+    if not bone_names:
+        return False, set()
+    return map_required_bones(bone_names)
+
+
 # ── ZIP scanning ──
 
 def _scan_zipfile(zf):
@@ -252,13 +259,33 @@ def scan_zip(zip_path):
 
 # ── Folder scanning ──
 
-def scan_folder(folder_path):
+def scan_folder(folder_path, index=None):
     """Scan a folder recursively for .pmx files and classify as humanoid or not.
 
+    Args:
+        folder_path: Folder to scan.
+        index: Optional path to a scan_index SQLite database. When given, only
+            files whose size/mtime changed since the last run are parsed.
+
     Returns:
         List of dicts with keys: name, pmx_path, humanoid, mapped_bones, mapped_count.
     """
     folder_path = Path(folder_path)
+
+    if index is not None:
+        from .scan_index import ScanIndex
+
+        with ScanIndex(index) as idx:
+            idx.update(folder_path)
+            rows = idx.query(root=folder_path, include_errors=True)
+        return [{
+            "name": str(Path(row["path"]).relative_to(folder_path.resolve())),
+            "pmx_path": row["path"],
+            "humanoid": row["humanoid"],
+            "mapped_bones": set(row["mapped_bones"]),
+            "mapped_count": len(row["mapped_bones"]),
+        } for row in rows]
+
     results = []
 
     for pmx_file in sorted(folder_path.rglob("*.pmx")):
@@ -312,7 +339,7 @@ def extract_pmx_files(zip_path, scan_results, tmp_dir):
 
 def _convert_one(pmx_path, display_name, output_dir, output_paths, *,
                  scale, no_spring, no_rename, no_validate, name=None,
-                 preset="default"):
+                 preset="default", layout="shared"):
     """Convert a single PMX file to VRM. Returns the final output path."""
     from . import bone_mapping, gltf_builder
     from . import pmx_reader as pmx_mod
@@ -328,10 +355,10 @@ def _convert_one(pmx_path, display_name, output_dir, output_paths, *,
           f"Bones: {len(pmx_data['bones'])}, "
           f"Materials: {len(pmx_data['materials'])}")
 
-    gltf_data = gltf_builder.build(pmx_data)
+    gltf_data = gltf_builder.build(pmx_data, layout=layout)
     humanoid_bones = bone_mapping.map_bones(
         pmx_data["bones"],
-        pmx_data["skinned_bone_indices"],
+        pmx_data["skinned_bone_mask"],
     )
 
     if no_spring:
@@ -399,7 +426,7 @@ def _convert_one(pmx_path, display_name, output_dir, output_paths, *,
 
 def process(input_path, output_dir=None, scale=0.08,
             no_spring=False, no_rename=False, no_validate=False, name=None,
-            preset="default"):
+            preset="default", index=None, layout="shared"):
     """Process input: find humanoid PMX files, convert each to VRM.
 
     Auto-detects input type: single .pmx file, .zip archive, or folder.
@@ -412,6 +439,9 @@ def process(input_path, output_dir=None, scale=0.08,
         no_rename: Skip ASCII rename step.
         no_validate: Skip VRM validation step.
         name: Custom output VRM filename (without or with .vrm extension).
+        index: Optional scan_index database used when scanning a folder.
+        layout: Vertex buffer layout (gltf_builder.LAYOUTS): "shared",
+            "interleaved" or "compact".
 
     Returns:
         List of output VRM file paths.
@@ -440,12 +470,13 @@ def process(input_path, output_dir=None, scale=0.08,
         no_validate=no_validate,
         name=name,
         preset=preset,
+        layout=layout,
     )
 
     if is_pmx:
         return _process_single_pmx(input_path, output_dir, convert_kwargs)
     elif is_dir:
-        return _process_folder(input_path, output_dir, convert_kwargs)
+        return _process_folder(input_path, output_dir, convert_kwargs, index=index)
     else:
         return _process_zip(input_path, output_dir, convert_kwargs)
 
@@ -476,12 +507,12 @@ def _process_single_pmx(pmx_path, output_dir, convert_kwargs):
     return output_paths
 
 
-def _process_folder(folder_path, output_dir, convert_kwargs):
+def _process_folder(folder_path, output_dir, convert_kwargs, index=None):
     """Process a folder of PMX files."""
     from .bone_mapping import VRM_REQUIRED_BONES
 
     print(f"Scanning folder: {folder_path}")
-    results = scan_folder(str(folder_path))
+    results = scan_folder(str(folder_path), index=index)
 
     if not results:
         raise ValueError(f"No .pmx files found in {folder_path}")
@@ -555,7 +586,7 @@ def _process_zip(zip_path, output_dir, convert_kwargs):
 def main():
     parser = argparse.ArgumentParser(
         description="PMX -> VRM conversion (folder, ZIP, or single PMX input)")
-    parser.add_argument("input", help="Input .pmx file, .zip archive, or folder")
+    parser.add_argument("input", nargs="?", help="Input .pmx file, .zip archive, or folder")
     parser.add_argument("--output", "-o", help="Output directory (default: same as input)")
     parser.add_argument("--scale", type=float, default=0.08, help="Scale factor (default: 0.08)")
     parser.add_argument("--no-spring", action="store_true", help="Skip spring bones")
@@ -563,8 +594,40 @@ def main():
     parser.add_argument("--no-validate", action="store_true", help="Skip VRM validation")
     parser.add_argument("--name", help="Custom output VRM filename (e.g. MyCharacter)")
     parser.add_argument("--preset", default="default", help="Spring bone preset name (default: default)")
+    parser.add_argument("--layout", default="shared", choices=["shared", "interleaved", "compact"],
+                        help="Vertex buffer layout (default: shared)")
+    parser.add_argument("--index", metavar="DB",
+                        help="SQLite scan index for folder input (rescan changed files only)")
+    parser.add_argument("--watch", metavar="DIR",
+                        help="Watch DIR and convert .zip/.pmx/folders as they arrive")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="Parallel conversions in --watch mode (default: CPU count)")
     args = parser.parse_args()
 
+    if args.watch:
+        if args.input or args.name:
+            parser.error("--watch takes no input path or --name")
+        from .watcher import watch
+        try:
+            watch(
+                args.watch,
+                output_dir=args.output,
+                jobs=args.jobs,
+                scale=args.scale,
+                no_spring=args.no_spring,
+                no_rename=args.no_rename,
+                no_validate=args.no_validate,
+                preset=args.preset,
+                layout=args.layout,
+            )
+        except FileNotFoundError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    if args.input is None:
+        parser.error("input is required unless --watch is given")
+
     try:
         process(
             args.input,
@@ -575,6 +638,8 @@ def main():
             no_validate=args.no_validate,
             name=args.name,
             preset=args.preset,
+            index=args.index,
+            layout=args.layout,
         )
     except (FileNotFoundError, ValueError, RuntimeError) as e:
         print(f"Error: {e}", file=sys.stderr)
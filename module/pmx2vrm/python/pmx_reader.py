@@ -24,8 +24,18 @@ class _BinaryReader:
     """Low-level binary reader for PMX format."""
 
     def __init__(self, data: bytes):
+        self._data = data
         self._io = BytesIO(data)
 
+    def tell(self):
+        return self._io.tell()
+
+    def seek(self, pos):
+        self._io.seek(pos)
+
+    def skip(self, n):
+        self._io.seek(n, 1)
+
     def read_bytes(self, n):
         return self._io.read(n)
 
@@ -124,11 +134,9 @@ class PmxReader:
     def _read_rigidbody_index(self):
         return self._read_index(self._rigidbody_index_size)
 
-    def read(self):
-        """Parse complete PMX file. Returns dict with all model data."""
+    def _read_header(self):
+        """Read magic + globals and set the index sizes used by later sections."""
         r = self._r
-
-        # --- Header ---
         magic = r.read_bytes(4)
         assert magic == b"PMX ", f"Invalid PMX magic: {magic}"
         version = r.read_float()
@@ -143,6 +151,105 @@ class PmxReader:
         self._bone_index_size = globals_data[5]
         self._morph_index_size = globals_data[6]
         self._rigidbody_index_size = globals_data[7]
+        return version
+
+    def _skip_bone_tail(self, flag):
+        """Skip the flag-dependent part of a bone record after its flag field."""
+        r = self._r
+        bi = self._bone_index_size
+        r.skip(bi if flag & 0x0001 else 12)         # tail: bone index or offset
+        if flag & (0x0100 | 0x0200):                # external parent + ratio
+            r.skip(bi + 4)
+        if flag & 0x0400:                           # fixed axis
+            r.skip(12)
+        if flag & 0x0800:                           # local X + local Z
+            r.skip(24)
+        if flag & 0x2000:                           # external parent deform key
+            r.skip(4)
+        if flag & 0x0020:                           # IK
+            r.skip(bi + 8)                          # target, loop, limit_radian
+            for _ in range(r.read_int32()):
+                r.skip(bi)
+                if r.read_uint8():
+                    r.skip(24)                      # min, max
+
+    def read_summary(self):
+        """Parse only what scanning needs: counts, textures, materials, bone names.
+
+        Vertex and index payloads are stepped over by offset arithmetic instead of
+        being decoded, and parsing stops after the bone section — several times
+        faster than read() on large models.
+        """
+        r = self._r
+        self._read_header()
+        model_name = self._read_text()
+        self._read_text()
+        self._read_text()
+        self._read_text()
+
+        # --- Vertices (skip) ---
+        # Per vertex: pos+normal+uv (32) + extended UV (16 each) + deform type (1)
+        # + deform payload + edge factor (4). Payload size depends on deform type.
+        num_vertices = r.read_int32()
+        bi = self._bone_index_size
+        deform_sizes = (bi, 2 * bi + 4, 4 * bi + 16, 2 * bi + 4 + 36, 4 * bi + 16)
+        head = 32 + 16 * self._extended_uv
+        data = r._data
+        pos = r.tell()
+        for _ in range(num_vertices):
+            pos += head
+            deform_type = data[pos]
+            pos += 1 + (deform_sizes[deform_type] if deform_type < 5 else 0) + 4
+        r.seek(pos)
+
+        # --- Indices (skip) ---
+        num_indices = r.read_int32()
+        r.skip(num_indices * self._vertex_index_size)
+
+        # --- Textures ---
+        texture_paths = [self._read_text() for _ in range(r.read_int32())]
+
+        # --- Materials ---
+        ti = self._texture_index_size
+        materials = []
+        for _ in range(r.read_int32()):
+            mat_name = self._read_text()
+            self._read_text()
+            r.skip(16 + 12 + 4 + 12 + 1 + 16 + 4)  # diffuse..edge size
+            texture_index = self._read_texture_index()
+            r.skip(ti + 1)                          # sphere texture, sphere mode
+            toon_sharing_flag = r.read_uint8()
+            r.skip(ti if toon_sharing_flag == 0 else 1)
+            self._read_text()
+            materials.append({
+                "name": mat_name,
+                "texture_index": texture_index,
+                "vertex_count": r.read_int32(),
+            })
+
+        # --- Bones (names only) ---
+        bone_names = []
+        for _ in range(r.read_int32()):
+            bone_names.append(self._read_text())
+            self._read_text()
+            r.skip(12 + bi + 4)                     # position, parent, layer
+            self._skip_bone_tail(r.read_uint16())
+
+        return {
+            "model_name": model_name,
+            "vertices": num_vertices,
+            "faces": num_indices // 3,
+            "texture_paths": texture_paths,
+            "materials": materials,
+            "bone_names": bone_names,
+        }
+
+    def read(self):
+        """Parse complete PMX file. Returns dict with all model data."""
+        r = self._r
+
+        # --- Header ---
+        self._read_header()
 
         # --- Model info ---
         model_name = self._read_text()
@@ -468,53 +575,80 @@ class PmxReader:
         }
 
 
-def clean_weights(joint_indices, skin_weights, threshold=0.001):
+# Optimal 4-input sorting network: five compare-exchanges sort every row.
+_SORT4_NETWORK = ((0, 1), (2, 3), (0, 2), (1, 3), (1, 2))
+
+
+def clean_weights(joint_indices, skin_weights, threshold=0.001, copy=True):
     """Clean vertex weights: deduplicate, filter tiny, sort, normalize.
 
+    Works column-wise on the four influence slots, so every step is a handful
+    of whole-array ops with no fancy-indexed row copies. Sorting uses a 4-input
+    sorting network instead of a full argsort.
+
     Args:
         joint_indices: (N, 4) uint16 array of bone indices.
         skin_weights: (N, 4) float32 array of weights.
         threshold: Weights below this value are zeroed out.
+        copy: If False, clean the given arrays in place.
 
     Returns:
         Cleaned (joint_indices, skin_weights) tuple, both (N, 4).
     """
-    ji = joint_indices.copy()
-    sw = skin_weights.copy()
-    n = ji.shape[0]
+    ji = joint_indices.copy() if copy else joint_indices
+    sw = skin_weights.copy() if copy else skin_weights
+    jc = [ji[:, k] for k in range(4)]  # column views — writes go to ji / sw
+    wc = [sw[:, k] for k in range(4)]
 
     # 1. Deduplicate — merge weights for duplicate bone indices per vertex
     for slot in range(1, 4):
         for prev in range(slot):
-            dup = ji[:, slot] == ji[:, prev]
-            sw[dup, prev] += sw[dup, slot]
-            sw[dup, slot] = 0.0
-            ji[dup, slot] = 0
+            dup = jc[slot] == jc[prev]
+            np.add(wc[prev], wc[slot], out=wc[prev], where=dup)
+            np.putmask(wc[slot], dup, 0.0)
+            np.putmask(jc[slot], dup, 0)
 
     # 2. Threshold filter — zero out tiny weights
     tiny = sw < threshold
-    sw[tiny] = 0.0
-    ji[tiny] = 0
+    np.putmask(sw, tiny, 0.0)
+    np.putmask(ji, tiny, 0)
 
     # 3. Sort — descending by weight (strongest bone first)
-    order = np.argsort(-sw, axis=1)
-    rows = np.arange(n)[:, None]
-    ji = ji[rows, order]
-    sw = sw[rows, order]
+    for a, b in _SORT4_NETWORK:
+        swap = wc[a] < wc[b]
+        for cols in (wc, jc):
+            hi = np.where(swap, cols[b], cols[a])
+            np.copyto(cols[b], cols[a], where=swap)
+            cols[a][...] = hi
 
     # 4. Normalize — sum to 1.0
-    sums = sw.sum(axis=1, keepdims=True)
-    sums = np.where(sums == 0, 1.0, sums)
-    sw = sw / sums
+    sums = wc[0] + wc[1] + wc[2] + wc[3]
+    dead = sums == 0
+    sums[dead] = 1.0
+    sw /= sums[:, None]
 
     # 5. Fallback — vertices with all-zero weights bind to bone 0
-    dead = sw.sum(axis=1) == 0
-    ji[dead, 0] = 0
-    sw[dead, 0] = 1.0
+    np.putmask(jc[0], dead, 0)
+    np.putmask(wc[0], dead, 1.0)
 
     return ji, sw
 
 
+def skinned_bone_mask(joint_indices, skin_weights, num_bones):
+    """Boolean mask over bones: True where a bone drives at least one vertex.
+
+    Args:
+        joint_indices: (N, 4) cleaned bone indices.
+        skin_weights: (N, 4) cleaned weights.
+        num_bones: Bone count; the mask is at least this long.
+
+    Returns:
+        (max(num_bones, max_index + 1),) bool array.
+    """
+    counts = np.bincount(joint_indices[skin_weights > 0], minlength=num_bones)
+    return counts > 0
+
+
 # Encoding roundtrips to recover mojibake texture filenames.
 # Covers ZIPs where CJK filenames were stored with wrong encoding chain.
 _ENCODING_ROUNDTRIPS = [
@@ -587,13 +721,13 @@ def read(pmx_path, scale=0.08):
     joint_indices = raw["joint_indices_raw"]
     skin_weights = raw["skin_weights_raw"]
 
-    # Clean weights: deduplicate, filter tiny, normalize
-    joint_indices, skin_weights = clean_weights(joint_indices, skin_weights)
+    # Clean weights: deduplicate, filter tiny, normalize (in place — the raw
+    # arrays are not used afterwards)
+    joint_indices, skin_weights = clean_weights(joint_indices, skin_weights, copy=False)
 
     # Bones that actually drive vertices (normalized weight > 0)
     # Used by bone_mapping to choose between D-bone / standard bone pairs.
-    skinned_bone_mask = skin_weights > 0
-    skinned_bone_indices = set(joint_indices[skinned_bone_mask].tolist())
+    skinned_bones = skinned_bone_mask(joint_indices, skin_weights, len(raw["bones_raw"]))
 
     # Winding reversal: (a,b,c) -> (a,c,b)
     num_tris = len(raw["indices_raw"]) // 3
@@ -705,7 +839,7 @@ def read(pmx_path, scale=0.08):
         "indices": indices,
         "materials": materials,
         "bones": bones,
-        "skinned_bone_indices": skinned_bone_indices,  # set of bone indices with >0 weight
+        "skinned_bone_mask": skinned_bones,  # bool per bone: has >0 weight somewhere
         "textures": textures,
         "texture_mimes": texture_mimes,
         "morphs": morphs,
@@ -0,0 +1,292 @@
+"""Persistent PMX scan index — SQLite cache of per-file scan results.
+
+Large model libraries are rescanned incrementally: a file is only parsed again
+when its size or mtime changed (or, with content hashing on, when its bytes
+changed). Parsing uses PmxReader.read_summary(), which steps over vertex/index
+payloads instead of decoding them.
+
+Stored per file: bone names, humanoid classification, mapped required bones,
+vertex/face/material/bone counts, and texture references.
+
+Usage (CLI):
+    python -m python.scan_index ./library
+    python -m python.scan_index ./library --humanoid --min-vertices 100000
+    python -m python.scan_index ./library --db ./lib.sqlite --hash --jobs 8 --json
+
+Usage (API):
+    from scan_index import ScanIndex
+    with ScanIndex("lib.sqlite") as idx:
+        idx.update("./library")
+        rows = idx.query(humanoid=True, min_vertices=100_000)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+DEFAULT_DB_NAME = ".pmx_scan_index.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pmx (
+    path           TEXT PRIMARY KEY,
+    size           INTEGER NOT NULL,
+    mtime_ns       INTEGER NOT NULL,
+    sha1           TEXT,
+    model_name     TEXT,
+    vertex_count   INTEGER,
+    face_count     INTEGER,
+    material_count INTEGER,
+    bone_count     INTEGER,
+    humanoid       INTEGER,
+    mapped_bones   TEXT,
+    bone_names     TEXT,
+    textures       TEXT,
+    error          TEXT,
+    scanned_at     REAL
+);
+CREATE INDEX IF NOT EXISTS pmx_humanoid_vertices ON pmx (humanoid, vertex_count);
+"""
+
+_JSON_COLUMNS = ("mapped_bones", "bone_names", "textures")
+# Rows under a folder: case-sensitive, unlike LIKE (params: len(prefix), prefix)
+_PREFIX_MATCH = "substr(path, 1, ?) = ?"
+
+
+def _sha1_file(path, chunk_size=1 << 20):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _scan_file(path, hash_content):
+    """Parse one PMX into an index row dict. Runs in worker processes."""
+    from .intake import map_required_bones
+    from .pmx_reader import PmxReader
+
+    row = {"path": path, "scanned_at": time.time()}
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        if hash_content:
+            row["sha1"] = hashlib.sha1(data).hexdigest()
+        summary = PmxReader(data).read_summary()
+    except Exception as e:
+        row["error"] = f"{type(e).__name__}: {e}"
+        return row
+
+    humanoid, mapped = map_required_bones(summary["bone_names"])
+    row.update(
+        model_name=summary["model_name"],
+        vertex_count=summary["vertices"],
+        face_count=summary["faces"],
+        material_count=len(summary["materials"]),
+        bone_count=len(summary["bone_names"]),
+        humanoid=int(humanoid),
+        mapped_bones=json.dumps(sorted(mapped), ensure_ascii=False),
+        bone_names=json.dumps(summary["bone_names"], ensure_ascii=False),
+        textures=json.dumps(summary["texture_paths"], ensure_ascii=False),
+    )
+    return row
+
+
+class ScanIndex:
+    """SQLite-backed scan index. Usable as a context manager."""
+
+    def __init__(self, db_path):
+        self.db_path = str(db_path)
+        self._db = sqlite3.connect(self.db_path)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._db.close()
+
+    def update(self, folder, hash_content=False, jobs=None):
+        """Bring the index up to date with every .pmx under *folder*.
+
+        Args:
+            folder: Library root to walk recursively.
+            hash_content: Also key rows by SHA-1, so touched or copied files
+                whose bytes did not change are not parsed again.
+            jobs: Worker processes for parsing. Default: CPU count.
+
+        Returns:
+            dict with counts: total, scanned, unchanged, removed.
+        """
+        root = Path(folder).resolve()
+        prefix = str(root) + os.sep
+        known = {
+            row["path"]: row
+            for row in self._db.execute(
+                "SELECT path, size, mtime_ns, sha1 FROM pmx WHERE " + _PREFIX_MATCH,
+                (len(prefix), prefix),
+            )
+        }
+
+        stats = {"total": 0, "scanned": 0, "unchanged": 0, "removed": 0}
+        seen = set()
+        changed = []  # (path, size, mtime_ns)
+        for dirpath, _, files in os.walk(root):
+            for name in files:
+                if not name.lower().endswith(".pmx"):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                seen.add(path)
+                stats["total"] += 1
+                row = known.get(path)
+                if row and row["size"] == st.st_size and row["mtime_ns"] == st.st_mtime_ns:
+                    stats["unchanged"] += 1
+                    continue
+                if hash_content and row and row["sha1"] and row["size"] == st.st_size:
+                    if _sha1_file(path) == row["sha1"]:
+                        self._db.execute("UPDATE pmx SET mtime_ns = ? WHERE path = ?",
+                                         (st.st_mtime_ns, path))
+                        stats["unchanged"] += 1
+                        continue
+                changed.append((path, st.st_size, st.st_mtime_ns))
+
+        gone = [p for p in known if p not in seen]
+        self._db.executemany("DELETE FROM pmx WHERE path = ?", [(p,) for p in gone])
+        stats["removed"] = len(gone)
+
+        if changed:
+            paths = [c[0] for c in changed]
+            flags = [hash_content] * len(paths)
+            if len(paths) == 1:
+                rows = [_scan_file(paths[0], hash_content)]
+            else:
+                with ProcessPoolExecutor(max_workers=jobs) as pool:
+                    rows = list(pool.map(_scan_file, paths, flags, chunksize=16))
+            for (path, size, mtime_ns), row in zip(changed, rows):
+                row.update(size=size, mtime_ns=mtime_ns)
+                self._upsert(row)
+            stats["scanned"] = len(changed)
+
+        self._db.commit()
+        return stats
+
+    def _upsert(self, row):
+        columns = ("path", "size", "mtime_ns", "sha1", "model_name", "vertex_count",
+                   "face_count", "material_count", "bone_count", "humanoid",
+                   "mapped_bones", "bone_names", "textures", "error", "scanned_at")
+        self._db.execute(
+            f"INSERT OR REPLACE INTO pmx ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})",
+            [row.get(c) for c in columns],
+        )
+
+    def query(self, root=None, humanoid=None, min_vertices=None, max_vertices=None,
+              bone=None, include_errors=False):
+        """Return index rows matching all given filters, ordered by path.
+
+        Args:
+            root: Only files under this folder.
+            humanoid: True/False to filter on humanoid classification.
+            min_vertices / max_vertices: Inclusive vertex count bounds.
+            bone: Only models containing this PMX bone name.
+            include_errors: Also return rows for files that failed to parse.
+
+        Returns:
+            List of dicts; bone_names/mapped_bones/textures are decoded lists and
+            humanoid is a bool.
+        """
+        where, params = [], []
+        if root is not None:
+            prefix = str(Path(root).resolve()) + os.sep
+            where.append(_PREFIX_MATCH)
+            params.extend((len(prefix), prefix))
+        if humanoid is not None:
+            where.append("humanoid = ?")
+            params.append(int(humanoid))
+        if min_vertices is not None:
+            where.append("vertex_count >= ?")
+            params.append(min_vertices)
+        if max_vertices is not None:
+            where.append("vertex_count <= ?")
+            params.append(max_vertices)
+        if not include_errors:
+            where.append("error IS NULL")
+
+        sql = "SELECT * FROM pmx"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY path"
+
+        results = []
+        for row in self._db.execute(sql, params):
+            entry = dict(row)
+            for col in _JSON_COLUMNS:
+                entry[col] = json.loads(entry[col]) if entry[col] else []
+            entry["humanoid"] = bool(entry["humanoid"])
+            if bone is not None and bone not in entry["bone_names"]:
+                continue
+            results.append(entry)
+        return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Incremental PMX scan index (SQLite)")
+    parser.add_argument("folder", help="Model library root")
+    parser.add_argument("--db", help=f"Index file (default: <folder>/{DEFAULT_DB_NAME})")
+    parser.add_argument("--hash", action="store_true", help="Also compare content SHA-1")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Parser processes")
+    parser.add_argument("--humanoid", action="store_true", help="Only humanoid models")
+    parser.add_argument("--min-vertices", type=int, help="Minimum vertex count")
+    parser.add_argument("--max-vertices", type=int, help="Maximum vertex count")
+    parser.add_argument("--bone", help="Only models containing this PMX bone name")
+    parser.add_argument("--json", action="store_true", help="JSON output")
+    args = parser.parse_args(argv)
+
+    folder = Path(args.folder)
+    if not folder.is_dir():
+        print(f"Error: Folder not found: {folder}", file=sys.stderr)
+        sys.exit(1)
+    db_path = args.db or folder / DEFAULT_DB_NAME
+
+    with ScanIndex(db_path) as idx:
+        start = time.time()
+        stats = idx.update(folder, hash_content=args.hash, jobs=args.jobs)
+        rows = idx.query(
+            root=folder,
+            humanoid=True if args.humanoid else None,
+            min_vertices=args.min_vertices,
+            max_vertices=args.max_vertices,
+            bone=args.bone,
+        )
+
+    if args.json:
+        print(json.dumps(rows, ensure_ascii=False, indent=2))
+        return
+
+    print(f"Index: {db_path}")
+    print(f"  {stats['total']} .pmx, {stats['scanned']} scanned, "
+          f"{stats['unchanged']} unchanged, {stats['removed']} removed "
+          f"({time.time() - start:.2f}s)")
+    for row in rows:
+        tag = "humanoid" if row["humanoid"] else "SKIP"
+        print(f"  {row['path']} — {tag}, {row['vertex_count']} verts, "
+              f"{row['material_count']} mats, {len(row['textures'])} textures")
+    print(f"{len(rows)} match(es).")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,12 +15,16 @@ Usage (API):
 """
 
 import json
-import struct
 import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 
+try:
+    from .glb_reader import GlbFile, GlbFormatError
+except ImportError:  # Run as a standalone script
+    from glb_reader import GlbFile, GlbFormatError
+
 
 class Severity(Enum):
     ERROR = "ERROR"
@@ -76,10 +80,6 @@ _REQUIRED_BONES = {
     "rightUpperLeg", "rightLowerLeg", "rightFoot",
 }
 
-# GLB chunk type constants
-_CHUNK_JSON = 0x4E4F534A
-_CHUNK_BIN = 0x004E4942
-
 
 def validate(source, strict=False):
     """Validate a VRM 0.x file.
@@ -100,16 +100,13 @@ def validate(source, strict=False):
             result.valid = False
             result.issues.append(Issue(Severity.ERROR, 0, f"File not found: {path}"))
             return result
-        data = path.read_bytes()
-    elif isinstance(source, (bytes, bytearray)):
-        data = bytes(source)
-    else:
+    elif not isinstance(source, (bytes, bytearray)):
         result.valid = False
         result.issues.append(Issue(Severity.ERROR, 0, "source must be file path or bytes"))
         return result
 
     # Layer 1: GLB structure
-    gltf_json, ok = _layer1_glb(data, result)
+    gltf_json, ok = _layer1_glb(source, result)
     if not ok:
         return _finalize(result, strict)
 
@@ -153,73 +150,28 @@ def _finalize(result, strict):
 # Layer 1: GLB structure
 # ---------------------------------------------------------------------------
 
-def _layer1_glb(data, result):
-    """Parse GLB header and extract JSON chunk. Returns (gltf_json, ok)."""
-    if len(data) < 12:
-        result.issues.append(Issue(Severity.ERROR, 1, "File too small for GLB header (< 12 bytes)"))
-        return None, False
-
-    magic, version, total_length = struct.unpack_from("<III", data, 0)
-
-    if magic != 0x46546C67:
-        result.issues.append(Issue(
-            Severity.ERROR, 1,
-            f"Invalid GLB magic: 0x{magic:08X} (expected 0x46546C67 'glTF')",
-        ))
-        return None, False
-
-    if version != 2:
-        result.issues.append(Issue(
-            Severity.ERROR, 1,
-            f"Unsupported GLB version: {version} (expected 2)",
-        ))
-        return None, False
-
-    if total_length > len(data):
-        result.issues.append(Issue(
-            Severity.WARNING, 1,
-            f"GLB header declares {total_length} bytes but file is {len(data)} bytes",
-        ))
-
-    # Parse JSON chunk
-    if len(data) < 20:
-        result.issues.append(Issue(Severity.ERROR, 1, "File too small for JSON chunk header"))
-        return None, False
-
-    json_len, json_type = struct.unpack_from("<II", data, 12)
-
-    if json_type != _CHUNK_JSON:
-        result.issues.append(Issue(
-            Severity.ERROR, 1,
-            f"First chunk is not JSON: 0x{json_type:08X} (expected 0x{_CHUNK_JSON:08X})",
-        ))
-        return None, False
-
-    json_end = 20 + json_len
-    if json_end > len(data):
-        result.issues.append(Issue(Severity.ERROR, 1, "JSON chunk extends beyond file"))
-        return None, False
+def _layer1_glb(source, result):
+    """Parse GLB header and extract JSON chunk. Returns (gltf_json, ok).
 
+    Files are memory-mapped by GlbFile: only the header, JSON chunk and BIN
+    chunk header are ever touched, even for 100 MB+ files.
+    """
     try:
-        gltf_json = json.loads(data[20:json_end])
-    except json.JSONDecodeError as e:
-        result.issues.append(Issue(Severity.ERROR, 1, f"Malformed JSON chunk: {e}"))
+        glb = GlbFile(source)
+    except GlbFormatError as e:
+        for warning in e.warnings:
+            result.issues.append(Issue(Severity.WARNING, 1, warning))
+        result.issues.append(Issue(Severity.ERROR, 1, str(e)))
         return None, False
 
-    # Check BIN chunk presence
-    if json_end < len(data):
-        if json_end + 8 <= len(data):
-            bin_len, bin_type = struct.unpack_from("<II", data, json_end)
-            if bin_type != _CHUNK_BIN:
-                result.issues.append(Issue(
-                    Severity.WARNING, 1,
-                    f"Second chunk is not BIN: 0x{bin_type:08X}",
-                ))
-        else:
-            result.issues.append(Issue(
-                Severity.WARNING, 1,
-                "Trailing bytes after JSON chunk but too small for BIN chunk header",
-            ))
+    with glb:
+        for warning in glb.warnings:
+            result.issues.append(Issue(Severity.WARNING, 1, warning))
+        try:
+            gltf_json = glb.json
+        except ValueError as e:
+            result.issues.append(Issue(Severity.ERROR, 1, f"Malformed JSON chunk: {e}"))
+            return None, False
 
     result.issues.append(Issue(Severity.INFO, 1, "GLB structure valid"))
     return gltf_json, True
@@ -0,0 +1,299 @@
+"""Watch-folder ingestion — convert .zip / .pmx / folders as they land in an inbox.
+
+Top-level entries of the inbox are the unit of work. An entry is queued once its
+size/mtime signature has stayed unchanged for a settle time (same size-stable
+idea as creator_launcher's EXE wait), then converted on a process
+pool via intake.process(). Finished inputs are recorded in a JSON ledger inside
+the output directory so restarts skip anything already converted.
+
+On Linux an inotify descriptor wakes the loop as soon as the inbox changes;
+elsewhere (or if inotify is unavailable) the inbox is polled.
+
+Usage:
+    python -m python.intake --watch ./inbox
+    python -m python.intake --watch ./inbox --output ./converted --jobs 4
+"""
+
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import signal
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+LEDGER_NAME = ".intake_ledger.json"
+MAX_WORKER_CRASHES = 2  # requeues of an entry whose worker died before it is recorded as failed
+
+# inotify event mask: anything that creates, finishes, or moves an entry in.
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_INOTIFY_MASK = (_IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM
+                 | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE)
+
+
+# ── Change notification ──
+
+def _open_inotify(path):
+    """Return a non-blocking inotify fd watching *path*, or None if unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return None
+        if libc.inotify_add_watch(fd, os.fsencode(str(path)), _INOTIFY_MASK) < 0:
+            os.close(fd)
+            return None
+        return fd
+    except (OSError, AttributeError):
+        return None
+
+
+def _wait_for_change(fd, timeout):
+    """Block until the inbox changes (inotify) or *timeout* seconds pass."""
+    if fd is None:
+        time.sleep(timeout)
+        return
+    ready, _, _ = select.select([fd], [], [], timeout)
+    if ready:
+        # Events only serve as a wake-up; drain them and rescan the inbox.
+        try:
+            while os.read(fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+
+
+# ── Inbox scanning ──
+
+def _is_candidate(entry, output_dir):
+    """Check if an inbox entry is something intake can convert."""
+    if entry.name.startswith((".", "~")):
+        return False
+    if entry.is_dir():
+        return entry.resolve() != output_dir
+    return entry.suffix.lower() in (".zip", ".pmx")
+
+
+def _signature(entry):
+    """Return [size, mtime_ns, file_count] for a file or folder, or None if it vanished.
+
+    Folders aggregate every file below them, so a copy that is still filling a
+    subdirectory keeps changing the signature until it is done.
+    """
+    try:
+        if entry.is_file():
+            st = entry.stat()
+            return [st.st_size, st.st_mtime_ns, 1]
+        size = 0
+        mtime = entry.stat().st_mtime_ns
+        count = 0
+        for root, _, files in os.walk(entry):
+            for name in files:
+                st = os.stat(os.path.join(root, name))
+                size += st.st_size
+                mtime = max(mtime, st.st_mtime_ns)
+                count += 1
+        return [size, mtime, count]
+    except OSError:
+        return None
+
+
+# ── Ledger ──
+
+def _load_ledger(ledger_path):
+    """Load the ledger dict (entry name → record). Missing or corrupt → empty."""
+    try:
+        with open(ledger_path, "r", encoding="utf-8") as f:
+            ledger = json.load(f)
+        return ledger if isinstance(ledger, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_ledger(ledger_path, ledger):
+    """Write the ledger atomically (temp file + rename)."""
+    tmp_path = f"{ledger_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(ledger, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, ledger_path)
+
+
+def _record_finished(done, in_flight, ledger, ledger_path, crashes):
+    """Move finished futures from *in_flight* into the ledger and persist it.
+
+    Failures are recorded too, so a broken input is not retried until it
+    changes on disk. Entries whose worker process died (BrokenProcessPool) are
+    not recorded but returned for requeueing, up to MAX_WORKER_CRASHES times.
+
+    Returns:
+        List of (name, signature) to queue again on a fresh pool.
+    """
+    requeue = []
+    recorded = False
+    for future in done:
+        name, sig, started = in_flight.pop(future)
+        record = {"signature": sig, "finished": time.time()}
+        try:
+            outputs = future.result()
+            record.update(status="done", outputs=outputs)
+            print(f"[watch] {name}: {len(outputs)} model(s) in "
+                  f"{time.time() - started:.1f}s")
+        except BrokenProcessPool as e:
+            crashes[name] = crashes.get(name, 0) + 1
+            if crashes[name] <= MAX_WORKER_CRASHES:
+                print(f"[watch] {name}: worker process died, requeueing", file=sys.stderr)
+                requeue.append((name, sig))
+                continue
+            record.update(status="failed", error=f"worker process died: {e}")
+            print(f"[watch] {name}: FAILED — worker process died {crashes[name]} times",
+                  file=sys.stderr)
+        except Exception as e:
+            record.update(status="failed", error=str(e))
+            print(f"[watch] {name}: FAILED — {e}", file=sys.stderr)
+        crashes.pop(name, None)
+        ledger[name] = record
+        recorded = True
+    if recorded:
+        _save_ledger(ledger_path, ledger)
+    return requeue
+
+
+# ── Worker ──
+
+def _ignore_sigint():
+    """Pool initializer: Ctrl+C is handled by the watcher, not mid-conversion."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _new_pool(jobs):
+    return ProcessPoolExecutor(max_workers=jobs, initializer=_ignore_sigint)
+
+
+def _convert_entry(input_path, output_dir, convert_kwargs):
+    """Process-pool entry point: convert one inbox entry, return output paths."""
+    from .intake import process
+
+    return process(input_path, output_dir=output_dir, **convert_kwargs)
+
+
+# ── Public API ──
+
+def watch(watch_dir, output_dir=None, jobs=None, poll_interval=2.0,
+          settle_interval=1.0, settle_time=2.0, **convert_kwargs):
+    """Watch *watch_dir* and convert new or changed inputs until interrupted.
+
+    Args:
+        watch_dir: Inbox folder to watch (top-level .zip, .pmx and folders).
+        output_dir: Where VRMs and the ledger go. Default: <watch_dir>/converted.
+        jobs: Worker processes for conversion. Default: CPU count.
+        poll_interval: Rescan period when idle, in seconds.
+        settle_interval: Recheck period while an entry is still being written.
+        settle_time: Seconds a signature must stay unchanged before queueing.
+        **convert_kwargs: Forwarded to intake.process (scale, no_spring, ...).
+
+    Raises:
+        FileNotFoundError: If watch_dir is not an existing folder.
+    """
+    watch_dir = Path(watch_dir).resolve()
+    if not watch_dir.is_dir():
+        raise FileNotFoundError(f"Watch folder not found: {watch_dir}")
+
+    output_dir = Path(output_dir) if output_dir else watch_dir / "converted"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_dir = output_dir.resolve()
+
+    ledger_path = output_dir / LEDGER_NAME
+    ledger = _load_ledger(ledger_path)
+
+    fd = _open_inotify(watch_dir)
+    mode = "inotify" if fd is not None else f"polling every {poll_interval}s"
+    print(f"Watching: {watch_dir} ({mode})")
+    print(f"  Output: {output_dir}")
+    print(f"  Ledger: {len(ledger)} known input(s)")
+
+    pending = {}    # name -> (signature, unchanged_since)
+    in_flight = {}  # future -> (name, signature, started)
+    crashes = {}    # name -> times its worker process died
+
+    pool = _new_pool(jobs)
+    try:
+        try:
+            while True:
+                busy = pending or in_flight
+                _wait_for_change(fd, settle_interval if busy else poll_interval)
+
+                if in_flight:
+                    done, _ = wait(list(in_flight), timeout=0, return_when=FIRST_COMPLETED)
+                    requeue = _record_finished(done, in_flight, ledger, ledger_path, crashes)
+                    # A dead worker breaks the whole pool; every other in-flight
+                    # future fails the same way, so they are requeued too.
+                    for name, sig in requeue:
+                        pending[name] = (sig, 0.0)  # already settled: submit on this scan
+
+                # Scan inbox and debounce
+                busy_names = {name for name, _, _ in in_flight.values()}
+                seen = set()
+                for entry in sorted(watch_dir.iterdir()):
+                    if not _is_candidate(entry, output_dir):
+                        continue
+                    name = entry.name
+                    seen.add(name)
+                    if name in busy_names:
+                        continue
+                    sig = _signature(entry)
+                    if sig is None:
+                        continue
+                    known = ledger.get(name)
+                    if known and known.get("signature") == sig:
+                        continue  # Already converted (or failed) in this exact state
+
+                    # inotify can wake us many times a second, so stability is
+                    # measured in elapsed time rather than number of checks.
+                    now = time.time()
+                    prev_sig, since = pending.get(name, (None, now))
+                    if sig != prev_sig:
+                        pending[name] = (sig, now)
+                        continue
+                    if now - since < settle_time:
+                        continue
+
+                    pending.pop(name, None)
+                    print(f"[watch] queued: {name}")
+                    try:
+                        future = pool.submit(_convert_entry, str(entry), str(output_dir),
+                                             convert_kwargs)
+                    except BrokenProcessPool:
+                        print("[watch] worker pool broken — starting a new one", file=sys.stderr)
+                        pool.shutdown(wait=False)
+                        pool = _new_pool(jobs)
+                        future = pool.submit(_convert_entry, str(entry), str(output_dir),
+                                             convert_kwargs)
+                    in_flight[future] = (name, sig, time.time())
+
+                # Forget entries removed before they settled
+                for name in list(pending):
+                    if name not in seen:
+                        del pending[name]
+        except KeyboardInterrupt:
+            print("\nStopping watch — waiting for running conversions...")
+            for future in list(in_flight):
+                if future.cancel():
+                    del in_flight[future]
+            done, _ = wait(list(in_flight))
+            _record_finished(done, in_flight, ledger, ledger_path, crashes)
+        finally:
+            if fd is not None:
+                os.close(fd)
+    finally:
+        pool.shutdown(wait=True)
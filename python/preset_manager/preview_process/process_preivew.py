@@ -1,40 +1,167 @@
-from PIL import Image
+from PIL import Image, ImageDraw
+from PIL.PngImagePlugin import PngInfo
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import argparse
+import json
 import os
+import re
+import time
 
-def process_images(input_files, output_file):
-    img1 = Image.open(input_files[0])
-    img2 = Image.open(input_files[1])
-    img3 = Image.open(input_files[2])
+# Files named <group>_<n>.png are composited together, ordered by n
+DEFAULT_GROUP_PATTERN = r'^(?P<group>.+)_(?P<index>\d+)$'
 
-    width1, height1 = img1.size
-    width2, height2 = img2.size
-    width3, height3 = img3.size
+DEFAULT_LAYOUT = {
+    'columns': 3,
+    'gap': 12,
+    'background': '#aeaeae',
+    'labels': False,
+    'label_height': 24,
+    'label_color': '#202020',
+}
 
-    gap_width = 12
+def group_files(png_files, pattern=DEFAULT_GROUP_PATTERN):
+    """
+    Group file names by the pattern's 'group' match; files that do not match form their own group.
 
-    result_img = Image.new('RGB', (width1 + width2 + width3 + 2 * gap_width, max(height1, height2, height3)), color='#aeaeae')
+    Returns:
+        dict: {group_name: [file names ordered by the 'index' match]}
+    """
+    regex = re.compile(pattern)
+    groups = {}
+    for name in png_files:
+        stem = os.path.splitext(name)[0]
+        match = regex.match(stem)
+        if match:
+            key = match.group('group')
+            order = int(match.group('index')) if 'index' in regex.groupindex else 0
+        else:
+            key, order = stem, 0
+        groups.setdefault(key, []).append((order, name))
+    return {key: [name for _, name in sorted(items)] for key, items in groups.items()}
 
-    result_img.paste(img1, (0, 0))
-    result_img.paste(img2, (width1 + gap_width, 0))
-    result_img.paste(img3, (width1 + width2 + 2 * gap_width, 0))
+def process_images(input_files, output_file, layout=DEFAULT_LAYOUT):
+    """
+    Composite input_files into a grid of layout['columns'] columns.
 
-    result_img.save(output_file)
+    Each column is as wide as its widest image and each row as tall as its
+    tallest; images are placed top-left in their cell. With labels, the file
+    name is drawn in a band under every image. The layout is stored in the PNG
+    so later runs can tell whether the output matches the current spec.
+    """
+    images = [Image.open(path) for path in input_files]
+    columns = max(1, min(layout['columns'], len(images)))
+    rows = (len(images) + columns - 1) // columns
+    gap = layout['gap']
+    label_height = layout['label_height'] if layout['labels'] else 0
 
-input_directory = 'input/'  
-output_directory = 'output/'
+    col_widths = [0] * columns
+    row_heights = [0] * rows
+    for i, img in enumerate(images):
+        row, col = divmod(i, columns)
+        col_widths[col] = max(col_widths[col], img.size[0])
+        row_heights[row] = max(row_heights[row], img.size[1] + label_height)
 
-# Create the input and output directories if they do not exist
-os.makedirs(input_directory, exist_ok=True)
-os.makedirs(output_directory, exist_ok=True)
+    width = sum(col_widths) + gap * (columns - 1)
+    height = sum(row_heights) + gap * (rows - 1)
+    result_img = Image.new('RGB', (width, height), color=layout['background'])
+    draw = ImageDraw.Draw(result_img) if label_height else None
 
-png_files = sorted([f for f in os.listdir(input_directory) if f.endswith('.png')])
+    for i, (img, path) in enumerate(zip(images, input_files)):
+        row, col = divmod(i, columns)
+        x = sum(col_widths[:col]) + gap * col
+        y = sum(row_heights[:row]) + gap * row
+        result_img.paste(img, (x, y))
+        if draw:
+            label = os.path.splitext(os.path.basename(path))[0]
+            draw.text((x + 4, y + img.size[1] + 4), label, fill=layout['label_color'])
+        img.close()
 
-for i in range(0, len(png_files), 3):
-    input_files = [os.path.join(input_directory, png_files[i+j]) for j in range(3)]
+    info = PngInfo()
+    info.add_text('preview_layout', _layout_signature(input_files, layout))
+    result_img.save(output_file, pnginfo=info)
+    return output_file
 
-    output_file_name = f'{os.path.splitext(png_files[i])[0].replace("_1", "")}_All.png'
-    output_file = os.path.join(output_directory, output_file_name)
+def _layout_signature(input_files, layout):
+    return json.dumps({'inputs': [os.path.basename(p) for p in input_files], 'layout': layout}, sort_keys=True)
 
-    print(f'Processing {output_file_name}')
+def is_up_to_date(input_files, output_file, layout):
+    """True if output_file is newer than every input and was built from the same files and layout."""
+    try:
+        out_mtime = os.path.getmtime(output_file)
+        if any(os.path.getmtime(path) > out_mtime for path in input_files):
+            return False
+        with Image.open(output_file) as existing:
+            # tEXt chunks come before the image data, so this does not decode pixels
+            return existing.info.get('preview_layout') == _layout_signature(input_files, layout)
+    except OSError:
+        return False
 
-    process_images(input_files, output_file)
\ No newline at end of file
+def process_directory(input_directory, output_directory, layout=DEFAULT_LAYOUT, pattern=DEFAULT_GROUP_PATTERN,
+                      jobs=None, force=False):
+    """
+    Composite every group of PNGs in input_directory into <group>_All.png in output_directory.
+
+    Groups are composited in parallel worker processes; outputs that are already
+    up to date are skipped.
+
+    Returns:
+        int: number of previews written
+    """
+    os.makedirs(output_directory, exist_ok=True)
+    png_files = sorted([f for f in os.listdir(input_directory) if f.endswith('.png')])
+    groups = group_files(png_files, pattern)
+
+    work = []
+    skipped = 0
+    for group, names in groups.items():
+        input_files = [os.path.join(input_directory, name) for name in names]
+        output_file = os.path.join(output_directory, f'{group}_All.png')
+        if not force and is_up_to_date(input_files, output_file, layout):
+            skipped += 1
+            continue
+        work.append((input_files, output_file))
+
+    print(f'{len(groups)} group(s) from {len(png_files)} file(s): {len(work)} to composite, {skipped} up to date')
+    start = time.perf_counter()
+    written = 0
+    if work:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {pool.submit(process_images, input_files, output_file, layout): output_file
+                       for input_files, output_file in work}
+            for future in as_completed(futures):
+                name = os.path.basename(futures[future])
+                try:
+                    future.result()
+                    written += 1
+                    print(f'Processed {name}')
+                except Exception as e:
+                    print(f'Failed {name}: {e}')
+    print(f'Done: {written} preview(s) in {time.perf_counter() - start:.1f}s')
+    return written
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Composite preset preview images side by side')
+    parser.add_argument('--input', default='input/', help='Input folder (default: input/)')
+    parser.add_argument('--output', default='output/', help='Output folder (default: output/)')
+    parser.add_argument('--layout', help='JSON file with layout keys: ' + ', '.join(DEFAULT_LAYOUT))
+    parser.add_argument('--columns', type=int, help=f"Images per row (default: {DEFAULT_LAYOUT['columns']})")
+    parser.add_argument('--gap', type=int, help=f"Gap in pixels (default: {DEFAULT_LAYOUT['gap']})")
+    parser.add_argument('--background', help=f"Background color (default: {DEFAULT_LAYOUT['background']})")
+    parser.add_argument('--labels', action='store_true', default=None, help='Draw file names under images')
+    parser.add_argument('--pattern', default=DEFAULT_GROUP_PATTERN,
+                        help='Regex on file stems with (?P<group>...) and optional (?P<index>\\d+)')
+    parser.add_argument('--jobs', '-j', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='Rebuild previews even if up to date')
+    args = parser.parse_args()
+
+    layout = dict(DEFAULT_LAYOUT)
+    if args.layout:
+        with open(args.layout, 'r', encoding='utf-8') as f:
+            layout.update(json.load(f))
+    for key in ('columns', 'gap', 'background', 'labels'):
+        if getattr(args, key) is not None:
+            layout[key] = getattr(args, key)
+
+    # Create the input and output directories if they do not exist
+    os.makedirs(args.input, exist_ok=True)
+    process_directory(args.input, args.output, layout=layout, pattern=args.pattern, jobs=args.jobs, force=args.force)
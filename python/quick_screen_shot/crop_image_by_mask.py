@@ -1,6 +1,10 @@
+import argparse
 import os
 import sys
 import glob
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 try:
     from PIL import Image
@@ -44,10 +48,7 @@ def crop_image(image_path, output_path, crop_props=CROP_PROPORTIONS):
         width, height = img.size
 
         # Calculate pixel coordinates from proportions
-        left = int(width * crop_props['left'])
-        top = int(height * crop_props['top'])
-        right = int(width * crop_props['right'])
-        bottom = int(height * crop_props['bottom'])
+        left, top, right, bottom = _crop_box(width, height, crop_props)
 
         crop_width = right - left
         crop_height = bottom - top
@@ -75,17 +76,87 @@ def crop_image(image_path, output_path, crop_props=CROP_PROPORTIONS):
         print(f"✗ ERROR: {os.path.basename(image_path)} - {e}")
         return None
 
-def process_folder(input_folder, output_folder, pattern="*.png"):
+def load_crop_presets(preset_path):
+    """
+    Load named crop regions written by detect_mask_proportions.py.
+
+    Accepts the preset file format ({"regions": {name: proportions}}) or a bare
+    {name: proportions} mapping.
+
+    Returns:
+        dict: {name: {'left', 'top', 'right', 'bottom'}}
+    """
+    with open(preset_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    regions = data.get("regions", data)
+
+    presets = {}
+    for name, props in regions.items():
+        missing = [k for k in ('left', 'top', 'right', 'bottom') if k not in props]
+        if missing:
+            raise ValueError(f"Preset '{name}' is missing {', '.join(missing)}")
+        presets[name] = {k: float(props[k]) for k in ('left', 'top', 'right', 'bottom')}
+    if not presets:
+        raise ValueError(f"No crop regions in {preset_path}")
+    return presets
+
+
+def _crop_box(width, height, crop_props):
+    """Pixel crop box (left, top, right, bottom) for proportional crop_props."""
+    return (int(width * crop_props['left']), int(height * crop_props['top']),
+            int(width * crop_props['right']), int(height * crop_props['bottom']))
+
+
+def _is_up_to_date(output_path, input_mtime):
+    try:
+        return os.path.getmtime(output_path) >= input_mtime
+    except OSError:
+        return False
+
+
+def _crop_file(input_path, targets, save_options):
+    """
+    Worker: decode one screenshot once and save a crop for every (output_path, crop_props).
+
+    Returns:
+        tuple: (input_path, megapixels decoded, outputs written, error message or None)
+    """
+    try:
+        with Image.open(input_path) as img:
+            img.load()  # Decode once; every preset crops from the same pixels
+            width, height = img.size
+            for output_path, crop_props in targets:
+                os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+                img.crop(_crop_box(width, height, crop_props)).save(output_path, **save_options)
+        return input_path, width * height / 1e6, len(targets), None
+    except Exception as e:
+        return input_path, 0.0, 0, str(e)
+
+
+def process_folder(input_folder, output_folder, pattern="*.png", presets=None,
+                   jobs=None, image_format="png", compress_level=6, webp_quality=90,
+                   force=False):
     """
     Process all images from input folder and save cropped versions to output folder.
 
+    Images are cropped in parallel worker processes. Each image is decoded once
+    and cropped for every preset; outputs newer than their input are skipped.
+
     Args:
         input_folder (str): Folder containing original screenshots
         output_folder (str): Folder to save cropped screenshots
         pattern (str): File pattern to match (default: *.png)
+        presets (dict): Named crop regions from load_crop_presets(). With more than
+                        one region, each is saved to output_folder/<name>/.
+                        Default: CROP_PROPORTIONS only
+        jobs (int): Worker processes (default: CPU count)
+        image_format (str): "png" or "webp"
+        compress_level (int): PNG zlib level 0-9 (lower is faster, larger files)
+        webp_quality (int): WebP quality 1-100, or 100 for lossless
+        force (bool): Re-crop even if outputs are up to date
 
     Returns:
-        int: Number of images successfully processed
+        int: Number of images successfully processed (including up-to-date skips)
     """
     # Validate input folder
     if not os.path.exists(input_folder):
@@ -99,66 +170,138 @@ def process_folder(input_folder, output_folder, pattern="*.png"):
 
     # Find all images matching pattern
     search_path = os.path.join(input_folder, pattern)
-    files = glob.glob(search_path)
+    files = sorted(glob.glob(search_path))
 
     if not files:
         print(f"No files found matching: {search_path}")
         return 0
 
-    print(f"\nFound {len(files)} files to process")
+    if presets is None:
+        presets = {"default": CROP_PROPORTIONS}
+
+    if image_format == "webp":
+        ext = ".webp"
+        if webp_quality >= 100:
+            save_options = {"format": "WEBP", "lossless": True}
+        else:
+            save_options = {"format": "WEBP", "quality": webp_quality}
+    else:
+        ext = ".png"
+        save_options = {"format": "PNG", "compress_level": compress_level}
+
+    # Build work list; skip images whose outputs are all newer than the input
+    work = []
+    skipped = 0
+    for input_path in files:
+        filename = os.path.splitext(os.path.basename(input_path))[0] + ext
+        targets = []
+        for name, crop_props in presets.items():
+            if len(presets) == 1:
+                targets.append((os.path.join(output_folder, filename), crop_props))
+            else:
+                targets.append((os.path.join(output_folder, name, filename), crop_props))
+        input_mtime = os.path.getmtime(input_path)
+        if not force and all(_is_up_to_date(out, input_mtime) for out, _ in targets):
+            skipped += 1
+            continue
+        work.append((input_path, targets))
+
+    print(f"\nFound {len(files)} files ({len(work)} to crop, {skipped} up to date)")
     print(f"Input:  {input_folder}")
     print(f"Output: {output_folder}")
+    print(f"Presets: {', '.join(presets)} | Format: {image_format}")
     print("-" * 60)
 
-    # Process each file
-    success_count = 0
-    for input_path in files:
-        filename = os.path.basename(input_path)
-        output_path = os.path.join(output_folder, filename)
-
-        if crop_image(input_path, output_path):
-            success_count += 1
+    start = time.perf_counter()
+    megapixels = 0.0
+    outputs = 0
+    failures = []
+    if work:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(_crop_file, path, targets, save_options)
+                       for path, targets in work]
+            for future in as_completed(futures):
+                input_path, mp, written, error = future.result()
+                if error:
+                    failures.append((input_path, error))
+                    print(f"✗ ERROR: {os.path.basename(input_path)} - {error}")
+                megapixels += mp
+                outputs += written
+    elapsed = time.perf_counter() - start
+
+    success_count = len(files) - len(failures)
+    cropped = len(work) - len(failures)
+    rate = cropped / elapsed if elapsed > 0 else 0.0
 
     print("-" * 60)
-    print(f"\n✓ Complete! Processed {success_count}/{len(files)} images")
+    print(f"\n✓ Complete! Processed {success_count}/{len(files)} images "
+          f"({cropped} cropped, {skipped} skipped, {len(failures)} failed)")
+    if cropped:
+        print(f"  {outputs} outputs in {elapsed:.1f}s — {rate:.1f} images/s, "
+              f"{megapixels / elapsed:.0f} MP/s decoded")
     print(f"Cropped images saved to: {output_folder}")
 
     return success_count
 
 # Command-line usage
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Screenshot Cropper - Batch Image Processing",
+        epilog='Examples:\n'
+               '  python crop_image_by_mask.py "E:/Screenshots"\n'
+               '  python crop_image_by_mask.py "E:/Screenshots" "E:/Cropped"\n'
+               '  python crop_image_by_mask.py "E:/Screenshots" --presets MaskImage_presets.json',
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input_folder", nargs="?",
+                        help=f"Screenshots folder (default: {INPUT_FOLDER})")
+    parser.add_argument("output_folder", nargs="?",
+                        help="Output folder (default: <input_folder>/cropped)")
+    parser.add_argument("--presets",
+                        help="Crop preset JSON from detect_mask_proportions.py (default: CROP_PROPORTIONS)")
+    parser.add_argument("--pattern", default="*.png", help="File pattern (default: *.png)")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--format", choices=("png", "webp"), default="png",
+                        help="Output format (default: png)")
+    parser.add_argument("--compress-level", type=int, default=6, choices=range(10),
+                        metavar="0-9", help="PNG compression level, 1 is much faster (default: 6)")
+    parser.add_argument("--webp-quality", type=int, default=90,
+                        help="WebP quality 1-100, 100 = lossless (default: 90)")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-crop even if outputs are newer than inputs")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Screenshot Cropper - Batch Image Processing")
     print("=" * 60)
 
-    # Default: use configured INPUT_FOLDER and OUTPUT_FOLDER
-    if len(sys.argv) == 1:
+    if args.input_folder is None:
         # No arguments - use default folders
         input_folder = INPUT_FOLDER
         output_folder = OUTPUT_FOLDER
         print(f"Using default folders from configuration:")
-
-    elif len(sys.argv) == 2:
-        # One argument - use as input folder, create "output" subfolder
-        input_folder = sys.argv[1]
+    elif args.output_folder is None:
+        # One argument - use as input folder, create "cropped" subfolder
+        input_folder = args.input_folder
         output_folder = os.path.join(input_folder, "cropped")
         print(f"Input folder specified:")
-
-    elif len(sys.argv) >= 3:
+    else:
         # Two arguments - input and output folders
-        input_folder = sys.argv[1]
-        output_folder = sys.argv[2]
+        input_folder = args.input_folder
+        output_folder = args.output_folder
         print(f"Input and output folders specified:")
 
-    else:
-        print("\nUsage:")
-        print("  Default folders:  python crop_image_by_mask.py")
-        print("  Input folder:     python crop_image_by_mask.py <input_folder>")
-        print("  Custom output:    python crop_image_by_mask.py <input_folder> <output_folder>")
-        print("\nExamples:")
-        print('  python crop_image_by_mask.py "E:/Screenshots"')
-        print('  python crop_image_by_mask.py "E:/Screenshots" "E:/Cropped"')
-        sys.exit(1)
+    presets = None
+    if args.presets:
+        try:
+            presets = load_crop_presets(args.presets)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: Could not load presets: {e}")
+            sys.exit(1)
+        print(f"Presets: {', '.join(presets)}")
 
     # Process the folder
-    process_folder(input_folder, output_folder)
+    process_folder(input_folder, output_folder, pattern=args.pattern, presets=presets,
+                   jobs=args.jobs, image_format=args.format,
+                   compress_level=args.compress_level, webp_quality=args.webp_quality,
+                   force=args.force)
@@ -1,39 +1,62 @@
-from PIL import Image
+import argparse
+import json
+import os
 import sys
 
+import numpy as np
+from PIL import Image
+
+# Red pixels have high R value and low G, B values
+RED_MIN_R = 200
+RED_MAX_GB = 100
+
+
+def red_mask(img):
+    """
+    Classify every pixel as red / not red in one array op.
+
+    Returns:
+        (height, width) bool array
+    """
+    rgb = np.asarray(img.convert("RGB"))
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    return (r > RED_MIN_R) & (g < RED_MAX_GB) & (b < RED_MAX_GB)
+
+
+def _to_proportions(box, width, height):
+    """Pixel box (min_x, min_y, max_x, max_y), inclusive → crop proportions."""
+    min_x, min_y, max_x, max_y = box
+    return {
+        'left': min_x / width,
+        'top': min_y / height,
+        'right': (max_x + 1) / width,  # +1 to include the last pixel
+        'bottom': (max_y + 1) / height
+    }
+
+
 def detect_red_box(image_path):
     """
     Detect the exact boundaries of the red box in the mask image.
     """
     img = Image.open(image_path)
     width, height = img.size
-    pixels = img.load()
-
-    # Find the red box boundaries
-    # Red pixels have high R value and low G, B values
-    min_x, min_y = width, height
-    max_x, max_y = 0, 0
+    red = red_mask(img)
 
-    for y in range(height):
-        for x in range(width):
-            r, g, b = pixels[x, y][:3]  # Get RGB, ignore alpha if present
+    # Bounds from row / column reductions instead of visiting each pixel
+    rows = np.flatnonzero(red.any(axis=1))
+    cols = np.flatnonzero(red.any(axis=0))
 
-            # Check if pixel is red (R > 200, G < 100, B < 100)
-            if r > 200 and g < 100 and b < 100:
-                min_x = min(min_x, x)
-                min_y = min(min_y, y)
-                max_x = max(max_x, x)
-                max_y = max(max_y, y)
-
-    if min_x == width or min_y == height:
+    if rows.size == 0:
         print("ERROR: No red box found in image!")
         return None
 
+    min_x, max_x = int(cols[0]), int(cols[-1])
+    min_y, max_y = int(rows[0]), int(rows[-1])
+
     # Calculate proportions
-    left_prop = min_x / width
-    top_prop = min_y / height
-    right_prop = (max_x + 1) / width  # +1 to include the last pixel
-    bottom_prop = (max_y + 1) / height
+    props = _to_proportions((min_x, min_y, max_x, max_y), width, height)
+    left_prop, top_prop = props['left'], props['top']
+    right_prop, bottom_prop = props['right'], props['bottom']
 
     print(f"Red box detected in: {image_path}")
     print(f"Image size: {width}x{height}")
@@ -50,19 +73,133 @@ def detect_red_box(image_path):
     print(f"    'bottom': {bottom_prop:.4f}")
     print(f"}}")
 
-    return {
-        'left': left_prop,
-        'top': top_prop,
-        'right': right_prop,
-        'bottom': bottom_prop
+    return props
+
+
+def _label_runs(red):
+    """
+    8-connected components over horizontal runs of red pixels.
+
+    Each row is split into runs with one vectorized diff; only runs (not pixels)
+    go through the union-find, so a 4K mask with a few boxes is a few thousand
+    Python steps.
+
+    Returns:
+        list of (min_x, min_y, max_x, max_y, pixel_count), inclusive bounds
+    """
+    height, width = red.shape
+    padded = np.zeros((height, width + 2), dtype=np.int8)
+    padded[:, 1:-1] = red
+    edges = np.diff(padded, axis=1)
+    run_y, run_start = np.nonzero(edges == 1)
+    _, run_end = np.nonzero(edges == -1)  # exclusive; nonzero is row-major so pairs line up
+
+    parent = list(range(len(run_y)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # Runs of one row are contiguous in the arrays; remember each row's slice
+    row_bounds = np.searchsorted(run_y, np.arange(height + 1))
+    for y in range(1, height):
+        a0, a1 = row_bounds[y - 1], row_bounds[y]  # previous row
+        b0, b1 = row_bounds[y], row_bounds[y + 1]  # this row
+        i, j = a0, b0
+        while i < a1 and j < b1:
+            # 8-connectivity: touching diagonally counts (±1 column)
+            if run_start[i] <= run_end[j] and run_start[j] <= run_end[i]:
+                ri, rj = find(i), find(j)
+                if ri != rj:
+                    parent[rj] = ri
+            if run_end[i] < run_end[j]:
+                i += 1
+            else:
+                j += 1
+
+    boxes = {}
+    for k in range(len(run_y)):
+        root = find(k)
+        x0, x1, y = int(run_start[k]), int(run_end[k]) - 1, int(run_y[k])
+        if root in boxes:
+            bx0, by0, bx1, by1, count = boxes[root]
+            boxes[root] = (min(bx0, x0), min(by0, y), max(bx1, x1), max(by1, y),
+                           count + x1 - x0 + 1)
+        else:
+            boxes[root] = (x0, y, x1, y, x1 - x0 + 1)
+    return list(boxes.values())
+
+
+def detect_red_regions(image_path, min_area=64):
+    """
+    Detect every separate red box (e.g. one per shot framing) in the mask image.
+
+    Args:
+        image_path (str): Mask image path
+        min_area (int): Components with fewer red pixels are ignored as noise
+
+    Returns:
+        dict: {"region_1": {'left', 'top', 'right', 'bottom'}, ...} ordered
+              top-to-bottom, then left-to-right; empty if none found
+    """
+    img = Image.open(image_path)
+    width, height = img.size
+    components = [c for c in _label_runs(red_mask(img)) if c[4] >= min_area]
+    components.sort(key=lambda c: (c[1], c[0]))
+
+    regions = {}
+    print(f"Red regions detected in: {image_path}")
+    print(f"Image size: {width}x{height}")
+    for i, (min_x, min_y, max_x, max_y, count) in enumerate(components, start=1):
+        name = f"region_{i}"
+        regions[name] = _to_proportions((min_x, min_y, max_x, max_y), width, height)
+        print(f"  {name}: ({min_x}, {min_y}) - ({max_x}, {max_y}), "
+              f"{max_x - min_x + 1}x{max_y - min_y + 1}px")
+
+    if not regions:
+        print("ERROR: No red box found in image!")
+    return regions
+
+
+def write_presets(regions, image_path, output_path):
+    """
+    Save crop regions as a preset file that crop_image_by_mask.py loads with --presets.
+    """
+    width, height = Image.open(image_path).size
+    data = {
+        "source": os.path.basename(image_path),
+        "size": [width, height],
+        "regions": regions,
     }
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    print(f"\nPresets saved to: {output_path}")
+
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python detect_mask_proportions.py <mask_image.png>")
-        print("\nExample:")
-        print('  python detect_mask_proportions.py "D:/vs/anju/python/quick_screen_shot/input/MaskImage.png"')
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Detect red crop box(es) in a mask image",
+        epilog='Example: python detect_mask_proportions.py "input/MaskImage.png" --regions')
+    parser.add_argument("mask", help="Mask image (red box on any background)")
+    parser.add_argument("--regions", action="store_true",
+                        help="Find every separate red box instead of one overall box")
+    parser.add_argument("--min-area", type=int, default=64,
+                        help="Ignore red blobs smaller than this many pixels (default: 64)")
+    parser.add_argument("--output", "-o",
+                        help="Preset JSON path (default with --regions: <mask>_presets.json)")
+    args = parser.parse_args()
+
+    if args.regions:
+        regions = detect_red_regions(args.mask, min_area=args.min_area)
+        output = args.output or os.path.splitext(args.mask)[0] + "_presets.json"
+    else:
+        box = detect_red_box(args.mask)
+        regions = {"default": box} if box else {}
+        output = args.output
 
-    mask_path = sys.argv[1]
-    detect_red_box(mask_path)
+    if not regions:
+        sys.exit(1)
+    if output:
+        write_presets(regions, args.mask, output)
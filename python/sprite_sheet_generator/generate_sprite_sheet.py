@@ -1,7 +1,16 @@
 import os
-from PIL import Image
+import csv
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from PIL import Image, ImageChops
+from PIL.PngImagePlugin import PngInfo
 import argparse
 
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.webp')
+MANIFEST_NAME = ".sprite_manifest.json"
+TILE_CACHE_DIR = ".tile_cache"
+
 def calculate_sheet_size(frame_size, max_sheet_size=(1024, 1024)):
 	frame_width, frame_height = frame_size
 	max_width, max_height = max_sheet_size
@@ -14,75 +23,419 @@ def calculate_sheet_size(frame_size, max_sheet_size=(1024, 1024)):
 
 	return (sheet_width, sheet_height)
 
-def generate_sprite_sheet(folder_path, output_filename, frame_size=(260, 145), fps_reduction=2, max_sheet_size=(1024, 1024)):
+def list_frames(folder_path, fps_reduction=1):
+	"""Sorted frame file names in folder_path after fps_reduction. Raises FileNotFoundError."""
+	files = sorted(f for f in os.listdir(folder_path) if f.lower().endswith(IMAGE_EXTENSIONS))
+	return files[::fps_reduction]
+
+def load_frame(image_path, frame_size, trim=False):
+	"""
+	Center-crop an image to the frame aspect ratio and resize to frame_size.
+
+	With trim, fully transparent borders are cut off afterwards.
+
+	Returns:
+		(image, (offset_x, offset_y)) - offset of the trimmed image inside the frame.
+		image is None if trim left nothing (fully transparent frame).
+	"""
+	img = Image.open(image_path)
+	img_width, img_height = img.size
+	target_width, target_height = frame_size
+	target_ratio = target_width / target_height
+	img_ratio = img_width / img_height
+
+	if img_ratio > target_ratio:
+		# Image is wider, crop width
+		new_width = int(img_height * target_ratio)
+		left = (img_width - new_width) // 2
+		crop_box = (left, 0, left + new_width, img_height)
+	else:
+		# Image is taller, crop height
+		new_height = int(img_width / target_ratio)
+		top = (img_height - new_height) // 2
+		crop_box = (0, top, img_width, top + new_height)
+
+	img = img.crop(crop_box).resize(frame_size, Image.LANCZOS)
+
+	if trim and img.mode in ('RGBA', 'LA'):
+		bbox = img.getchannel('A').getbbox()
+		if bbox is None:
+			return None, (0, 0)
+		img = img.crop(bbox)
+		return img, (bbox[0], bbox[1])
+	return img, (0, 0)
+
+def tile_key(image_path, frame_size, trim):
+	"""Cache key of one resized frame: source path + size/mtime + resize settings."""
+	st = os.stat(image_path)
+	raw = f"{os.path.abspath(image_path)}|{st.st_size}|{st.st_mtime_ns}|{frame_size[0]}x{frame_size[1]}|{int(trim)}"
+	return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+
+def _load_cached_frame(image_path, frame_size, trim, cache_dir):
+	"""load_frame through the tile cache: reuse <cache_dir>/<key>.png or create it."""
+	tile_path = os.path.join(cache_dir, tile_key(image_path, frame_size, trim) + ".png")
+	if os.path.exists(tile_path):
+		with Image.open(tile_path) as tile:
+			tile.load()
+			meta = tile.text
+			if meta.get("sprite_empty") == "1":
+				return None, (0, 0)
+			offset = tuple(int(v) for v in meta.get("sprite_offset", "0,0").split(","))
+			return tile.copy(), offset
+
+	img, offset = load_frame(image_path, frame_size, trim)
+	info = PngInfo()
+	info.add_text("sprite_offset", f"{offset[0]},{offset[1]}")
+	if img is None:
+		info.add_text("sprite_empty", "1")
+	tmp_path = f"{tile_path}.{os.getpid()}.tmp"
+	(img or Image.new('LA', (1, 1))).save(tmp_path, format='PNG', pnginfo=info, compress_level=1)
+	os.replace(tmp_path, tile_path)
+	return img, offset
+
+def _load_frame_task(task):
+	"""Worker entry: load_frame (through the tile cache if given) plus a content hash for duplicate detection."""
+	image_path, frame_size, trim, cache_dir = task
+	if cache_dir:
+		img, offset = _load_cached_frame(image_path, frame_size, trim, cache_dir)
+	else:
+		img, offset = load_frame(image_path, frame_size, trim)
+	digest = None
+	if img is not None:
+		digest = hashlib.blake2b(img.tobytes(), digest_size=16).hexdigest()
+		digest = f"{img.mode}:{img.size[0]}x{img.size[1]}@{offset[0]},{offset[1]}:{digest}"
+	return img, offset, digest
+
+def _is_near_duplicate(a, b, tolerance):
+	"""True if a and b have the same size/mode and no channel differs by more than tolerance."""
+	if a.size != b.size or a.mode != b.mode:
+		return False
+	extrema = ImageChops.difference(a, b).getextrema()
+	if isinstance(extrema[0], int):
+		extrema = (extrema,)
+	return all(high <= tolerance for _, high in extrema)
+
+def find_duplicates(loaded, mode='exact', tolerance=2):
+	"""
+	Map each frame to the earlier frame it repeats, for consecutive runs only.
+
+	Args:
+		loaded: list of (image, offset, digest) from _load_frame_task
+		mode: 'exact' (same hash) or 'near' (max channel difference <= tolerance)
+
+	Returns:
+		list where entry i is the index of the kept frame i duplicates, or None
+	"""
+	duplicate_of = [None] * len(loaded)
+	kept = None
+	for i, (img, offset, digest) in enumerate(loaded):
+		if kept is not None:
+			kept_img, kept_offset, kept_digest = loaded[kept]
+			if digest == kept_digest:
+				duplicate_of[i] = kept
+				continue
+			if mode == 'near' and img is not None and kept_img is not None \
+					and offset == kept_offset and _is_near_duplicate(img, kept_img, tolerance):
+				duplicate_of[i] = kept
+				continue
+		kept = i
+	return duplicate_of
+
+class MaxRectsBin:
+	"""
+	MaxRects bin packer (no rotation).
+
+	Keeps the list of maximal free rectangles; each placement splits every free
+	rectangle it overlaps and prunes the ones contained in another.
+
+	A position is scored by the used extent it would grow the bin to (longer
+	side, then area), then best short side fit, then bottom-left. Growing the
+	extent as little as possible keeps the packed frames in a compact, roughly
+	square corner, so cropping the sheet to its used extent actually saves space.
+	"""
+
+	def __init__(self, width, height):
+		self.width = width
+		self.height = height
+		self.free = [(0, 0, width, height)]
+		self.used_width = 0
+		self.used_height = 0
+
+	def insert(self, width, height):
+		"""Place a width x height rect. Returns (x, y) or None if it does not fit."""
+		best = None
+		best_score = None
+		for fx, fy, fw, fh in self.free:
+			if width <= fw and height <= fh:
+				leftover_w = fw - width
+				leftover_h = fh - height
+				grown_w = max(self.used_width, fx + width)
+				grown_h = max(self.used_height, fy + height)
+				score = (max(grown_w, grown_h), grown_w * grown_h, min(leftover_w, leftover_h), fy, fx)
+				if best_score is None or score < best_score:
+					best, best_score = (fx, fy), score
+		if best is None:
+			return None
+
+		x, y = best
+		self._split(x, y, width, height)
+		self.used_width = max(self.used_width, x + width)
+		self.used_height = max(self.used_height, y + height)
+		return best
+
+	def _split(self, x, y, width, height):
+		new_free = []
+		for fx, fy, fw, fh in self.free:
+			if x >= fx + fw or x + width <= fx or y >= fy + fh or y + height <= fy:
+				new_free.append((fx, fy, fw, fh))
+				continue
+			if x > fx:
+				new_free.append((fx, fy, x - fx, fh))
+			if x + width < fx + fw:
+				new_free.append((x + width, fy, fx + fw - x - width, fh))
+			if y > fy:
+				new_free.append((fx, fy, fw, y - fy))
+			if y + height < fy + fh:
+				new_free.append((fx, y + height, fw, fy + fh - y - height))
+
+		# Drop free rects fully contained in another
+		pruned = []
+		for i, a in enumerate(new_free):
+			contained = False
+			for j, b in enumerate(new_free):
+				if i != j and a[0] >= b[0] and a[1] >= b[1] \
+						and a[0] + a[2] <= b[0] + b[2] and a[1] + a[3] <= b[1] + b[3] \
+						and (a != b or i > j):
+					contained = True
+					break
+			if not contained:
+				pruned.append(a)
+		self.free = pruned
+
+def pack_grid(sizes, frame_size, max_sheet_size, padding=0):
+	"""
+	Uniform grid placement, spilling to further sheets when one is full.
+
+	Returns:
+		(placements, sheet_sizes) - placements[i] is (sheet, x, y)
+	"""
+	cell_w = frame_size[0] + padding
+	cell_h = frame_size[1] + padding
+	cols = max(1, (max_sheet_size[0] + padding) // cell_w)
+	rows = max(1, (max_sheet_size[1] + padding) // cell_h)
+	per_sheet = cols * rows
+
+	placements = []
+	for i in range(len(sizes)):
+		sheet, slot = divmod(i, per_sheet)
+		placements.append((sheet, (slot % cols) * cell_w, (slot // cols) * cell_h))
+
+	sheet_count = (len(sizes) + per_sheet - 1) // per_sheet
+	sheet_size = (cols * cell_w - padding, rows * cell_h - padding)
+	return placements, [sheet_size] * sheet_count
+
+def pack_maxrects(sizes, max_sheet_size, padding=0):
+	"""
+	Pack (w, h) sizes into as many max_sheet_size bins as needed, tallest first.
+	Sheets are cropped to their used extent.
+
+	Returns:
+		(placements, sheet_sizes) - placements[i] is (sheet, x, y), or None for empty sizes
+	"""
+	order = sorted((i for i, (w, h) in enumerate(sizes) if w and h),
+				   key=lambda i: (sizes[i][1], sizes[i][0]), reverse=True)
+	bins = []
+	placements = [None] * len(sizes)
+	for i in order:
+		w, h = sizes[i]
+		if w > max_sheet_size[0] or h > max_sheet_size[1]:
+			raise ValueError(f"Frame {w}x{h} is larger than the sheet {max_sheet_size[0]}x{max_sheet_size[1]}")
+		for sheet, packer in enumerate(bins):
+			pos = packer.insert(w + padding, h + padding)
+			if pos:
+				break
+		else:
+			# Padding is only needed between frames, so a new bin gets it on the far edge too
+			packer = MaxRectsBin(max_sheet_size[0] + padding, max_sheet_size[1] + padding)
+			bins.append(packer)
+			sheet = len(bins) - 1
+			pos = packer.insert(w + padding, h + padding)
+		placements[i] = (sheet, pos[0], pos[1])
+
+	sheet_sizes = [(max(1, b.used_width - padding), max(1, b.used_height - padding)) for b in bins]
+	return placements, sheet_sizes
+
+def sheet_filenames(output_filename, sheet_count):
+	"""name.png for a single sheet, name_0.png, name_1.png, ... for several."""
+	if sheet_count <= 1:
+		return [output_filename]
+	base, ext = os.path.splitext(output_filename)
+	return [f"{base}_{i}{ext}" for i in range(sheet_count)]
+
+def write_frame_table(table_base, frames, sheet_files, frame_size, table_format='json'):
+	"""Write the frame table as <table_base>.json and/or .csv."""
+	if table_format in ('json', 'both'):
+		data = {
+			"frame_size": list(frame_size),
+			"sheets": [os.path.basename(p) for p in sheet_files],
+			"frames": frames,
+		}
+		with open(table_base + ".json", 'w', encoding='utf-8') as f:
+			json.dump(data, f, indent=2)
+	if table_format in ('csv', 'both'):
+		columns = ["index", "file", "sheet", "x", "y", "w", "h", "offset_x", "offset_y", "source_w", "source_h", "duplicate_of"]
+		with open(table_base + ".csv", 'w', encoding='utf-8', newline='') as f:
+			writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
+			writer.writeheader()
+			writer.writerows(frames)
+
+def generate_sprite_sheet(folder_path, output_filename, frame_size=(260, 145), fps_reduction=2, max_sheet_size=(1024, 1024),
+						  packing='grid', trim=False, padding=0, table_format=None, dedupe=None, dedupe_tolerance=2,
+						  pool=None, cache_dir=None):
+	"""
+	Build sprite sheet(s) from every frame in folder_path.
+
+	Frames that do not fit one sheet spill into output_name_0.png, _1.png, ...
+	With packing='maxrects' (optionally with trim), frames are packed tightly
+	and a frame table is required to find them; it is written next to the
+	sheets as <output_name>.json/.csv (sheet index, rect, trim offset, source size).
+
+	With dedupe ('exact' or 'near'), a frame that repeats the previous kept frame
+	is not stored again; its table entry points at the same rect and records
+	duplicate_of. Frames are decoded and resized on pool (an Executor) if given.
+	With cache_dir, resized frames are reused from / stored in that tile cache.
+
+	Returns:
+		list of written file paths (sheets and frame tables; no sheets if every frame
+		was empty or a duplicate), or False on failure
+	"""
 	try:
-		png_files = [f for f in os.listdir(folder_path) if f.lower().endswith(('.png', '.jpg', '.webp'))]
+		png_files = list_frames(folder_path, fps_reduction)
 	except FileNotFoundError:
 		print(f"Error: Folder '{folder_path}' not found")
 		return False
-	png_files.sort()
 
 	if not png_files:
 		print(f"No PNG/JPG files found in {folder_path}")
 		return False
 
-	png_files = png_files[::fps_reduction]
-	sheet_size = calculate_sheet_size(frame_size, max_sheet_size)
+	if (packing == 'maxrects' or dedupe) and table_format is None:
+		table_format = 'json'
 
-	cols = sheet_size[0] // frame_size[0]
-	rows = sheet_size[1] // frame_size[1]
-	max_frames = cols * rows
+	if cache_dir:
+		os.makedirs(cache_dir, exist_ok=True)
+	tasks = [(os.path.join(folder_path, f), frame_size, trim and packing == 'maxrects', cache_dir) for f in png_files]
+	if pool is not None:
+		loaded = list(pool.map(_load_frame_task, tasks, chunksize=8))
+	else:
+		loaded = [_load_frame_task(task) for task in tasks]
 
-	total_frames = min(len(png_files), max_frames)
-	png_files = png_files[:total_frames]
+	duplicate_of = find_duplicates(loaded, dedupe, dedupe_tolerance) if dedupe else [None] * len(loaded)
+	# Duplicates get no space of their own
+	sizes = [img.size if img and dup is None else (0, 0) for (img, _, _), dup in zip(loaded, duplicate_of)]
+	if packing == 'grid':
+		unique = [i for i, dup in enumerate(duplicate_of) if dup is None]
+		grid_placements, sheet_sizes = pack_grid([sizes[i] for i in unique], frame_size, max_sheet_size, padding)
+		placements = [None] * len(sizes)
+		for i, placement in zip(unique, grid_placements):
+			placements[i] = placement
+	else:
+		placements, sheet_sizes = pack_maxrects(sizes, max_sheet_size, padding)
 
-	sprite_sheet = Image.new('RGBA', sheet_size, (0, 0, 0, 0))
+	sheets = [Image.new('RGBA', size, (0, 0, 0, 0)) for size in sheet_sizes]
+	frames = []
+	for i, (png_file, (img, offset, _), placement) in enumerate(zip(png_files, loaded, placements)):
+		entry = {
+			"index": i, "file": png_file,
+			"sheet": None, "x": 0, "y": 0, "w": 0, "h": 0,
+			"offset_x": offset[0], "offset_y": offset[1],
+			"source_w": frame_size[0], "source_h": frame_size[1],
+			"duplicate_of": duplicate_of[i],
+		}
+		if duplicate_of[i] is not None:
+			kept = frames[duplicate_of[i]]
+			entry.update({k: kept[k] for k in ("sheet", "x", "y", "w", "h")})
+		elif img is not None and placement is not None:
+			sheet, x, y = placement
+			sheets[sheet].paste(img, (x, y), img if img.mode == 'RGBA' else None)
+			entry.update(sheet=sheet, x=x, y=y, w=img.size[0], h=img.size[1])
+		frames.append(entry)
 
-	for i, png_file in enumerate(png_files):
-		img = Image.open(os.path.join(folder_path, png_file))        
-		img_width, img_height = img.size
-		target_width, target_height = frame_size
-		target_ratio = target_width / target_height
-		img_ratio = img_width / img_height
+	os.makedirs(os.path.dirname(output_filename), exist_ok=True)
+	# Nothing to save when every frame was empty or a duplicate
+	sheet_files = sheet_filenames(output_filename, len(sheets)) if sheets else []
+	for sheet_image, sheet_file in zip(sheets, sheet_files):
+		sheet_image.save(sheet_file)
 
-		if img_ratio > target_ratio:
-			# Image is wider, crop width
-			new_width = int(img_height * target_ratio)
-			left = (img_width - new_width) // 2
-			crop_box = (left, 0, left + new_width, img_height)
-		else:
-			# Image is taller, crop height
-			new_height = int(img_width / target_ratio)
-			top = (img_height - new_height) // 2
-			crop_box = (0, top, img_width, top + new_height)
+	written = list(sheet_files)
+	if table_format:
+		table_base = os.path.splitext(output_filename)[0]
+		write_frame_table(table_base, frames, sheet_files, frame_size, table_format)
+		if table_format in ('json', 'both'):
+			written.append(table_base + ".json")
+		if table_format in ('csv', 'both'):
+			written.append(table_base + ".csv")
 
-		img = img.crop(crop_box).resize(frame_size, Image.LANCZOS)
+	total_pixels = sum(w * h for w, h in sheet_sizes)
+	duplicates = sum(dup is not None for dup in duplicate_of)
+	dedupe_note = f", {duplicates} duplicates referenced" if dedupe else ""
+	print(f"Generated {len(sheets)} sprite sheet(s): {output_filename if sheets else '-'} with {len(png_files)} frames "
+		  f"({packing}, {total_pixels * 4 / (1024 * 1024):.1f} MB RGBA{dedupe_note})")
+	return written
 
-		row = i // cols
-		col = i % cols
-		x = col * frame_size[0]
-		y = row * frame_size[1]
+def _load_manifest(manifest_path):
+	"""Folder name -> {params, inputs, outputs, tiles}. Missing or corrupt -> empty."""
+	try:
+		with open(manifest_path, 'r', encoding='utf-8') as f:
+			manifest = json.load(f)
+		return manifest if isinstance(manifest, dict) else {}
+	except (OSError, ValueError):
+		return {}
 
-		sprite_sheet.paste(img, (x, y), img if img.mode == 'RGBA' else None)
+def _save_manifest(manifest_path, manifest):
+	tmp_path = manifest_path + ".tmp"
+	with open(tmp_path, 'w', encoding='utf-8') as f:
+		json.dump(manifest, f, indent=2)
+	os.replace(tmp_path, manifest_path)
 
-	os.makedirs(os.path.dirname(output_filename), exist_ok=True)
-	sprite_sheet.save(output_filename)
-	print(f"Generated sprite sheet: {output_filename} with {total_frames} frames (sheet size: {sheet_size})")
-	return True
+def _input_state(input_folder, files):
+	"""{file: [size, mtime_ns]} for the frames of one folder."""
+	state = {}
+	for f in files:
+		st = os.stat(os.path.join(input_folder, f))
+		state[f] = [st.st_size, st.st_mtime_ns]
+	return state
+
+def main(frame_size = (80, 80), fps_reduction = 1, use_png_subfolder = True, packing = 'grid', trim = False,
+		 padding = 0, table_format = None, max_sheet_size = (1024, 1024), dedupe = None, dedupe_tolerance = 2,
+		 jobs = None, force = False, use_cache = True):
+	"""
+	Build sheets for every folder in input/.
 
-def main(frame_size = (80, 80), fps_reduction = 1, use_png_subfolder = True):
+	A manifest in output/ records each folder's frame files (size/mtime) and the
+	generation settings; folders where neither changed are skipped. Resized frames
+	are kept in output/.tile_cache so a rebuild only re-resizes changed frames.
+	force rebuilds every folder; use_cache=False also bypasses the tile cache.
+	"""
 	script_dir = os.path.dirname(os.path.abspath(__file__))
 	base_dir = os.path.join(script_dir, "input")
 	output_dir = os.path.join(script_dir, "output")
-
-	frame_size = frame_size
-	fps_reduction = fps_reduction
-	use_png_subfolder = use_png_subfolder
+	manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+	cache_dir = os.path.join(output_dir, TILE_CACHE_DIR) if use_cache else None
 
 	os.makedirs(output_dir, exist_ok=True)
+	manifest = _load_manifest(manifest_path)
+
+	params = {
+		"frame_size": list(frame_size), "fps_reduction": fps_reduction, "packing": packing, "trim": trim,
+		"padding": padding, "table_format": table_format, "max_sheet_size": list(max_sheet_size),
+		"dedupe": dedupe, "dedupe_tolerance": dedupe_tolerance,
+	}
+	tile_trim = trim and packing == 'maxrects'
 
 	folders = [f for f in os.listdir(base_dir) if os.path.isdir(os.path.join(base_dir, f))]
 
+	jobs_to_run = []
 	for folder in folders:
 		input_folder = os.path.join(base_dir, folder)
 		if use_png_subfolder:
@@ -93,23 +446,70 @@ def main(frame_size = (80, 80), fps_reduction = 1, use_png_subfolder = True):
 			else:
 				print(f"Skipping {folder}: Folder not found.")
 			continue
-		img_files = [f for f in os.listdir(input_folder) if f.lower().endswith(('.png', '.jpg'))]
 
-		sheet_size = calculate_sheet_size(frame_size)
-		max_cols = sheet_size[0] // frame_size[0]
-		max_rows = sheet_size[1] // frame_size[1]
-		max_frames = max_cols * max_rows
-		frame_count = min(len(img_files), max_frames)
+		frame_files = list_frames(input_folder, fps_reduction)
+		inputs = _input_state(input_folder, frame_files)
+		previous = manifest.get(folder)
+		if not force and previous and previous.get("params") == params and previous.get("inputs") == inputs \
+				and all(os.path.exists(os.path.join(output_dir, o)) for o in previous.get("outputs", [])):
+			print(f"Up to date: {folder}")
+			continue
+
+		output_file = os.path.join(output_dir, f"{folder}_{len(frame_files)}.png")
+		jobs_to_run.append((folder, input_folder, output_file, frame_files, inputs))
+
+	# One process pool decodes/resizes frames for every folder; folder threads
+	# pack and save concurrently while other folders' frames are still loading.
+	if jobs_to_run:
+		with ProcessPoolExecutor(max_workers=jobs) as pool, \
+				ThreadPoolExecutor(max_workers=max(1, min(4, len(jobs_to_run)))) as folder_pool:
+			futures = []
+			for folder, input_folder, output_file, frame_files, inputs in jobs_to_run:
+				print(f"Processing {folder}...")
+				futures.append(folder_pool.submit(
+					generate_sprite_sheet,
+					folder_path=input_folder,
+					output_filename=output_file,
+					frame_size=frame_size,
+					fps_reduction=fps_reduction,
+					max_sheet_size=max_sheet_size,
+					packing=packing,
+					trim=trim,
+					padding=padding,
+					table_format=table_format,
+					dedupe=dedupe,
+					dedupe_tolerance=dedupe_tolerance,
+					pool=pool,
+					cache_dir=cache_dir
+				))
+			for (folder, input_folder, _, frame_files, inputs), future in zip(jobs_to_run, futures):
+				written = future.result()
+				if written is False:
+					manifest.pop(folder, None)
+					continue
+				outputs = [os.path.basename(p) for p in written]
+				# Remove sheets from the previous build that this one did not overwrite
+				for stale in manifest.get(folder, {}).get("outputs", []):
+					if stale not in outputs and os.path.exists(os.path.join(output_dir, stale)):
+						os.remove(os.path.join(output_dir, stale))
+				manifest[folder] = {
+					"params": params,
+					"inputs": inputs,
+					"outputs": outputs,
+					"tiles": [tile_key(os.path.join(input_folder, f), frame_size, tile_trim) for f in frame_files],
+				}
 
-		output_file = os.path.join(output_dir, f"{folder}_{frame_count}.png")
+	for folder in list(manifest):
+		if folder not in folders:
+			del manifest[folder]
+	_save_manifest(manifest_path, manifest)
 
-		print(f"Processing {folder}...")
-		generate_sprite_sheet(
-			folder_path=input_folder,
-			output_filename=output_file,
-			frame_size=frame_size,
-			fps_reduction=fps_reduction
-		)
+	# Drop cached tiles no folder references anymore
+	if cache_dir and os.path.isdir(cache_dir):
+		live = {key for entry in manifest.values() for key in entry.get("tiles", [])}
+		for name in os.listdir(cache_dir):
+			if os.path.splitext(name)[0] not in live:
+				os.remove(os.path.join(cache_dir, name))
 
 if __name__ == "__main__":
 	parser = argparse.ArgumentParser(description='Generate sprite sheets from image folders')
@@ -117,10 +517,25 @@ if __name__ == "__main__":
 	parser.add_argument('--fps_reduction', type=int, default=1, help='FPS reduction factor (default: 1)')
 	parser.add_argument('--frame_width', type=int, default=80, help='Frame width (default: 80)')
 	parser.add_argument('--frame_height', type=int, default=80, help='Frame height (default: 80)')
+	parser.add_argument('--sheet_width', type=int, default=1024, help='Maximum sheet width (default: 1024)')
+	parser.add_argument('--sheet_height', type=int, default=1024, help='Maximum sheet height (default: 1024)')
+	parser.add_argument('--packing', choices=('grid', 'maxrects'), default='grid', help='grid: uniform cells (default). maxrects: tight packing, needs the frame table')
+	parser.add_argument('--trim', action='store_true', help='Trim transparent frame borders (maxrects only)')
+	parser.add_argument('--padding', type=int, default=0, help='Pixels between frames (default: 0)')
+	parser.add_argument('--table', choices=('json', 'csv', 'both'), default=None, help='Write a frame table (default: json for maxrects/dedupe, none for grid)')
+	parser.add_argument('--dedupe', choices=('exact', 'near'), default=None, help='Store repeated consecutive frames once and reference them in the frame table')
+	parser.add_argument('--dedupe_tolerance', type=int, default=2, help='Max per-channel difference for --dedupe near (default: 2)')
+	parser.add_argument('--jobs', type=int, default=None, help='Worker processes for frame decode/resize (default: CPU count)')
+	parser.add_argument('--force', action='store_true', help='Rebuild every folder even if inputs and settings are unchanged')
+	parser.add_argument('--no_cache', action='store_true', help='Do not read or write the resized tile cache')
 	args = parser.parse_args()
 
+	if args.trim and args.packing != 'maxrects':
+		parser.error('--trim requires --packing maxrects')
+
 	frame_size = (args.frame_width, args.frame_height)
-	fps_reduction = args.fps_reduction
-	use_png_subfolder = args.use_png_subfolder
 
-	main(frame_size=frame_size, fps_reduction=fps_reduction, use_png_subfolder=use_png_subfolder)
+	main(frame_size=frame_size, fps_reduction=args.fps_reduction, use_png_subfolder=args.use_png_subfolder,
+		 packing=args.packing, trim=args.trim, padding=args.padding, table_format=args.table,
+		 max_sheet_size=(args.sheet_width, args.sheet_height), dedupe=args.dedupe,
+		 dedupe_tolerance=args.dedupe_tolerance, jobs=args.jobs, force=args.force, use_cache=not args.no_cache)
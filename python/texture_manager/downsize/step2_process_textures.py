@@ -1,4 +1,22 @@
+"""
+Downsize exported textures in place (step 2 of the downsize workflow).
+
+Runs outside the editor. Every image under the target folder whose longest edge
+is above the limit is resized on a worker pool and overwritten. A manifest in the
+target folder remembers what was already processed, so reruns only touch new or
+changed files.
+
+Usage:
+    python step2_process_textures.py
+    python step2_process_textures.py D:/textures --size 1024 --pow2 floor --jobs 8
+    python step2_process_textures.py D:/textures --size 1024 --dry-run
+"""
+import argparse
+import json
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
 from PIL import Image
 
 # from downsize import step0_downsize_settings as settings
@@ -6,18 +24,190 @@ from PIL import Image
 target_drive = "D:/vs/anju/python/texture_manager/downsize/target_images/"
 desired_size = 924
 
-for root, dirs, files in os.walk(target_drive):
-    for filename in files:
-        print(filename)        
-        if filename.lower().endswith('.jpg') or filename.lower().endswith('.png') or filename.lower().endswith('.tga') or filename.lower().endswith('.jpeg'):
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.tga')
+MANIFEST_NAME = ".downsize_manifest.json"
+
+FILTERS = {
+    'lanczos': Image.LANCZOS,
+    'bicubic': Image.BICUBIC,
+    'bilinear': Image.BILINEAR,
+    'box': Image.BOX,
+    'nearest': Image.NEAREST,
+}
+
+# Bytes per pixel of the UE default compression (BC1 opaque, BC3/BC7 with alpha),
+# times 4/3 for the mip chain
+_BYTES_PER_PIXEL = {False: 0.5, True: 1.0}
+_MIP_FACTOR = 4 / 3
+
+
+def _floor_pow2(n):
+    return 1 << (max(1, n).bit_length() - 1)
+
+
+def _nearest_pow2(n):
+    low = _floor_pow2(n)
+    return low * 2 if n - low > low * 2 - n else low
+
+
+def target_size(width, height, max_size, pow2=None):
+    """
+    New (width, height): longest edge clamped to max_size keeping aspect ratio,
+    then optionally snapped to powers of two ('floor' never grows, 'nearest' may).
+    """
+    scale = min(1.0, max_size / max(width, height))
+    new_w = max(1, round(width * scale))
+    new_h = max(1, round(height * scale))
+    if pow2 == 'floor':
+        new_w, new_h = _floor_pow2(new_w), _floor_pow2(new_h)
+    elif pow2 == 'nearest':
+        new_w = min(_nearest_pow2(new_w), _floor_pow2(max_size))
+        new_h = min(_nearest_pow2(new_h), _floor_pow2(max_size))
+    return new_w, new_h
+
+
+def estimate_vram(width, height, has_alpha):
+    """Approximate GPU memory of a texture with full mips, in bytes."""
+    return width * height * _BYTES_PER_PIXEL[has_alpha] * _MIP_FACTOR
+
+
+def _has_alpha(image):
+    return image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+
+
+def _process_one(image_path, max_size, pow2, resample, dry_run):
+    """
+    Worker: resize one image in place if needed.
+
+    Returns:
+        dict with path, old/new size, alpha flag and whether it was resized
+    """
+    # Image.open reads only the header; pixels are decoded on resize
+    with Image.open(image_path) as image:
+        width, height = image.size
+        new_size = target_size(width, height, max_size, pow2)
+        result = {
+            'path': image_path, 'old': [width, height], 'new': list(new_size),
+            'alpha': _has_alpha(image), 'resized': False,
+        }
+        if new_size == (width, height) or dry_run:
+            return result
+        resized = image.resize(new_size, resample)
+        fmt = image.format
+
+    # Write next to the original and swap, so an interrupted run never leaves a truncated texture
+    tmp_path = f"{image_path}.{os.getpid()}.tmp"
+    resized.save(tmp_path, format=fmt)
+    os.replace(tmp_path, image_path)
+    result['resized'] = True
+    return result
+
+
+def _load_manifest(manifest_path):
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        return manifest if isinstance(manifest, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(manifest_path, manifest):
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp_path, manifest_path)
+
+
+def process_textures(folder, max_size=desired_size, pow2=None, resample='lanczos', jobs=None,
+                     dry_run=False, force=False):
+    """
+    Downsize every texture under folder.
+
+    Args:
+        folder: Root folder, walked recursively
+        max_size: Longest-edge limit in pixels
+        pow2: None, 'floor' or 'nearest' - snap each side to a power of two
+        resample: Key of FILTERS
+        jobs: Worker processes (default: CPU count)
+        dry_run: Only report what would change and the estimated VRAM saving
+        force: Ignore the manifest and check every file again
+
+    Returns:
+        list of per-file result dicts for the files that were checked
+    """
+    manifest_path = os.path.join(folder, MANIFEST_NAME)
+    manifest = {} if force else _load_manifest(manifest_path)
+    settings = {'max_size': max_size, 'pow2': pow2, 'filter': resample}
+
+    todo = []
+    skipped = 0
+    for root, dirs, files in os.walk(folder):
+        for filename in files:
+            if not filename.lower().endswith(IMAGE_EXTENSIONS):
+                continue
             image_path = os.path.join(root, filename)
-            image = Image.open(image_path)
-            width, height = image.size
-            if width > desired_size or height > desired_size:
-                new_width = desired_size
-                new_height = int(height * new_width / width)
-                resized_image = image.resize((new_width, new_height))
-                print(f"Resizing image: {image_path}")
-                resized_image.save(image_path)
-
-print("All images resized successfully.")
\ No newline at end of file
+            rel = os.path.relpath(image_path, folder).replace(os.sep, '/')
+            st = os.stat(image_path)
+            entry = manifest.get(rel)
+            if entry and entry.get('settings') == settings \
+                    and entry.get('stat') == [st.st_size, st.st_mtime_ns]:
+                skipped += 1
+                continue
+            todo.append((rel, image_path))
+
+    print(f"{len(todo)} texture(s) to check, {skipped} unchanged since last run")
+    start = time.perf_counter()
+    results = []
+    if todo:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {rel: pool.submit(_process_one, path, max_size, pow2, FILTERS[resample], dry_run)
+                       for rel, path in todo}
+            for rel, future in futures.items():
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"  ✗ {rel}: {e}")
+                    continue
+                results.append(result)
+                if result['resized'] or (dry_run and result['old'] != result['new']):
+                    verb = "Would resize" if dry_run else "Resized"
+                    print(f"  {verb} {rel}: {result['old'][0]}x{result['old'][1]} -> "
+                          f"{result['new'][0]}x{result['new'][1]}")
+                if not dry_run:
+                    st = os.stat(result['path'])
+                    manifest[rel] = {'settings': settings, 'stat': [st.st_size, st.st_mtime_ns],
+                                     'size': result['new']}
+
+    if not dry_run:
+        _save_manifest(manifest_path, manifest)
+
+    changed = [r for r in results if r['old'] != r['new']]
+    before = sum(estimate_vram(*r['old'], r['alpha']) for r in changed)
+    after = sum(estimate_vram(*r['new'], r['alpha']) for r in changed)
+    mb = 1024 * 1024
+    label = "Dry run" if dry_run else "Done"
+    print(f"{label}: {len(changed)} of {len(results)} texture(s) over the limit "
+          f"in {time.perf_counter() - start:.1f}s")
+    print(f"  Estimated VRAM (BC1/BC3 + mips): {before / mb:.1f} MB -> {after / mb:.1f} MB "
+          f"(saves {(before - after) / mb:.1f} MB)")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Downsize exported textures in place")
+    parser.add_argument("folder", nargs="?", default=target_drive, help=f"Texture folder (default: {target_drive})")
+    parser.add_argument("--size", type=int, default=desired_size, help=f"Longest edge limit (default: {desired_size})")
+    parser.add_argument("--pow2", choices=("floor", "nearest"), help="Snap both sides to a power of two")
+    parser.add_argument("--filter", choices=sorted(FILTERS), default="lanczos", help="Resampling filter (default: lanczos)")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--dry-run", action="store_true", help="Report changes and VRAM estimate without writing")
+    parser.add_argument("--force", action="store_true", help="Ignore the manifest")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.folder):
+        print(f"ERROR: Folder not found: {args.folder}")
+        raise SystemExit(1)
+
+    process_textures(args.folder, max_size=args.size, pow2=args.pow2, resample=args.filter,
+                     jobs=args.jobs, dry_run=args.dry_run, force=args.force)
@@ -0,0 +1,306 @@
+"""
+Header-only image metadata scanner for texture audits.
+
+Runs outside the editor. Dimensions, channel count, bit depth and alpha are
+parsed straight from PNG / JPEG / TGA / BMP / WebP headers — a few dozen bytes
+per file, no pixel decode — on a thread pool, so a 100k-texture content folder
+scans in seconds.
+
+Report flags:
+    oversized     longest edge above --max-size
+    non_pow2      a side is not a power of two
+    alpha_unused  has an alpha channel but every pixel is opaque
+                  (only with --check-alpha, which decodes files that have alpha)
+
+Usage:
+    python image_header_scan.py D:/Content
+    python image_header_scan.py D:/Content --max-size 2048 --report audit.csv
+    python image_header_scan.py D:/Content --check-alpha --flagged-only --report audit.json
+"""
+import argparse
+import csv
+import json
+import os
+import struct
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.tga', '.bmp', '.webp')
+
+_PNG_CHANNELS = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}  # color type -> channels (palette counted as RGB)
+# JPEG start-of-frame markers (baseline, progressive, lossless, ...); C4/C8/CC are not frames
+_JPEG_SOF = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+# ── Header parsers ──
+# Each returns dict(format, width, height, channels, bit_depth, alpha) or raises ValueError.
+
+def _read_png(f):
+    head = f.read(33)
+    if len(head) < 33 or head[:8] != b"\x89PNG\r\n\x1a\n" or head[12:16] != b"IHDR":
+        raise ValueError("not a PNG")
+    width, height, bit_depth, color_type = struct.unpack(">IIBB", head[16:26])
+    alpha = color_type in (4, 6)
+    if not alpha:
+        # tRNS (palette or color-key transparency) must come before IDAT
+        while True:
+            chunk = f.read(8)
+            if len(chunk) < 8:
+                break
+            length, kind = struct.unpack(">I4s", chunk)
+            if kind == b"tRNS":
+                alpha = True
+                break
+            if kind in (b"IDAT", b"IEND"):
+                break
+            f.seek(length + 4, os.SEEK_CUR)
+    channels = _PNG_CHANNELS.get(color_type, 0) + (1 if alpha and color_type in (0, 2, 3) else 0)
+    return dict(format="png", width=width, height=height, channels=channels, bit_depth=bit_depth, alpha=alpha)
+
+
+def _read_jpeg(f):
+    if f.read(2) != b"\xff\xd8":
+        raise ValueError("not a JPEG")
+    while True:
+        byte = f.read(1)
+        if not byte:
+            raise ValueError("JPEG has no frame header")
+        if byte != b"\xff":
+            continue
+        marker = f.read(1)
+        while marker == b"\xff":  # fill bytes
+            marker = f.read(1)
+        if not marker:
+            raise ValueError("JPEG has no frame header")
+        code = marker[0]
+        if code in (0xD8, 0x01) or 0xD0 <= code <= 0xD7:
+            continue  # standalone markers
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            raise ValueError("truncated JPEG")
+        length = struct.unpack(">H", length_bytes)[0]
+        if code in _JPEG_SOF:
+            precision, height, width, components = struct.unpack(">BHHB", f.read(6))
+            return dict(format="jpeg", width=width, height=height, channels=components,
+                        bit_depth=precision, alpha=False)
+        f.seek(length - 2, os.SEEK_CUR)  # skip EXIF / ICC / tables
+
+
+def _read_tga(f):
+    head = f.read(18)
+    if len(head) < 18:
+        raise ValueError("not a TGA")
+    image_type = head[2]
+    if image_type not in (1, 2, 3, 9, 10, 11):
+        raise ValueError("not a TGA")
+    width, height, pixel_depth, descriptor = struct.unpack("<HHBB", head[12:18])
+    alpha_bits = descriptor & 0x0F
+    if image_type in (3, 11):
+        channels = 1 + (1 if alpha_bits else 0)
+    else:
+        channels = 4 if alpha_bits or pixel_depth == 32 else 3
+    return dict(format="tga", width=width, height=height, channels=channels,
+                bit_depth=8, alpha=bool(alpha_bits))
+
+
+def _read_bmp(f):
+    head = f.read(54)
+    if len(head) < 26 or head[:2] != b"BM":
+        raise ValueError("not a BMP")
+    dib_size = struct.unpack("<I", head[14:18])[0]
+    if dib_size == 12:  # BITMAPCOREHEADER
+        width, height, _, bit_count = struct.unpack("<HHHH", head[18:26])
+        compression = 0
+    else:
+        width, height, _, bit_count, compression = struct.unpack("<iiHHI", head[18:34])
+    alpha = False
+    if bit_count == 32 and dib_size >= 56:
+        # BITMAPV3+ headers carry an alpha mask after the RGB masks
+        f.seek(14 + 52)
+        mask = f.read(4)
+        alpha = len(mask) == 4 and struct.unpack("<I", mask)[0] != 0
+    channels = 4 if alpha else (1 if bit_count <= 8 else 3)
+    depth = 8 if bit_count >= 24 else bit_count
+    return dict(format="bmp", width=abs(width), height=abs(height), channels=channels,
+                bit_depth=depth, alpha=alpha)
+
+
+def _read_webp(f):
+    head = f.read(30)
+    if len(head) < 30 or head[:4] != b"RIFF" or head[8:12] != b"WEBP":
+        raise ValueError("not a WebP")
+    kind = head[12:16]
+    if kind == b"VP8X":
+        flags = head[20]
+        width = 1 + int.from_bytes(head[24:27], "little")
+        height = 1 + int.from_bytes(head[27:30], "little")
+        alpha = bool(flags & 0x10)
+    elif kind == b"VP8L":
+        bits = int.from_bytes(head[21:25], "little")
+        width = (bits & 0x3FFF) + 1
+        height = ((bits >> 14) & 0x3FFF) + 1
+        alpha = bool((bits >> 28) & 1)
+    elif kind == b"VP8 ":
+        width, height = struct.unpack("<HH", head[26:30])
+        width &= 0x3FFF
+        height &= 0x3FFF
+        alpha = False
+    else:
+        raise ValueError("unknown WebP chunk")
+    return dict(format="webp", width=width, height=height, channels=4 if alpha else 3,
+                bit_depth=8, alpha=alpha)
+
+
+_READERS = {
+    ".png": _read_png, ".jpg": _read_jpeg, ".jpeg": _read_jpeg,
+    ".tga": _read_tga, ".bmp": _read_bmp, ".webp": _read_webp,
+}
+
+
+def read_image_header(path):
+    """
+    Parse size/channels/bit depth/alpha from an image file header.
+
+    Returns:
+        dict: format, width, height, channels, bit_depth, alpha
+
+    Raises:
+        ValueError: Unsupported or malformed file
+    """
+    reader = _READERS.get(os.path.splitext(path)[1].lower())
+    if reader is None:
+        raise ValueError("unsupported extension")
+    with open(path, "rb") as f:
+        return reader(f)
+
+
+def _is_pow2(n):
+    return n > 0 and n & (n - 1) == 0
+
+
+def _alpha_all_opaque(path):
+    from PIL import Image
+
+    with Image.open(path) as img:
+        if "A" not in img.getbands():
+            img = img.convert("RGBA")
+        return img.getchannel("A").getextrema()[0] == 255
+
+
+def scan_file(path, max_size=None, check_alpha=False):
+    """Header info plus audit flags for one file (error set instead if unreadable)."""
+    row = {"path": path}
+    try:
+        row.update(read_image_header(path))
+    except (OSError, ValueError, struct.error) as e:
+        row["error"] = str(e)
+        return row
+    row["oversized"] = bool(max_size) and max(row["width"], row["height"]) > max_size
+    row["non_pow2"] = not (_is_pow2(row["width"]) and _is_pow2(row["height"]))
+    row["alpha_unused"] = None
+    if check_alpha and row["alpha"]:
+        try:
+            row["alpha_unused"] = _alpha_all_opaque(path)
+        except Exception as e:
+            row["error"] = f"alpha check: {e}"
+    return row
+
+
+# ── Directory scan ──
+
+def _list_dir(folder):
+    """Image files directly in folder and its subfolders (one level of fan-out)."""
+    files, subdirs = [], []
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.lower().endswith(IMAGE_EXTENSIONS):
+                    files.append(entry.path)
+    except OSError:
+        pass
+    return files, subdirs
+
+
+def scan_folders(folders, max_size=None, check_alpha=False, jobs=None):
+    """
+    Walk folders in parallel and scan every image header.
+
+    Directory listing and header reads are I/O-bound, so both run on one thread pool.
+
+    Returns:
+        list of row dicts sorted by path
+    """
+    jobs = jobs or min(32, (os.cpu_count() or 4) * 4)
+    rows = []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        pending = [pool.submit(_list_dir, os.path.abspath(f)) for f in folders]
+        file_futures = []
+        while pending:
+            future = pending.pop()
+            files, subdirs = future.result()
+            pending.extend(pool.submit(_list_dir, d) for d in subdirs)
+            file_futures.extend(pool.submit(scan_file, p, max_size, check_alpha) for p in files)
+        rows = [f.result() for f in file_futures]
+    rows.sort(key=lambda r: r["path"])
+    return rows
+
+
+_COLUMNS = ["path", "format", "width", "height", "channels", "bit_depth", "alpha",
+            "oversized", "non_pow2", "alpha_unused", "error"]
+
+
+def write_report(rows, report_path):
+    """Rows as CSV or JSON (chosen by extension)."""
+    if report_path.lower().endswith(".json"):
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(rows, f, ensure_ascii=False, indent=1)
+        return
+    with open(report_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=_COLUMNS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Header-only image metadata scan for texture audits")
+    parser.add_argument("folders", nargs="+", help="Folders to scan recursively")
+    parser.add_argument("--max-size", type=int, default=None, help="Flag textures whose longest edge exceeds this")
+    parser.add_argument("--check-alpha", action="store_true",
+                        help="Decode files with alpha to flag alpha that is fully opaque")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="I/O threads (default: 4 x CPU, max 32)")
+    parser.add_argument("--flagged-only", action="store_true", help="Report only flagged or unreadable files")
+    parser.add_argument("--report", help="Write the report to .csv or .json")
+    args = parser.parse_args(argv)
+
+    for folder in args.folders:
+        if not os.path.isdir(folder):
+            print(f"Error: Folder not found: {folder}", file=sys.stderr)
+            sys.exit(1)
+
+    start = time.perf_counter()
+    rows = scan_folders(args.folders, args.max_size, args.check_alpha, args.jobs)
+    elapsed = time.perf_counter() - start
+
+    ok = [r for r in rows if "error" not in r]
+    oversized = sum(1 for r in ok if r["oversized"])
+    non_pow2 = sum(1 for r in ok if r["non_pow2"])
+    alpha = sum(1 for r in ok if r["alpha"])
+    alpha_unused = sum(1 for r in ok if r["alpha_unused"])
+    print(f"Scanned {len(rows)} image(s) in {elapsed:.2f}s ({len(rows) - len(ok)} unreadable)")
+    if args.max_size:
+        print(f"  Oversized (>{args.max_size}): {oversized}")
+    print(f"  Non-power-of-two: {non_pow2}")
+    print(f"  With alpha: {alpha}" + (f" ({alpha_unused} fully opaque)" if args.check_alpha else ""))
+
+    if args.report:
+        if args.flagged_only:
+            rows = [r for r in rows if "error" in r or r["oversized"] or r["non_pow2"] or r["alpha_unused"]]
+        write_report(rows, args.report)
+        print(f"Report: {args.report} ({len(rows)} row(s))")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,375 @@
+"""
+Perceptual-hash texture index — find visually identical textures across exports.
+
+Runs outside the editor. Exported texture folders (udim DISK_EXPORT_PATH,
+downsize target_images, ...) are hashed with dHash and pHash on a worker pool
+and stored in SQLite. Only new or changed files (size/mtime) are hashed again.
+Near-duplicate search uses a BK-tree over the 64-bit hashes (Hamming distance),
+so a query against 100k textures touches a small fraction of them.
+
+The report lists consolidation candidates: per group, the texture to keep
+(largest resolution) and the ones that can be replaced by it.
+
+pHash needs NumPy; dHash only needs Pillow.
+
+Usage:
+    python texture_hash_index.py D:/exported D:/target_images
+    python texture_hash_index.py D:/exported --threshold 6 --report dupes.csv
+    python texture_hash_index.py D:/exported --find T_Body_1.png
+"""
+import argparse
+import csv
+import json
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.tga', '.bmp', '.webp')
+DEFAULT_DB_NAME = ".texture_hash_index.sqlite"
+HASH_KINDS = ('dhash', 'phash')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS textures (
+    path      TEXT PRIMARY KEY,
+    size      INTEGER NOT NULL,
+    mtime_ns  INTEGER NOT NULL,
+    width     INTEGER,
+    height    INTEGER,
+    dhash     INTEGER,
+    phash     INTEGER,
+    error     TEXT
+);
+"""
+
+
+# ── Hashing ──
+
+def _to_signed(value):
+    """SQLite INTEGER is signed 64-bit."""
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def _to_unsigned(value):
+    return value + (1 << 64) if value < 0 else value
+
+
+def _grayscale(img, size):
+    # draft() lets JPEG decode at reduced scale; other formats ignore it
+    img.draft('L', (size[0] * 4, size[1] * 4))
+    if img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info:
+        # Hash what the texture looks like, not the colour stored under alpha 0
+        img = img.convert('RGBA')
+        background = Image.new('RGBA', img.size, (0, 0, 0, 255))
+        img = Image.alpha_composite(background, img)
+    return img.convert('L').resize(size, Image.BILINEAR)
+
+
+def dhash(img):
+    """64-bit difference hash: sign of horizontal gradients on a 9x8 thumbnail."""
+    pixels = _grayscale(img, (9, 8)).tobytes()
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            left = pixels[row * 9 + col]
+            right = pixels[row * 9 + col + 1]
+            value = (value << 1) | (left > right)
+    return value
+
+
+_DCT_MATRIX = None
+
+
+def phash(img):
+    """64-bit DCT hash: low 8x8 frequencies of a 32x32 thumbnail against their median."""
+    import numpy as np
+
+    global _DCT_MATRIX
+    if _DCT_MATRIX is None:
+        n = 32
+        k = np.arange(n)
+        matrix = np.cos(np.pi * (2 * k[None, :] + 1) * k[:, None] / (2 * n))
+        matrix[0] /= np.sqrt(2)
+        _DCT_MATRIX = matrix * np.sqrt(2 / n)
+
+    pixels = np.asarray(_grayscale(img, (32, 32)), dtype=np.float64)
+    low = (_DCT_MATRIX @ pixels @ _DCT_MATRIX.T)[:8, :8].ravel()
+    bits = low > np.median(low[1:])  # DC term skews the median
+    value = 0
+    for bit in bits:
+        value = (value << 1) | int(bit)
+    return value
+
+
+def hamming(a, b):
+    return bin(a ^ b).count('1')
+
+
+def _hash_file(path):
+    """Worker: hash one texture. Returns a row dict for the index (errors go in 'error')."""
+    # size/mtime 0 for a file deleted since the scan: never matches, so it is retried or removed next update
+    row = {'path': path, 'size': 0, 'mtime_ns': 0}
+    try:
+        st = os.stat(path)
+        row['size'], row['mtime_ns'] = st.st_size, st.st_mtime_ns
+        with Image.open(path) as img:
+            row['width'], row['height'] = img.size
+            row['dhash'] = _to_signed(dhash(img))
+        with Image.open(path) as img:
+            row['phash'] = _to_signed(phash(img))
+    except ImportError:
+        row['phash'] = None
+    except Exception as e:
+        row['error'] = f"{type(e).__name__}: {e}"
+    return row
+
+
+# ── BK-tree ──
+
+class BKTree:
+    """BK-tree over integer hashes with Hamming distance. Items sharing a hash share a node."""
+
+    def __init__(self):
+        self._root = None  # [hash, items, children{distance: node}]
+
+    def add(self, value, item):
+        if self._root is None:
+            self._root = [value, [item], {}]
+            return
+        node = self._root
+        while True:
+            d = hamming(value, node[0])
+            if d == 0:
+                node[1].append(item)
+                return
+            child = node[2].get(d)
+            if child is None:
+                node[2][d] = [value, [item], {}]
+                return
+            node = child
+
+    def search(self, value, max_distance):
+        """All (distance, item) within max_distance of value."""
+        results = []
+        stack = [self._root] if self._root else []
+        while stack:
+            node = stack.pop()
+            d = hamming(value, node[0])
+            if d <= max_distance:
+                results.extend((d, item) for item in node[1])
+            # Triangle inequality: only children with |k - d| <= max_distance can match
+            for k, child in node[2].items():
+                if d - max_distance <= k <= d + max_distance:
+                    stack.append(child)
+        return results
+
+
+# ── Index ──
+
+class TextureHashIndex:
+    """SQLite-backed perceptual hash index. Usable as a context manager."""
+
+    def __init__(self, db_path):
+        self.db_path = str(db_path)
+        self._db = sqlite3.connect(self.db_path)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._db.close()
+
+    def update(self, folders, jobs=None):
+        """
+        Hash new or changed textures under folders and drop rows for deleted files.
+
+        Returns:
+            dict with counts: total, hashed, unchanged, removed
+        """
+        roots = [os.path.abspath(f) for f in folders]
+        known = {row['path']: (row['size'], row['mtime_ns'])
+                 for row in self._db.execute("SELECT path, size, mtime_ns FROM textures")}
+
+        stats = {'total': 0, 'hashed': 0, 'unchanged': 0, 'removed': 0}
+        seen = set()
+        changed = []
+        for root in roots:
+            for dirpath, _, files in os.walk(root):
+                for name in files:
+                    if not name.lower().endswith(IMAGE_EXTENSIONS):
+                        continue
+                    path = os.path.join(dirpath, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    seen.add(path)
+                    stats['total'] += 1
+                    if known.get(path) == (st.st_size, st.st_mtime_ns):
+                        stats['unchanged'] += 1
+                    else:
+                        changed.append(path)
+
+        prefixes = tuple(r.rstrip(os.sep) + os.sep for r in roots)
+        gone = [p for p in known if p.startswith(prefixes) and p not in seen]
+        self._db.executemany("DELETE FROM textures WHERE path = ?", [(p,) for p in gone])
+        stats['removed'] = len(gone)
+
+        if changed:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                rows = pool.map(_hash_file, changed, chunksize=32)
+                columns = ('path', 'size', 'mtime_ns', 'width', 'height', 'dhash', 'phash', 'error')
+                for row in rows:
+                    self._db.execute(
+                        f"INSERT OR REPLACE INTO textures ({', '.join(columns)}) "
+                        f"VALUES ({', '.join('?' * len(columns))})",
+                        [row.get(c) for c in columns])
+            stats['hashed'] = len(changed)
+
+        self._db.commit()
+        return stats
+
+    def _rows(self, roots=None):
+        rows = [dict(r) for r in self._db.execute("SELECT * FROM textures WHERE error IS NULL ORDER BY path")]
+        if roots:
+            prefixes = tuple(os.path.abspath(r).rstrip(os.sep) + os.sep for r in roots)
+            rows = [r for r in rows if r['path'].startswith(prefixes)]
+        return rows
+
+    def build_tree(self, kind='dhash', roots=None):
+        """BK-tree of (hash kind) over indexed textures; items are row dicts."""
+        tree = BKTree()
+        for row in self._rows(roots):
+            if row[kind] is not None:
+                tree.add(_to_unsigned(row[kind]), row)
+        return tree
+
+    def find(self, image_path, threshold=4, kind='dhash', tree=None):
+        """Indexed textures within threshold bits of image_path, closest first."""
+        with Image.open(image_path) as img:
+            value = dhash(img) if kind == 'dhash' else phash(img)
+        tree = tree or self.build_tree(kind)
+        return sorted(tree.search(value, threshold), key=lambda r: (r[0], r[1]['path']))
+
+    def duplicate_groups(self, threshold=4, kind='dhash', roots=None):
+        """
+        Cluster textures whose hashes are within threshold bits (single linkage).
+
+        Returns:
+            list of groups, each {'keep': row, 'duplicates': [(distance, row), ...]};
+            keep is the largest texture (then shortest path) of the group.
+        """
+        rows = [r for r in self._rows(roots) if r[kind] is not None]
+        tree = BKTree()
+        for i, row in enumerate(rows):
+            tree.add(_to_unsigned(row[kind]), i)
+
+        parent = list(range(len(rows)))
+
+        def find_root(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for i, row in enumerate(rows):
+            for _, j in tree.search(_to_unsigned(row[kind]), threshold):
+                ri, rj = find_root(i), find_root(j)
+                if ri != rj:
+                    parent[rj] = ri
+
+        clusters = {}
+        for i in range(len(rows)):
+            clusters.setdefault(find_root(i), []).append(rows[i])
+
+        groups = []
+        for members in clusters.values():
+            if len(members) < 2:
+                continue
+            members.sort(key=lambda r: (-(r['width'] or 0) * (r['height'] or 0), len(r['path']), r['path']))
+            keep = members[0]
+            keep_hash = _to_unsigned(keep[kind])
+            duplicates = [(hamming(keep_hash, _to_unsigned(r[kind])), r) for r in members[1:]]
+            groups.append({'keep': keep, 'duplicates': duplicates})
+        groups.sort(key=lambda g: g['keep']['path'])
+        return groups
+
+
+def write_report(groups, report_path):
+    """Consolidation candidates as CSV (one row per duplicate) or JSON (by extension)."""
+    if report_path.lower().endswith('.json'):
+        data = [{
+            'keep': g['keep']['path'],
+            'keep_size': [g['keep']['width'], g['keep']['height']],
+            'duplicates': [{'path': r['path'], 'size': [r['width'], r['height']], 'distance': d}
+                           for d, r in g['duplicates']],
+        } for g in groups]
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        return
+    with open(report_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['group', 'keep', 'keep_width', 'keep_height', 'duplicate', 'width', 'height', 'distance'])
+        for n, g in enumerate(groups, start=1):
+            keep = g['keep']
+            for d, r in g['duplicates']:
+                writer.writerow([n, keep['path'], keep['width'], keep['height'], r['path'], r['width'], r['height'], d])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Perceptual-hash duplicate finder for exported textures")
+    parser.add_argument("folders", nargs="+", help="Texture folders to index")
+    parser.add_argument("--db", help=f"Index file (default: <first folder>/{DEFAULT_DB_NAME})")
+    parser.add_argument("--hash", choices=HASH_KINDS, default="dhash", help="Hash used for matching (default: dhash)")
+    parser.add_argument("--threshold", type=int, default=4, help="Max differing bits of 64 (default: 4, 0 = identical)")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Hashing processes (default: CPU count)")
+    parser.add_argument("--find", metavar="IMAGE", help="Only list textures similar to this image")
+    parser.add_argument("--report", help="Write consolidation candidates to .csv or .json")
+    args = parser.parse_args(argv)
+
+    for folder in args.folders:
+        if not os.path.isdir(folder):
+            print(f"Error: Folder not found: {folder}", file=sys.stderr)
+            sys.exit(1)
+    db_path = args.db or os.path.join(args.folders[0], DEFAULT_DB_NAME)
+
+    with TextureHashIndex(db_path) as index:
+        start = time.time()
+        stats = index.update(args.folders, jobs=args.jobs)
+        print(f"Index: {db_path}")
+        print(f"  {stats['total']} textures, {stats['hashed']} hashed, {stats['unchanged']} unchanged, "
+              f"{stats['removed']} removed ({time.time() - start:.2f}s)")
+
+        start = time.perf_counter()
+        if args.find:
+            matches = index.find(args.find, args.threshold, args.hash)
+            for d, row in matches:
+                print(f"  [{d:2d}] {row['path']} ({row['width']}x{row['height']})")
+            print(f"{len(matches)} match(es) in {(time.perf_counter() - start) * 1000:.0f} ms")
+            return
+
+        groups = index.duplicate_groups(args.threshold, args.hash, roots=args.folders)
+
+    elapsed = time.perf_counter() - start
+    replaceable = sum(len(g['duplicates']) for g in groups)
+    for g in groups:
+        print(f"  keep {g['keep']['path']} ({g['keep']['width']}x{g['keep']['height']})")
+        for d, row in g['duplicates']:
+            print(f"    [{d:2d}] {row['path']} ({row['width']}x{row['height']})")
+    print(f"{len(groups)} group(s), {replaceable} replaceable texture(s) in {elapsed * 1000:.0f} ms")
+    if args.report:
+        write_report(groups, args.report)
+        print(f"Report: {args.report}")
+
+
+if __name__ == "__main__":
+    main()
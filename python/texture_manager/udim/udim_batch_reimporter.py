@@ -1,7 +1,11 @@
 import unreal
 import os
 import re # 정규표현식 사용 (UDIM 숫자 추출용)
-from PIL import Image # 이미지 리사이즈용
+import json
+import struct
+import subprocess
+import tempfile
+import time
 
 # ==========================================
 # [설정 영역]
@@ -10,11 +14,76 @@ from PIL import Image # 이미지 리사이즈용
 # 1. PC 내보내기 베이스 폴더 (하위에 에셋별 폴더가 생성됩니다)
 DISK_EXPORT_PATH = "D:/vs/anju/python/texture_manager/udim/exported"
 
+# 2. 리사이즈 목표 크기 (정사각형)
+RESIZE_TARGET_SIZE = 1024
+
+# 3. 리사이즈 워커 프로세스 수 (None이면 CPU 코어 수)
+RESIZE_JOBS = None
+
+# 4. 리사이즈 워커를 실행할 Python (None이면 UE 내장 Python 인터프리터, Pillow 필요)
+RESIZE_PYTHON_EXE = None
+
+RESIZE_WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "udim_resize_worker.py")
+
 
 # ==========================================
 # [함수 정의]
 # ==========================================
 
+def read_png_size(file_path):
+    """PNG IHDR에서 (width, height)만 읽기 (디코딩 없음). PNG가 아니면 None."""
+    with open(file_path, "rb") as f:
+        head = f.read(24)
+    if len(head) < 24 or head[:8] != b"\x89PNG\r\n\x1a\n" or head[12:16] != b"IHDR":
+        return None
+    return struct.unpack(">II", head[16:24])
+
+
+def resize_in_external_process(file_paths, size, slow_task):
+    """
+    에디터 밖의 Python 프로세스 풀에서 리사이즈 (udim_resize_worker.py).
+    끝날 때까지 기다리되, 취소 버튼을 누르면 워커를 종료합니다.
+
+    Returns:
+        list: 파일별 결과 dict (path, status, original, error)
+    """
+    python_exe = RESIZE_PYTHON_EXE or unreal.get_interpreter_executable_path()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        list_path = os.path.join(tmp_dir, "files.json")
+        result_path = os.path.join(tmp_dir, "result.json")
+        with open(list_path, "w", encoding="utf-8") as f:
+            json.dump(file_paths, f)
+
+        cmd = [python_exe, RESIZE_WORKER_SCRIPT, "--list", list_path, "--size", str(size), "--result", result_path]
+        if RESIZE_JOBS:
+            cmd += ["--jobs", str(RESIZE_JOBS)]
+        # 출력은 파일로 (PIPE는 버퍼가 차면 워커가 멈출 수 있음), 콘솔 창은 띄우지 않음
+        log_path = os.path.join(tmp_dir, "worker.log")
+        with open(log_path, "w", encoding="utf-8") as log_file:
+            proc = subprocess.Popen(cmd, stdout=log_file, stderr=subprocess.STDOUT,
+                                    creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0))
+
+            # 워커가 끝날 때까지 대기 (에디터 스레드는 폴링만 함)
+            while proc.poll() is None:
+                if slow_task.should_cancel():
+                    proc.terminate()
+                    proc.wait()
+                    unreal.log_warning("Resize cancelled.")
+                    return []
+                time.sleep(0.1)
+
+        with open(log_path, "r", encoding="utf-8", errors="replace") as f:
+            output = f.read().strip()
+        if output:
+            unreal.log(output)
+        if not os.path.exists(result_path):
+            unreal.log_error(f"Resize worker failed (exit code {proc.returncode}).")
+            return []
+        with open(result_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+
 def process_selected_udims():
     # 1. 현재 선택된 에셋 가져오기
     selected_assets = unreal.EditorUtilityLibrary.get_selected_assets()
@@ -164,37 +233,36 @@ def process_selected_udims():
 
         unreal.log(f"Renamed {renamed_count} files.")
 
-        # --- STEP 2.5: Resize images to 1024x1024 ---
-        slow_task.enter_progress_frame(1, "Resizing images to 1024x1024...")
-        unreal.log("Resizing images to 1024x1024...")
-
-        resize_count = 0
-        target_size = (1024, 1024)
+        # --- STEP 2.5: Resize images (외부 프로세스 풀) ---
+        target_label = f"{RESIZE_TARGET_SIZE}x{RESIZE_TARGET_SIZE}"
+        slow_task.enter_progress_frame(1, f"Resizing images to {target_label}...")
+        unreal.log(f"Resizing images to {target_label}...")
 
+        # 이미 목표 크기인 파일은 PNG 헤더만 보고 제외
+        to_resize = []
         for file_path, dest_folder in renamed_files_info:
             try:
-                # 이미지 열기
-                img = Image.open(file_path)
-                original_size = img.size
-
-                # 이미 1024x1024이면 스킵
-                if img.size == target_size:
-                    unreal.log(f"Skipped (already 1024x1024): {os.path.basename(file_path)}")
+                if read_png_size(file_path) == (RESIZE_TARGET_SIZE, RESIZE_TARGET_SIZE):
+                    unreal.log(f"Skipped (already {target_label}): {os.path.basename(file_path)}")
                     continue
+            except OSError as e:
+                unreal.log_error(f"Failed to read {file_path}: {str(e)}")
+                continue
+            to_resize.append(file_path)
 
-                # 1024x1024로 리사이즈 (LANCZOS 필터 사용 - 고품질)
-                img_resized = img.resize(target_size, Image.LANCZOS)
-
-                # 원본 파일 덮어쓰기
-                img_resized.save(file_path, "PNG")
-
-                unreal.log(f"Resized: {os.path.basename(file_path)} ({original_size[0]}x{original_size[1]} -> 1024x1024)")
-                resize_count += 1
-
-            except Exception as e:
-                unreal.log_error(f"Failed to resize {file_path}: {str(e)}")
-
-        unreal.log(f"Resized {resize_count} images to 1024x1024.")
+        resize_count = 0
+        if to_resize:
+            # 임포트 전에 리사이즈가 모두 끝나도록 여기서 join
+            for result in resize_in_external_process(to_resize, RESIZE_TARGET_SIZE, slow_task):
+                name = os.path.basename(result["path"])
+                if result["status"] == "resized":
+                    original = result["original"] or ["?", "?"]
+                    unreal.log(f"Resized: {name} ({original[0]}x{original[1]} -> {target_label})")
+                    resize_count += 1
+                elif result["status"] == "failed":
+                    unreal.log_error(f"Failed to resize {result['path']}: {result['error']}")
+
+        unreal.log(f"Resized {resize_count} images to {target_label}.")
 
         # --- STEP 3: Import (모든 리네이밍된 텍스처 임포트) ---
         slow_task.enter_progress_frame(1, "Importing All Renamed Textures...")
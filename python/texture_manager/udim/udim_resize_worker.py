@@ -0,0 +1,102 @@
+"""
+UDIM 타일 리사이즈 워커 (에디터 밖에서 실행)
+
+udim_batch_reimporter.py의 STEP 2.5가 subprocess로 실행합니다.
+에디터 Python 스레드를 막지 않도록 별도 인터프리터에서 프로세스 풀로 리사이즈합니다.
+
+Usage:
+    python udim_resize_worker.py --list files.json --size 1024 [--result result.json] [--jobs 8]
+    python udim_resize_worker.py --size 1024 T_Body_1.png T_Body_2.png
+"""
+import argparse
+import json
+import os
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def read_png_size(file_path):
+    """PNG IHDR에서 (width, height)만 읽기 (디코딩 없음). PNG가 아니면 None."""
+    with open(file_path, "rb") as f:
+        head = f.read(24)
+    if len(head) < 24 or head[:8] != PNG_SIGNATURE or head[12:16] != b"IHDR":
+        return None
+    return struct.unpack(">II", head[16:24])
+
+
+def resize_file(file_path, size):
+    """
+    파일 하나를 size x size로 리사이즈해서 덮어쓰기.
+
+    Returns:
+        dict: path, status ("resized" | "skipped" | "failed"), original size, error
+    """
+    result = {"path": file_path, "status": "skipped", "original": None, "error": None}
+    try:
+        header_size = read_png_size(file_path)
+        result["original"] = list(header_size) if header_size else None
+        # 이미 목표 크기면 헤더만 보고 스킵
+        if header_size == (size, size):
+            return result
+
+        with Image.open(file_path) as img:
+            result["original"] = list(img.size)
+            if img.size == (size, size):
+                return result
+            # LANCZOS 필터 사용 - 고품질
+            img_resized = img.resize((size, size), Image.LANCZOS)
+
+        # 임시 파일에 저장 후 교체 (중간에 끊겨도 원본이 깨지지 않도록)
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        img_resized.save(tmp_path, "PNG")
+        os.replace(tmp_path, file_path)
+        result["status"] = "resized"
+    except Exception as e:
+        result["status"] = "failed"
+        result["error"] = str(e)
+    return result
+
+
+def resize_files(file_paths, size, jobs=None):
+    """file_paths를 프로세스 풀에서 리사이즈하고 결과 리스트 반환 (입력 순서 유지)."""
+    if len(file_paths) <= 1:
+        return [resize_file(path, size) for path in file_paths]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(resize_file, file_paths, [size] * len(file_paths)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resize UDIM tiles to a square size in parallel")
+    parser.add_argument("files", nargs="*", help="PNG files")
+    parser.add_argument("--list", help="JSON file containing a list of PNG paths")
+    parser.add_argument("--size", type=int, default=1024, help="Target size (default: 1024)")
+    parser.add_argument("--result", help="Write per-file results as JSON here")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    file_paths = list(args.files)
+    if args.list:
+        with open(args.list, "r", encoding="utf-8") as f:
+            file_paths.extend(json.load(f))
+
+    results = resize_files(file_paths, args.size, args.jobs)
+
+    if args.result:
+        with open(args.result, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    for r in results:
+        if r["status"] == "failed":
+            print(f"Failed: {r['path']}: {r['error']}", file=sys.stderr)
+    resized = sum(r["status"] == "resized" for r in results)
+    print(f"Resized {resized}/{len(results)} images to {args.size}x{args.size}.")
+    return 1 if any(r["status"] == "failed" for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
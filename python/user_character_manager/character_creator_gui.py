@@ -5,9 +5,19 @@ import os
 import socket
 import subprocess
 import threading
-import shutil
 import uuid
 
+from assets_store import AssetsStore
+from character_file import read_character_metadata, update_character_metadata
+from character_index import CharacterIndex
+from commandlet_scheduler import (CommandletScheduler, DEFAULT_MAX_CONCURRENT, collect_character_outputs,
+                                  make_job)
+from thumbnail_cache import PREVIEW_CACHE_DIR, PreviewCache, copy_thumbnail
+from tree_sync import TreeviewSync
+
+# assets.info is rewritten once edits pause this long (each edit is journaled immediately)
+ASSETS_SAVE_DELAY_MS = 1000
+
 class ToolTip:
     """Simple tooltip for tkinter widgets."""
     def __init__(self, widget, text):
@@ -57,8 +67,13 @@ class CharacterCreatorGUI:
         # Settings panel toggle state
         self.settings_visible = False
 
-        # Assets info data
+        # Assets info data (self.assets_data is the store's entry list; edit it through self.assets_store)
         self.assets_data = []
+        self.assets_store = None
+        self._assets_save_job = None
+        self.character_index = None
+        self.character_rows = {}
+        self.preview_cache = None
 
         self.create_widgets()
 
@@ -76,7 +91,8 @@ class CharacterCreatorGUI:
 
         # Key bindings
         self.root.bind('<Escape>', lambda e: self.root.focus_set())
-        self.root.bind('<Control-s>', lambda e: self.assets_auto_save())
+        self.root.bind('<Control-s>', lambda e: self._assets_compact(force=True))
+        self.root.protocol('WM_DELETE_WINDOW', self.on_close)
 
     def create_widgets(self):
         # Main container
@@ -326,7 +342,7 @@ class CharacterCreatorGUI:
         """Request cancellation of bulk registration"""
         self._cancel_bulk = True
         self.bulk_btn.config(state=tk.DISABLED, text="취소 중...")
-        self.log_output("\n=== 취소 요청됨, 현재 작업 완료 후 중단합니다 ===")
+        self.log_output("\n=== 취소 요청됨, 실행 중인 커맨드렛 완료 후 중단합니다 ===")
 
     def _bulk_register_thread(self):
         """Background thread: build once, then per VRM: JSON → commandlet → verify → add entry"""
@@ -366,88 +382,54 @@ class CharacterCreatorGUI:
             failed = 0
             total = len(self.pending_vrm_files)
 
+            # --- Step 1: VRM별 JSON + 격리된 출력 폴더 (commandlet_scheduler.py) ---
+            from datetime import datetime
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            jobs = []
             for i, vrm_path in enumerate(self.pending_vrm_files):
-                if self._cancel_bulk:
-                    self.log_output(f"\n=== 취소됨 ({added}개 등록, {total - i}개 건너뜀) ===")
-                    break
-
                 stem = os.path.splitext(os.path.basename(vrm_path))[0]
-                display_name = stem[:12]
-
-                self.log_output(f"\n=== [{i+1}/{total}] {display_name} ===")
-
-                # --- Step 1: JSON 생성 ---
-                from datetime import datetime
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 json_data = {
                     "Gender": gender,
-                    "DisplayName": display_name,
+                    "DisplayName": stem[:12],
                     "ScalingMethod": scaling,
                     "ModelSourceType": source
                 }
-                json_file = os.path.join(output_folder, f"{display_name}_{timestamp}.json")
-                with open(json_file, 'w', encoding='utf-8') as f:
-                    json.dump(json_data, f, indent=2)
-                self.log_output(f"  1) JSON 생성: {os.path.basename(json_file)}")
-
-                # --- Step 2: 커맨드렛 실행 ---
-                # Snapshot output folder before commandlet
-                before_files = set(os.listdir(output_folder))
-
-                cmd = f'"{exe_path}" "{project_file}" -run=CinevCreateUserCharacter -UserCharacterJsonPath="{json_file}" -UserCharacterVrmPath="{vrm_path}" -OutputPath="{output_folder}" -stdout -nopause -unattended -AllowCommandletRendering -AllowCommandletAudio -RenderOffScreen'
-                self.log_output(f"  2) 커맨드렛 실행 중...\n     {cmd}")
-
-                process = subprocess.Popen(cmd, creationflags=subprocess.CREATE_NEW_CONSOLE)
-                process.wait()
-
-                self.log_output(f"     종료 코드: {process.returncode}")
-
-                # --- Step 3: 캐릭터 및 썸네일 확인 ---
-                after_files = set(os.listdir(output_folder))
-                new_files = after_files - before_files
-                new_characters = [f for f in new_files if f.endswith('.character')]
-                new_thumbnails = [f for f in new_files if f.lower().endswith(('.png', '.jpg', '.jpeg'))]
-
-                thumb_file = ""
-                if new_characters:
-                    char_file = new_characters[0]
-                    # .character를 UserCharacter 폴더로 이동
-                    src = os.path.join(output_folder, char_file)
-                    dst = os.path.join(user_char_folder, char_file)
-                    shutil.move(src, dst)
-                    self.log_output(f"  3) 캐릭터 이동: {char_file} → UserCharacter/")
-                    # thumb_{name}_01.png만 이동
-                    char_stem = os.path.splitext(char_file)[0]
-                    thumb_name = f"thumb_{char_stem}_01.png"
-                    thumb_src = os.path.join(output_folder, thumb_name)
-                    if os.path.exists(thumb_src):
-                        thumb_dst = os.path.join(user_char_folder, thumb_name)
-                        shutil.move(thumb_src, thumb_dst)
-                        thumb_file = thumb_name
-                        self.log_output(f"     썸네일 이동: {thumb_name}")
-                    else:
-                        self.log_output(f"     썸네일 없음: {thumb_name}")
-                else:
-                    # Fallback: use display_name
-                    char_file = f"{display_name}.character"
-                    self.log_output(f"  3) 새 파일 감지 안됨, 기본값 사용: {char_file}")
-
-                # --- Step 4: assets.info에 엔트리 추가 ---
-                preset_id = str(uuid.uuid4())
+                jobs.append(make_job(vrm_path, json_data, job_id=f"{i + 1:03d}_{stem}"))
+
+            # --- Step 2: 커맨드렛 병렬 실행 ---
+            work_root = os.path.join(output_folder, f"register_{timestamp}")
+            self.log_output(f"=== 커맨드렛 {total}개 실행 (동시 최대 {DEFAULT_MAX_CONCURRENT}개) ===")
+            self.log_output(f"  작업 폴더: {work_root}")
+            scheduler = CommandletScheduler(exe_path, project_file, work_root)
+            results = scheduler.run(jobs, progress=lambda message: self.log_output(f"  {message}"),
+                                    should_cancel=lambda: self._cancel_bulk)
+
+            # --- Step 3: 캐릭터 및 썸네일 이동, Step 4: assets.info 엔트리는 finish()에서 (메인 스레드) ---
+            new_entries = []
+            for job, result in zip(jobs, results):
+                display_name = job["json"]["DisplayName"]
+                if result["status"] == "cancelled":
+                    self.log_output(f"  {display_name}: 취소됨")
+                    continue
+                if result["status"] != "ok":
+                    failed += 1
+                    self.log_output(f"  {display_name}: 실패 ({result['status']}, {result['attempts']}회 시도)"
+                                    + (f" — 로그: {result['log']}" if result["log"] else ""))
+                    continue
+
+                char_file, thumb_file = collect_character_outputs(result, user_char_folder)
+                self.log_output(f"  {display_name}: {char_file} → UserCharacter/"
+                                + (f", 썸네일 {thumb_file}" if thumb_file else ", 썸네일 없음"))
                 new_entry = {
-                    "Preset_id": preset_id,
+                    "Preset_id": str(uuid.uuid4()),
                     "Gender": gender,
                     "DisplayName": display_name,
                     "CharacterFilePath": char_file,
                     "CategoryName": "CharacterCategory.VRM",
                     "ThumbnailFileName": thumb_file
                 }
-                self.assets_data.insert(0, new_entry)
+                new_entries.append(new_entry)
                 added += 1
-                self.log_output(f"  4) assets.info 등록 완료")
-
-                # Save after each cycle
-                self.root.after(0, self.assets_auto_save)
 
             # Update UI on main thread
             result_msg = f"{added}개 등록 완료"
@@ -455,7 +437,26 @@ class CharacterCreatorGUI:
                 result_msg += f", {failed}개 실패"
 
             def finish():
+                # Insert on the main thread: positions shift under the editor's selection
+                preset_id = self._selected_preset_id()
+                try:
+                    store = self._get_assets_store()
+                    if store is not None and store.folder == os.path.abspath(user_char_folder):
+                        for entry in new_entries:
+                            store.insert(0, entry)
+                    else:  # the folder was switched while registering
+                        store = AssetsStore(user_char_folder)
+                        store.load()
+                        for entry in new_entries:
+                            store.insert(0, entry)
+                        store.compact()
+                except Exception as e:
+                    self.log_output(f"assets.info 저장 실패: {str(e)}")
+                self._update_character_index()
                 self.assets_refresh_tree()
+                # Journaled per entry above; write assets.info once after the batch
+                self._assets_compact()
+                self._reselect_preset(preset_id)
                 self.pending_vrm_files = []
                 self.vrm_listbox.delete(0, tk.END)
                 self.vrm_count_label.config(text="선택된 파일 없음", fg='#999999')
@@ -514,6 +515,9 @@ class CharacterCreatorGUI:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         self.assets_tree.bind('<<TreeviewSelect>>', self.assets_on_select)
+        # Rows are keyed by entry identity; refreshes only touch inserted/changed/moved rows
+        self.assets_view = TreeviewSync(self.assets_tree, self._asset_row_values,
+                                        placeholder=('', '항목 없음', '', '', '', '', ''))
 
         self.selected_asset_idx = None
 
@@ -630,13 +634,20 @@ class CharacterCreatorGUI:
                 # Copy to UserCharacter folder
                 dest = os.path.join(user_char_folder, os.path.basename(path))
                 try:
-                    shutil.copy2(path, dest)
+                    copy_thumbnail(path, dest)
                     self.asset_thumbnail_var.set(os.path.basename(path))
                     self.log_output(f"썸네일 복사: {os.path.basename(path)}")
                 except Exception as e:
                     self.log_output(f"썸네일 복사 실패: {str(e)}")
                     self.asset_thumbnail_var.set(os.path.basename(path))
 
+    def _get_preview_cache(self, folder):
+        """Preview cache of the UserCharacter folder (<folder>/.thumb_cache, keyed by image content hash)"""
+        cache_dir = os.path.join(os.path.abspath(folder), PREVIEW_CACHE_DIR)
+        if self.preview_cache is None or self.preview_cache.cache_dir != cache_dir:
+            self.preview_cache = PreviewCache(cache_dir)
+        return self.preview_cache
+
     def _update_thumb_preview(self):
         """Update thumbnail preview image"""
         thumb_name = self.asset_thumbnail_var.get()
@@ -652,9 +663,8 @@ class CharacterCreatorGUI:
             return
         try:
             from PIL import Image, ImageTk
-            img = Image.open(thumb_path)
-            img.thumbnail((80, 80))
-            self._thumb_photo = ImageTk.PhotoImage(img)
+            with Image.open(self._get_preview_cache(user_char_folder).preview_path(thumb_path)) as img:
+                self._thumb_photo = ImageTk.PhotoImage(img)
             self._thumb_preview_label.config(image=self._thumb_photo, text="")
         except ImportError:
             self._thumb_preview_label.config(image='', text=f"[{thumb_name}]")
@@ -670,6 +680,25 @@ class CharacterCreatorGUI:
             return os.path.join(user_char_folder, "assets.info")
         return None
 
+    def _get_assets_store(self):
+        """Open (or reuse) the assets.info store of the current UserCharacter folder"""
+        folder = self.get_user_character_folder()
+        if not folder or not os.path.isdir(folder):
+            return None
+        if self.assets_store is not None and self.assets_store.folder != os.path.abspath(folder):
+            try:
+                self.assets_store.compact()  # flush the previous folder's pending edits
+            except Exception as e:
+                self.log_output(f"assets.info 저장 실패: {str(e)}")
+            self.assets_store = None
+        if self.assets_store is None:
+            self.assets_store = AssetsStore(folder)
+            recovered = self.assets_store.load()
+            self.assets_data = self.assets_store.entries
+            if recovered:
+                self.log_output(f"assets.info: 저장되지 않았던 변경 {recovered}개 복구 (저널)")
+        return self.assets_store
+
     def assets_load(self):
         """Load assets.info file"""
         path = self.get_assets_info_path()
@@ -681,67 +710,93 @@ class CharacterCreatorGUI:
             return
 
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                self.assets_data = json.load(f)
+            # Re-read only if assets.info changed on disk (pending edits are re-applied on top)
+            preset_id = self._selected_preset_id()
+            reloaded = self._get_assets_store().reload_external()
+            self._update_character_index()
             self.assets_refresh_tree()
+            if reloaded:
+                self._reselect_preset(preset_id)
             self.log_output(f"assets.info 로드: {len(self.assets_data)} 개")
         except Exception as e:
             self.log_output(f"assets.info 로드 실패: {str(e)}")
             messagebox.showerror("오류", "assets.info 로드에 실패했습니다. 출력 콘솔을 확인하세요.")
 
     def assets_auto_save(self):
-        """Auto-save assets.info after any change"""
-        path = self.get_assets_info_path()
-        if not path:
-            return
+        """Schedule writing assets.info after an edit.
+        Edits are already journaled; assets.info itself is rewritten once edits pause for ASSETS_SAVE_DELAY_MS.
+        """
+        if self._assets_save_job is not None:
+            self.root.after_cancel(self._assets_save_job)
+        self._assets_save_job = self.root.after(ASSETS_SAVE_DELAY_MS, self._assets_compact)
+
+    def _assets_compact(self, force=False):
+        """Fold the journal into assets.info (temp file + rename)"""
+        if self._assets_save_job is not None:
+            self.root.after_cancel(self._assets_save_job)
+            self._assets_save_job = None
+        store = self.assets_store
+        if store is None:
+            return None
+        preset_id = self._selected_preset_id()
         try:
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(self.assets_data, f, indent=2, ensure_ascii=False)
-            self.log_output(f"assets.info 자동 저장 ({len(self.assets_data)}개)")
+            result = store.compact(force)
+        except Exception as e:
+            self.log_output(f"자동 저장 실패: {str(e)}")
+            return None
+        if result["external"]:
+            self.log_output("assets.info가 다른 프로그램에서 변경됨 → 다시 읽고 편집 내용을 병합했습니다")
+            self.assets_refresh_tree()
+            self._reselect_preset(preset_id)
+        if result["written"]:
+            self.log_output(f"assets.info 자동 저장 ({result['entries']}개, 변경 {result['ops']}건)")
             # Flash count label to confirm save
             self.assets_count_label.config(text="저장됨", fg='#00AA00')
             self.root.after(2000, lambda: self.assets_count_label.config(
                 text=f"{len(self.assets_data)} 개", fg='#666666'))
-        except Exception as e:
-            self.log_output(f"자동 저장 실패: {str(e)}")
+        return result
 
     def assets_save(self):
         """Save assets.info file"""
         path = self.get_assets_info_path()
-        if not path:
+        if not path or self._get_assets_store() is None:
             messagebox.showerror("오류", "프로젝트 파일을 먼저 설정하세요.")
             return
 
-        try:
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(self.assets_data, f, indent=2, ensure_ascii=False)
-            self.log_output(f"assets.info 저장: {len(self.assets_data)} 개")
-            messagebox.showinfo("완료", f"assets.info 저장 완료!\n{path}")
-        except Exception as e:
-            messagebox.showerror("오류", f"assets.info 저장 실패:\n{str(e)}")
+        result = self._assets_compact(force=True)
+        if result is None:
+            messagebox.showerror("오류", "assets.info 저장 실패: 출력 콘솔을 확인하세요.")
+            return
+        self.log_output(f"assets.info 저장: {len(self.assets_data)} 개")
+        messagebox.showinfo("완료", f"assets.info 저장 완료!\n{path}")
+
+    def on_close(self):
+        """Write pending assets.info edits before closing"""
+        self._assets_compact()
+        self.root.destroy()
+
+    def _asset_row_values(self, entry):
+        """Treeview column values of one assets.info entry"""
+        # ScalingMethod / ModelSourceType는 .character에만 있으므로 인덱스 캐시에서 채움
+        char_row = self.character_rows.get(entry.get('CharacterFilePath', '')) or {}
+        preset_id = entry.get('Preset_id', '')
+        short_id = preset_id[:8] + '...' if len(preset_id) > 12 else preset_id
+        return (
+            short_id,
+            entry.get('CharacterFilePath', ''),
+            entry.get('CategoryName', ''),
+            entry.get('DisplayName', ''),
+            entry.get('Gender', ''),
+            entry.get('ScalingMethod') or char_row.get('scaling_method') or '',
+            entry.get('ModelSourceType') or char_row.get('model_source_type') or '',
+        )
 
     def assets_refresh_tree(self):
-        """Refresh the treeview with current data"""
-        self.assets_tree.delete(*self.assets_tree.get_children())
-        for i, entry in enumerate(self.assets_data):
-            preset_id = entry.get('Preset_id', '')
-            short_id = preset_id[:8] + '...' if len(preset_id) > 12 else preset_id
-            self.assets_tree.insert('', tk.END, iid=str(i), values=(
-                short_id,
-                entry.get('CharacterFilePath', ''),
-                entry.get('CategoryName', ''),
-                entry.get('DisplayName', ''),
-                entry.get('Gender', ''),
-                entry.get('ScalingMethod', ''),
-                entry.get('ModelSourceType', ''),
-            ))
+        """Refresh the treeview with current data (only rows that changed are touched)"""
+        self.assets_view.sync(self.assets_data)
         self.assets_count_label.config(text=f"{len(self.assets_data)} 개")
 
-        # Empty state guidance
         if not self.assets_data:
-            self.assets_tree.insert('', tk.END, iid='empty_placeholder', values=(
-                '', '항목 없음', '', '', '', '', ''
-            ))
             self.assets_apply_btn.config(state=tk.DISABLED)
             self.assets_delete_btn.config(state=tk.DISABLED)
             self.move_up_btn.config(state=tk.DISABLED)
@@ -749,58 +804,15 @@ class CharacterCreatorGUI:
 
     @staticmethod
     def read_character_metadata(char_path):
-        """Read metadata JSON embedded in a .character file (after binary header)"""
-        with open(char_path, 'rb') as f:
-            data = f.read()
-        idx = data.find(b'{')
-        if idx < 0:
-            return None
-        depth = 0
-        end = idx
-        for i in range(idx, len(data)):
-            if data[i:i+1] == b'{':
-                depth += 1
-            elif data[i:i+1] == b'}':
-                depth -= 1
-                if depth == 0:
-                    end = i + 1
-                    break
-        json_str = data[idx:end].decode('utf-8', errors='replace')
-        return json.loads(json_str)
+        """Read metadata JSON embedded in a .character file (section table only, VRM payload is skipped)"""
+        return read_character_metadata(char_path)
 
     @staticmethod
     def write_character_metadata(char_path, updates):
         """Update metadata JSON embedded in a .character file.
-        Format: [len][header] [len][meta_json] [len][vrm_name] [len][vrm_data] [len][thumb]
-        Must rewrite with correct length prefixes.
+        Rewrites to a temp file and renames it over the original; VRM/thumbnail sections are copied file-to-file.
         """
-        with open(char_path, 'rb') as f:
-            data = f.read()
-        pos = 0
-
-        def read_section(p):
-            length = struct.unpack('<I', data[p:p+4])[0]
-            return data[p+4:p+4+length], p + 4 + length
-
-        header, pos = read_section(pos)
-        meta_bytes, pos = read_section(pos)
-        vrm_name, pos = read_section(pos)
-        vrm_data, pos = read_section(pos)
-        thumb_data, pos = read_section(pos)
-
-        # Parse and update metadata
-        meta_str = meta_bytes.decode('utf-8', errors='replace').rstrip()
-        meta = json.loads(meta_str)
-        meta.update(updates)
-        new_meta_json = json.dumps(meta, indent='\t', ensure_ascii=False)
-        new_meta_json = new_meta_json.replace('\n', '\r\n') + ' '
-        new_meta_bytes = new_meta_json.encode('utf-8')
-
-        # Rewrite with correct length prefixes
-        with open(char_path, 'wb') as f:
-            for section in (header, new_meta_bytes, vrm_name, vrm_data, thumb_data):
-                f.write(struct.pack('<I', len(section)))
-                f.write(section)
+        update_character_metadata(char_path, updates)
         return True
 
     def _get_character_file_path(self, char_filename):
@@ -811,12 +823,96 @@ class CharacterCreatorGUI:
         full_path = os.path.join(user_char_folder, char_filename)
         return full_path if os.path.exists(full_path) else None
 
+    def _get_character_index(self):
+        """Open (or reuse) the library index of the current UserCharacter folder"""
+        folder = self.get_user_character_folder()
+        if not folder or not os.path.isdir(folder):
+            return None
+        if self.character_index is not None and self.character_index.folder != os.path.abspath(folder):
+            self.character_index.close()
+            self.character_index = None
+            self.character_rows = {}
+        if self.character_index is None:
+            try:
+                self.character_index = CharacterIndex(folder)
+            except Exception as e:
+                self.log_output(f"캐릭터 인덱스 열기 실패: {str(e)}")
+                return None
+        return self.character_index
+
+    def _update_character_index(self):
+        """Re-read new/changed .character files into the index (unchanged files are skipped by size/mtime)"""
+        index = self._get_character_index()
+        if index is None:
+            return
+        try:
+            stats = index.update()
+            self.character_rows = index.all()
+        except Exception as e:
+            self.log_output(f"캐릭터 인덱스 갱신 실패: {str(e)}")
+            return
+        if stats['read'] or stats['removed']:
+            self.log_output(f"캐릭터 인덱스: {stats['total']}개 ({stats['read']}개 갱신, {stats['removed']}개 삭제)")
+
+    def _lookup_character_metadata(self, char_path):
+        """Metadata of a .character from the index (file is re-read only if it changed on disk)"""
+        index = self._get_character_index()
+        if index is None or os.path.dirname(os.path.abspath(char_path)) != index.folder:
+            return self.read_character_metadata(char_path)
+        row = index.get(os.path.basename(char_path))
+        if row is None:
+            return None
+        if row['error']:
+            raise ValueError(row['error'])
+        self.character_rows[row['file']] = row
+        return row['metadata']
+
     def _get_selected_indices(self):
         """Get sorted list of selected indices from treeview"""
-        selection = self.assets_tree.selection()
-        if not selection:
-            return []
-        return sorted(int(s) for s in selection if s != 'empty_placeholder')
+        return self.assets_view.selected_indices()
+
+    def _selected_preset_id(self):
+        """Preset_id of the entry in the edit form (None if nothing is selected)"""
+        idx = self.selected_asset_idx
+        if idx is None or idx >= len(self.assets_data):
+            return None
+        return self.assets_data[idx].get('Preset_id') or None
+
+    def _reselect_preset(self, preset_id):
+        """After entries shifted (assets.info re-read, new registrations), select the edited preset again by Preset_id.
+        Positions may have shifted, so selected_asset_idx is never reused as-is; if the preset is gone
+        (or had no id) the selection and edit form are cleared so Apply cannot hit another entry.
+        """
+        idx = next((i for i, e in enumerate(self.assets_data) if preset_id and e.get('Preset_id') == preset_id), None)
+        if idx is None:
+            self.selected_asset_idx = None
+            if self.assets_tree.selection():
+                self.assets_tree.selection_remove(*self.assets_tree.selection())
+            self._clear_edit_form()
+            self.assets_apply_btn.config(state=tk.DISABLED)
+            self.assets_delete_btn.config(state=tk.DISABLED)
+            self.move_up_btn.config(state=tk.DISABLED)
+            self.move_down_btn.config(state=tk.DISABLED)
+            return
+        self.assets_tree.selection_set(self.assets_view.iid(idx))
+        self.assets_tree.see(self.assets_view.iid(idx))
+        self.assets_on_select(None)
+
+    def _clear_edit_form(self):
+        """Clear all edit form fields"""
+        self._populating_form = True
+        self.asset_preset_id_var.set('')
+        self.asset_char_file_var.set('')
+        self.asset_category_var.set('')
+        self.asset_display_name_var.set('')
+        self.asset_gender_var.set('')
+        self.asset_thumbnail_var.set('')
+        self.asset_scaling_var.set('')
+        self.asset_source_var.set('')
+        self._char_meta_original = {}
+        self._populating_form = False
+        self._thumb_preview_label.config(image='', text="(썸네일 미리보기)")
+        self._thumb_photo = None
 
     def assets_on_select(self, event):
         """Handle treeview selection - populate edit form, read .character for metadata"""
@@ -848,7 +944,7 @@ class CharacterCreatorGUI:
         char_path = self._get_character_file_path(entry.get('CharacterFilePath', ''))
         if char_path:
             try:
-                meta = self.read_character_metadata(char_path)
+                meta = self._lookup_character_metadata(char_path)
                 if meta:
                     dn = meta.get('displayName', meta.get('DisplayName', ''))
                     sc = meta.get('scalingMethod', meta.get('ScalingMethod', ''))
@@ -915,12 +1011,14 @@ class CharacterCreatorGUI:
             return
         idx = self.selected_asset_idx
 
-        self.assets_data[idx]['Preset_id'] = self.asset_preset_id_var.get()
-        self.assets_data[idx]['Gender'] = self.asset_gender_var.get()
-        self.assets_data[idx]['DisplayName'] = self.asset_display_name_var.get()
-        self.assets_data[idx]['CharacterFilePath'] = self.asset_char_file_var.get()
-        self.assets_data[idx]['CategoryName'] = self.asset_category_var.get()
-        self.assets_data[idx]['ThumbnailFileName'] = self.asset_thumbnail_var.get()
+        self.assets_store.update(idx, {
+            'Preset_id': self.asset_preset_id_var.get(),
+            'Gender': self.asset_gender_var.get(),
+            'DisplayName': self.asset_display_name_var.get(),
+            'CharacterFilePath': self.asset_char_file_var.get(),
+            'CategoryName': self.asset_category_var.get(),
+            'ThumbnailFileName': self.asset_thumbnail_var.get(),
+        })
         # ScalingMethod, ModelSourceType → .character 파일에만 기록 (assets.info에는 저장하지 않음)
 
         # Write metadata back to .character file
@@ -946,8 +1044,8 @@ class CharacterCreatorGUI:
         }
 
         self.assets_refresh_tree()
-        self.assets_tree.selection_set(str(idx))
-        self.assets_tree.see(str(idx))
+        self.assets_tree.selection_set(self.assets_view.iid(idx))
+        self.assets_tree.see(self.assets_view.iid(idx))
         self.assets_auto_save()
         self.assets_apply_btn.config(state=tk.DISABLED)
 
@@ -957,12 +1055,12 @@ class CharacterCreatorGUI:
         if not indices or indices[0] <= 0:
             return
         for idx in indices:
-            self.assets_data[idx], self.assets_data[idx - 1] = self.assets_data[idx - 1], self.assets_data[idx]
+            self.assets_store.move(idx, idx - 1)
         new_indices = [i - 1 for i in indices]
         self.assets_refresh_tree()
         for i in new_indices:
-            self.assets_tree.selection_add(str(i))
-        self.assets_tree.see(str(new_indices[0]))
+            self.assets_tree.selection_add(self.assets_view.iid(i))
+        self.assets_tree.see(self.assets_view.iid(new_indices[0]))
         self.selected_asset_idx = new_indices[-1]
         self.assets_auto_save()
 
@@ -972,17 +1070,21 @@ class CharacterCreatorGUI:
         if not indices or indices[-1] >= len(self.assets_data) - 1:
             return
         for idx in reversed(indices):
-            self.assets_data[idx], self.assets_data[idx + 1] = self.assets_data[idx + 1], self.assets_data[idx]
+            self.assets_store.move(idx, idx + 1)
         new_indices = [i + 1 for i in indices]
         self.assets_refresh_tree()
         for i in new_indices:
-            self.assets_tree.selection_add(str(i))
-        self.assets_tree.see(str(new_indices[-1]))
+            self.assets_tree.selection_add(self.assets_view.iid(i))
+        self.assets_tree.see(self.assets_view.iid(new_indices[-1]))
         self.selected_asset_idx = new_indices[-1]
         self.assets_auto_save()
 
     def assets_add_entry(self):
         """Add a new entry to assets data"""
+        store = self._get_assets_store()
+        if store is None:
+            messagebox.showerror("오류", "프로젝트 파일을 먼저 설정하세요.")
+            return
         preset_id = str(uuid.uuid4())
         new_entry = {
             "Preset_id": preset_id,
@@ -992,10 +1094,10 @@ class CharacterCreatorGUI:
             "CategoryName": "CharacterCategory.VRM",
             "ThumbnailFileName": f"{preset_id}.png"
         }
-        self.assets_data.append(new_entry)
+        store.insert(len(self.assets_data), new_entry)
         self.assets_refresh_tree()
         # Select the new entry
-        new_idx = str(len(self.assets_data) - 1)
+        new_idx = self.assets_view.iid(len(self.assets_data) - 1)
         self.assets_tree.selection_set(new_idx)
         self.assets_tree.see(new_idx)
         self.assets_on_select(None)
@@ -1016,19 +1118,9 @@ class CharacterCreatorGUI:
 
         if messagebox.askyesno("삭제 확인", msg):
             self.selected_asset_idx = None
-            self._populating_form = True
-            self.asset_preset_id_var.set("")
-            self.asset_char_file_var.set("")
-            self.asset_category_var.set("")
-            self.asset_display_name_var.set("")
-            self.asset_gender_var.set("")
-            self.asset_thumbnail_var.set("")
-            self.asset_scaling_var.set("")
-            self.asset_source_var.set("")
-            self._char_meta_original = {}
-            self._populating_form = False
+            self._clear_edit_form()
             for idx in reversed(indices):
-                self.assets_data.pop(idx)
+                self.assets_store.delete(idx)
             self.assets_refresh_tree()
             self.assets_auto_save()
             self.assets_apply_btn.config(state=tk.DISABLED)
@@ -1076,8 +1168,8 @@ class CharacterCreatorGUI:
         path = self.get_assets_info_path()
         if path and os.path.exists(path):
             try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    self.assets_data = json.load(f)
+                self._get_assets_store()
+                self._update_character_index()
                 self.assets_refresh_tree()
             except Exception:
                 pass
@@ -0,0 +1,299 @@
+"""
+.character 컨테이너 읽기/쓰기 — 섹션 길이만 읽고 VRM 페이로드는 건너뜀
+
+Layout (little-endian uint32 length prefix + section bytes, 5 sections in order):
+    [len][header]     b"CINEV_CHAR_V1\\0"
+    [len][metadata]   UTF-8 JSON (UE FBufferArchive: CRLF + trailing space)
+    [len][vrm_name]   UTF-8 file name + \\0
+    [len][vrm]        VRM (glTF binary) payload
+    [len][thumbnail]  PNG
+
+Opening a file reads 5 x 4 bytes of length prefixes (plus the small header);
+metadata, VRM name and thumbnail are read on first access, the VRM payload never.
+
+Writes go to a temp file in the same folder and are renamed over the target,
+so a crash never leaves a half-written .character. The VRM payload is copied
+file-to-file (copy_file_range / sendfile where the OS has them, 1 MB chunks
+otherwise) instead of being loaded into Python.
+
+모듈 간 import 금지 규칙 때문에 vroid_character_creator/character_file.py 에 같은
+파일이 복사되어 있음 — 수정 시 두 파일을 함께 맞출 것.
+
+Usage:
+    from character_file import (CharacterFile, read_character_metadata,
+                                write_character_file, update_character_metadata)
+
+    meta = read_character_metadata("Alice.character")
+    with CharacterFile("Alice.character") as char:
+        char.vrm_name, char.vrm_size, char.thumbnail
+
+    write_character_file("Alice.character", "Alice.vrm", {"displayName": "Alice"}, thumb_png)
+    update_character_metadata("Alice.character", {"displayName": "Alice 2"})
+    update_character_thumbnail("Alice.character", thumb_png)
+"""
+
+import json
+import os
+import shutil
+import struct
+import tempfile
+from functools import cached_property
+
+HEADER_MAGIC = b"CINEV_CHAR_V1\x00"
+SECTION_NAMES = ("header", "metadata", "vrm_name", "vrm", "thumbnail")
+_LEN = struct.Struct("<I")
+_CHUNK_SIZE = 1 << 20
+_UMASK = os.umask(0)  # os.umask can only be read by setting it; restored on the next line
+os.umask(_UMASK)
+
+
+def read_section_table(f):
+    """Walk the length prefixes of an open .character file.
+
+    Returns:
+        dict: section name -> (payload offset, payload length)
+
+    Raises:
+        ValueError: Not a .character file, or a section runs past the end
+    """
+    f.seek(0, os.SEEK_END)
+    file_size = f.tell()
+    table = {}
+    pos = 0
+    for name in SECTION_NAMES:
+        f.seek(pos)
+        prefix = f.read(4)
+        if len(prefix) < 4:
+            raise ValueError(f"Truncated .character file (missing {name} section)")
+        length = _LEN.unpack(prefix)[0]
+        if pos + 4 + length > file_size:
+            raise ValueError(f"Truncated .character file ({name} section runs past end)")
+        table[name] = (pos + 4, length)
+        if name == "header":
+            magic = f.read(min(length, 64))
+            if magic != HEADER_MAGIC:
+                raise ValueError("Not a .character file (bad header)")
+        pos += 4 + length
+    return table
+
+
+def decode_metadata(meta_bytes):
+    """Metadata section bytes -> dict (UE writes CRLF + trailing space)."""
+    return json.loads(meta_bytes.decode("utf-8", errors="replace").rstrip())
+
+
+def encode_metadata(metadata):
+    """dict -> metadata section bytes in UE FBufferArchive style (tabs, CRLF + trailing space)."""
+    meta_json = json.dumps(metadata, indent="\t", ensure_ascii=False)
+    return (meta_json.replace("\n", "\r\n") + " ").encode("utf-8")
+
+
+class CharacterFile:
+    """Section-indexed view of a .character file. Usable as a context manager."""
+
+    def __init__(self, path):
+        self.path = path
+        self._f = open(path, "rb")
+        try:
+            self.sections = read_section_table(self._f)
+        except Exception:
+            self._f.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._f.close()
+
+    def read_section(self, name):
+        """Raw bytes of one section."""
+        offset, length = self.sections[name]
+        self._f.seek(offset)
+        return self._f.read(length)
+
+    @cached_property
+    def metadata(self):
+        return decode_metadata(self.read_section("metadata"))
+
+    @cached_property
+    def vrm_name(self):
+        return self.read_section("vrm_name").rstrip(b"\x00").decode("utf-8", errors="replace")
+
+    @cached_property
+    def thumbnail(self):
+        return self.read_section("thumbnail")
+
+    @property
+    def vrm_size(self):
+        return self.sections["vrm"][1]
+
+
+def read_character_metadata(char_path):
+    """Metadata dict of a .character file (reads only the prefixes and the JSON section)."""
+    with CharacterFile(char_path) as char:
+        return char.metadata
+
+
+# ── Writing ──
+
+def _copy_range(src_fd, dst_fd, offset, length):
+    """Append length bytes of src_fd starting at offset to dst_fd's current position.
+
+    Tries copy_file_range (kernel-side, can reflink), then sendfile, then a chunked copy.
+    """
+    remaining = length
+    if hasattr(os, "copy_file_range"):
+        try:
+            while remaining:
+                n = os.copy_file_range(src_fd, dst_fd, remaining, offset)
+                if n == 0:
+                    break
+                offset += n
+                remaining -= n
+        except OSError:
+            pass  # EXDEV / ENOSYS / EINVAL on older kernels or some filesystems
+    if remaining and hasattr(os, "sendfile"):
+        try:
+            while remaining:
+                n = os.sendfile(dst_fd, src_fd, offset, remaining)
+                if n == 0:
+                    break
+                offset += n
+                remaining -= n
+        except OSError:
+            pass  # macOS sendfile needs a socket destination
+    if remaining:
+        os.lseek(src_fd, offset, os.SEEK_SET)
+        while remaining:
+            chunk = os.read(src_fd, min(_CHUNK_SIZE, remaining))
+            if not chunk:
+                raise ValueError("Source ended before the expected section length")
+            _write_all(dst_fd, chunk)
+            remaining -= len(chunk)
+
+
+def _write_all(fd, data):
+    view = memoryview(data)
+    while view:
+        n = os.write(fd, view)
+        view = view[n:]
+
+
+def _write_section(fd, payload):
+    _write_all(fd, _LEN.pack(len(payload)))
+    _write_all(fd, payload)
+
+
+def _atomic_write(target_path, write_body, copy_stat_from=None):
+    """Run write_body(fd) against a temp file next to target_path, then rename it over the target."""
+    folder = os.path.dirname(os.path.abspath(target_path))
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=".", suffix=".tmp")
+    try:
+        write_body(fd)
+        os.fsync(fd)
+        os.close(fd)
+        fd = None
+        if copy_stat_from:
+            shutil.copystat(copy_stat_from, tmp_path)
+        elif os.path.exists(target_path):
+            shutil.copymode(target_path, tmp_path)
+        else:
+            # mkstemp creates 0600; give new files the mode open(..., "wb") would have
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, target_path)
+    except BaseException:
+        if fd is not None:
+            os.close(fd)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _tee_copy(src_fd, dst_fds, length):
+    """Read src_fd once in chunks from its current position and write every chunk to all dst_fds."""
+    remaining = length
+    while remaining:
+        chunk = os.read(src_fd, min(_CHUNK_SIZE, remaining))
+        if not chunk:
+            raise ValueError("Source ended before the expected section length")
+        for fd in dst_fds:
+            _write_all(fd, chunk)
+        remaining -= len(chunk)
+
+
+def write_character_file(output_path, vrm_path, metadata, thumb_data, vrm_name=None, vrm_copy_path=None):
+    """Create a .character from a VRM file without loading the VRM into memory.
+
+    Args:
+        output_path: .character to create (replaced atomically if it exists)
+        vrm_path: Source VRM, streamed into the vrm section
+        metadata: dict for the metadata section
+        thumb_data: PNG bytes for the thumbnail section
+        vrm_name: Name stored in the vrm_name section (default: basename of vrm_path)
+        vrm_copy_path: Also write a copy of the VRM here (atomically), from the same single read
+    """
+    name_bytes = (vrm_name or os.path.basename(vrm_path)).encode("utf-8") + b"\x00"
+    meta_bytes = encode_metadata(metadata)
+
+    with open(vrm_path, "rb") as src:
+        vrm_size = os.fstat(src.fileno()).st_size
+
+        def body(fd):
+            _write_section(fd, HEADER_MAGIC)
+            _write_section(fd, meta_bytes)
+            _write_section(fd, name_bytes)
+            _write_all(fd, _LEN.pack(vrm_size))
+            if vrm_copy_path is None:
+                _copy_range(src.fileno(), fd, 0, vrm_size)
+            else:
+                _atomic_write(vrm_copy_path, lambda copy_fd: _tee_copy(src.fileno(), (fd, copy_fd), vrm_size),
+                              copy_stat_from=vrm_path)
+            _write_section(fd, thumb_data)
+
+        _atomic_write(output_path, body)
+
+
+def update_character_metadata(char_path, updates):
+    """Merge updates into a .character's metadata; VRM and thumbnail are copied file-to-file.
+
+    Returns:
+        dict: the new metadata
+    """
+    with CharacterFile(char_path) as char:
+        meta = dict(char.metadata)
+        meta.update(updates)
+        header = char.read_section("header")
+        name_bytes = char.read_section("vrm_name")
+        # vrm + thumbnail sections (with their length prefixes) are one contiguous tail
+        tail_start = char.sections["vrm"][0] - 4
+        thumb_offset, thumb_length = char.sections["thumbnail"]
+        tail_length = thumb_offset + thumb_length - tail_start
+    meta_bytes = encode_metadata(meta)
+
+    def body(fd):
+        _write_section(fd, header)
+        _write_section(fd, meta_bytes)
+        _write_section(fd, name_bytes)
+        # source is closed again before the rename (Windows cannot replace an open file)
+        with open(char_path, "rb") as src:
+            _copy_range(src.fileno(), fd, tail_start, tail_length)
+
+    _atomic_write(char_path, body)
+    return meta
+
+
+def update_character_thumbnail(char_path, thumb_data):
+    """Replace a .character's thumbnail section; everything before it is copied file-to-file."""
+    with CharacterFile(char_path) as char:
+        head_length = char.sections["thumbnail"][0] - 4
+
+    def body(fd):
+        with open(char_path, "rb") as src:
+            _copy_range(src.fileno(), fd, 0, head_length)
+        _write_section(fd, thumb_data)
+
+    _atomic_write(char_path, body)
@@ -0,0 +1,239 @@
+"""
+UserCharacter 라이브러리 인덱스 — .character 메타데이터를 SQLite에 캐시
+
+Per .character file the index keeps its stat (size, mtime), the metadata JSON,
+the indexed fields (display name, gender, scaling method, model source type),
+the VRM name/size and a SHA-1 of the embedded thumbnail. update() re-reads only
+files whose size/mtime changed (section table + small sections, never the VRM
+payload), so opening a folder with thousands of characters is one scandir plus
+one SELECT. Lookups by file name stat the file and fall back to a re-read only
+when it changed.
+
+The database lives next to the characters (<UserCharacter>/.character_index.sqlite).
+
+모듈 간 import 금지 규칙 때문에 vroid_character_creator/character_index.py 에 같은
+파일이 복사되어 있음 — 수정 시 두 파일을 함께 맞출 것.
+
+Usage:
+    with CharacterIndex(user_char_folder) as index:
+        index.update()
+        index.search(gender="Female", source_type="VRoid", name="alice")
+        index.metadata("Alice.character")
+
+    python character_index.py <UserCharacter> [--gender Female] [--source VRoid] [--name alice]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+
+from character_file import CharacterFile
+
+CHARACTER_EXTENSION = ".character"
+DEFAULT_DB_NAME = ".character_index.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS characters (
+    file              TEXT PRIMARY KEY,
+    size              INTEGER NOT NULL,
+    mtime_ns          INTEGER NOT NULL,
+    display_name      TEXT,
+    gender            TEXT,
+    scaling_method    TEXT,
+    model_source_type TEXT,
+    vrm_name          TEXT,
+    vrm_size          INTEGER,
+    thumb_hash        TEXT,
+    thumb_size        INTEGER,
+    metadata          TEXT,
+    error             TEXT
+);
+CREATE INDEX IF NOT EXISTS characters_gender ON characters (gender COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS characters_source ON characters (model_source_type COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS characters_name ON characters (display_name COLLATE NOCASE);
+"""
+
+_COLUMNS = ("file", "size", "mtime_ns", "display_name", "gender", "scaling_method", "model_source_type",
+            "vrm_name", "vrm_size", "thumb_hash", "thumb_size", "metadata", "error")
+
+
+def _meta_field(meta, key):
+    """UE writes camelCase keys; older files used PascalCase."""
+    return meta.get(key, meta.get(key[0].upper() + key[1:], ""))
+
+
+def read_character_row(path, st=None):
+    """Index row for one .character file (error set instead if unreadable)."""
+    st = st or os.stat(path)
+    row = {"file": os.path.basename(path), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    try:
+        with CharacterFile(path) as char:
+            meta = char.metadata
+            thumb = char.thumbnail
+            row.update(
+                display_name=_meta_field(meta, "displayName"),
+                gender=_meta_field(meta, "gender"),
+                scaling_method=_meta_field(meta, "scalingMethod"),
+                model_source_type=_meta_field(meta, "modelSourceType"),
+                vrm_name=char.vrm_name,
+                vrm_size=char.vrm_size,
+                thumb_hash=hashlib.sha1(thumb).hexdigest(),
+                thumb_size=len(thumb),
+                metadata=json.dumps(meta, ensure_ascii=False),
+            )
+    except (OSError, ValueError) as e:
+        row["error"] = str(e)
+    return row
+
+
+def _to_dict(row):
+    row = dict(row)
+    row["metadata"] = json.loads(row["metadata"]) if row["metadata"] else {}
+    return row
+
+
+class CharacterIndex:
+    """SQLite-backed index of a UserCharacter folder. Usable as a context manager."""
+
+    def __init__(self, folder, db_path=None):
+        self.folder = os.path.abspath(folder)
+        self.db_path = db_path or os.path.join(self.folder, DEFAULT_DB_NAME)
+        self._db = sqlite3.connect(self.db_path)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._db.close()
+
+    def _store(self, row):
+        self._db.execute(
+            f"INSERT OR REPLACE INTO characters ({', '.join(_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+            [row.get(c) for c in _COLUMNS])
+
+    def update(self):
+        """
+        Re-read new or changed .character files and drop rows for deleted ones.
+
+        Returns:
+            dict with counts: total, read, unchanged, removed, failed
+        """
+        known = {row["file"]: (row["size"], row["mtime_ns"])
+                 for row in self._db.execute("SELECT file, size, mtime_ns FROM characters")}
+        stats = {"total": 0, "read": 0, "unchanged": 0, "removed": 0, "failed": 0}
+        seen = set()
+        with os.scandir(self.folder) as it:
+            for entry in it:
+                if not entry.name.lower().endswith(CHARACTER_EXTENSION) or not entry.is_file():
+                    continue
+                st = entry.stat()
+                seen.add(entry.name)
+                stats["total"] += 1
+                if known.get(entry.name) == (st.st_size, st.st_mtime_ns):
+                    stats["unchanged"] += 1
+                    continue
+                row = read_character_row(entry.path, st)
+                self._store(row)
+                stats["read"] += 1
+                stats["failed"] += "error" in row
+
+        gone = [name for name in known if name not in seen]
+        self._db.executemany("DELETE FROM characters WHERE file = ?", [(name,) for name in gone])
+        stats["removed"] = len(gone)
+        self._db.commit()
+        return stats
+
+    def get(self, file_name):
+        """
+        Row for one .character file, re-read first if it changed on disk.
+
+        Returns:
+            dict (metadata decoded) or None if the file does not exist
+        """
+        path = os.path.join(self.folder, file_name)
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._db.execute("DELETE FROM characters WHERE file = ?", (file_name,))
+            self._db.commit()
+            return None
+        row = self._db.execute("SELECT * FROM characters WHERE file = ?", (file_name,)).fetchone()
+        if row is None or (row["size"], row["mtime_ns"]) != (st.st_size, st.st_mtime_ns):
+            self._store(read_character_row(path, st))
+            self._db.commit()
+            row = self._db.execute("SELECT * FROM characters WHERE file = ?", (file_name,)).fetchone()
+        return _to_dict(row)
+
+    def metadata(self, file_name):
+        """Metadata dict of one .character file (None if missing or unreadable)."""
+        row = self.get(file_name)
+        if row is None or row["error"]:
+            return None
+        return row["metadata"]
+
+    def all(self):
+        """{file name: row} for every indexed file."""
+        return {row["file"]: _to_dict(row) for row in self._db.execute("SELECT * FROM characters")}
+
+    def search(self, gender=None, source_type=None, name=None, vrm_name=None):
+        """
+        Filter indexed characters (case-insensitive; name is a substring match on display name).
+
+        Returns:
+            list of row dicts ordered by display name
+        """
+        clauses, params = ["error IS NULL"], []
+        if gender:
+            clauses.append("gender = ? COLLATE NOCASE")
+            params.append(gender)
+        if source_type:
+            clauses.append("model_source_type = ? COLLATE NOCASE")
+            params.append(source_type)
+        if name:
+            escaped = name.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            clauses.append("display_name LIKE ? ESCAPE '\\'")
+            params.append(f"%{escaped}%")
+        if vrm_name:
+            clauses.append("vrm_name = ? COLLATE NOCASE")
+            params.append(vrm_name)
+        sql = f"SELECT * FROM characters WHERE {' AND '.join(clauses)} ORDER BY display_name COLLATE NOCASE, file"
+        return [_to_dict(row) for row in self._db.execute(sql, params)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Index and search .character files in a UserCharacter folder")
+    parser.add_argument("folder", help="UserCharacter folder")
+    parser.add_argument("--gender", help="Filter by gender (Female/Male)")
+    parser.add_argument("--source", help="Filter by model source type (VRM/VRoid/...)")
+    parser.add_argument("--name", help="Substring of the display name")
+    parser.add_argument("--db", help=f"Index database (default: <folder>/{DEFAULT_DB_NAME})")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.folder):
+        print(f"ERROR: Folder not found: {args.folder}")
+        sys.exit(1)
+
+    with CharacterIndex(args.folder, args.db) as index:
+        start = time.perf_counter()
+        stats = index.update()
+        print(f"Indexed {stats['total']} character(s) in {time.perf_counter() - start:.2f}s "
+              f"({stats['read']} read, {stats['unchanged']} unchanged, {stats['removed']} removed, "
+              f"{stats['failed']} unreadable)")
+        for row in index.search(args.gender, args.source, args.name):
+            print(f"  {row['file']}\t{row['display_name']}\t{row['gender']}\t{row['model_source_type']}\t"
+                  f"{row['vrm_name']} ({row['vrm_size'] / (1024 * 1024):.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
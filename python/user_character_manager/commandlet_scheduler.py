@@ -0,0 +1,292 @@
+"""
+Concurrent commandlet scheduler — CinevCreateUserCharacter 커맨드렛을 N개 병렬 실행
+
+Each job gets its own folder under the batch work root:
+    <work_root>/<job_id>/
+        input.json      commandlet JSON (Gender, DisplayName, ScalingMethod, ModelSourceType)
+        attempt_<n>/    -OutputPath of attempt n (starts empty)
+        attempt_<n>.log commandlet stdout/stderr
+        result.json     manifest written by the scheduler when the job ends
+
+Outputs are whatever appears in the attempt folder, so concurrent instances never
+see each other's files (no before/after listdir diff on a shared folder). An attempt
+succeeds when it produced a .character; attempts that time out (process tree killed),
+crash or produce nothing are retried up to `retries` times.
+
+New instances start only while fewer than max_concurrent are running, at least
+start_interval seconds after the previous launch (UE's memory peaks during startup),
+and while at least min_free_ram_mb of physical memory is available. One instance is
+always allowed so a batch cannot stall.
+
+The executable is only a command prefix: fake_commandlet.py stands in for
+UnrealEditor-Cmd when testing the scheduler without UE.
+
+Usage:
+    scheduler = CommandletScheduler(exe_path, project_file, work_root, max_concurrent=3)
+    results = scheduler.run([make_job(vrm_path, json_data), ...], progress=print)
+    char_file, thumb_file = collect_character_outputs(results[0], user_char_folder)
+"""
+
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import time
+from collections import deque
+
+DEFAULT_MAX_CONCURRENT = 2
+DEFAULT_TIMEOUT = 30 * 60
+DEFAULT_RETRIES = 1
+DEFAULT_MIN_FREE_RAM_MB = 8 * 1024
+DEFAULT_START_INTERVAL = 15.0
+
+COMMANDLET_FLAGS = ["-stdout", "-nopause", "-unattended", "-AllowCommandletRendering",
+                    "-AllowCommandletAudio", "-RenderOffScreen"]
+
+
+def build_commandlet_command(exe, project_file, json_file, vrm_path, output_dir):
+    """
+    CinevCreateUserCharacter command line.
+
+    Args:
+        exe: UnrealEditor-Cmd.exe path, or a list used as command prefix (e.g. [python, fake_commandlet.py])
+    """
+    prefix = [exe] if isinstance(exe, str) else list(exe)
+    params = [("UserCharacterJsonPath", json_file), ("UserCharacterVrmPath", vrm_path), ("OutputPath", output_dir)]
+    if os.name == "nt":
+        # UE parses -Key="value" itself; list2cmdline would escape those quotes
+        parts = [f'"{p}"' for p in prefix] + ([f'"{project_file}"'] if project_file else [])
+        parts.append("-run=CinevCreateUserCharacter")
+        parts += [f'-{key}="{value}"' for key, value in params]
+        return " ".join(parts + COMMANDLET_FLAGS)
+    return (prefix + ([project_file] if project_file else []) + ["-run=CinevCreateUserCharacter"]
+            + [f"-{key}={value}" for key, value in params] + COMMANDLET_FLAGS)
+
+
+def available_memory_mb():
+    """Available physical memory in MB, or None if unknown on this platform."""
+    if os.name == "nt":
+        import ctypes
+
+        class MEMORYSTATUSEX(ctypes.Structure):
+            _fields_ = [("dwLength", ctypes.c_ulong), ("dwMemoryLoad", ctypes.c_ulong),
+                        ("ullTotalPhys", ctypes.c_ulonglong), ("ullAvailPhys", ctypes.c_ulonglong),
+                        ("ullTotalPageFile", ctypes.c_ulonglong), ("ullAvailPageFile", ctypes.c_ulonglong),
+                        ("ullTotalVirtual", ctypes.c_ulonglong), ("ullAvailVirtual", ctypes.c_ulonglong),
+                        ("ullAvailExtendedVirtual", ctypes.c_ulonglong)]
+
+        status = MEMORYSTATUSEX()
+        status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return status.ullAvailPhys // (1024 * 1024)
+        return None
+    try:
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    return None
+
+
+def _kill_tree(process):
+    """Kill the commandlet and its children (ShaderCompileWorker etc.)."""
+    if os.name == "nt":
+        subprocess.run(["taskkill", "/T", "/F", "/PID", str(process.pid)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        # The commandlet leads its own process group (start_new_session), so this reaches its children too
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    process.wait()
+
+
+def _write_json(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def make_job(vrm_path, json_data, job_id=None):
+    """Job dict for CommandletScheduler.run (job_id defaults to the VRM stem)."""
+    return {"job_id": job_id or os.path.splitext(os.path.basename(vrm_path))[0],
+            "vrm": vrm_path, "json": json_data}
+
+
+class CommandletScheduler:
+    """Runs commandlet jobs with a concurrency/RAM cap, per-job timeouts and retries."""
+
+    def __init__(self, exe, project_file, work_root, max_concurrent=DEFAULT_MAX_CONCURRENT,
+                 timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES, min_free_ram_mb=DEFAULT_MIN_FREE_RAM_MB,
+                 start_interval=DEFAULT_START_INTERVAL, poll_interval=0.5):
+        self.exe = exe
+        self.project_file = project_file
+        self.work_root = os.path.abspath(work_root)
+        self.max_concurrent = max(1, max_concurrent)
+        self.timeout = timeout
+        self.retries = retries
+        self.min_free_ram_mb = min_free_ram_mb
+        self.start_interval = start_interval
+        self.poll_interval = poll_interval
+
+    def _can_start(self, running, last_start):
+        if len(running) >= self.max_concurrent:
+            return False
+        if not running:
+            return True
+        if time.monotonic() - last_start < self.start_interval:
+            return False
+        if self.min_free_ram_mb:
+            free = available_memory_mb()
+            if free is not None and free < self.min_free_ram_mb:
+                return False
+        return True
+
+    def _start(self, job, attempt):
+        job_dir = os.path.join(self.work_root, job["job_id"])
+        output_dir = os.path.join(job_dir, f"attempt_{attempt}")
+        os.makedirs(output_dir, exist_ok=True)
+        json_file = os.path.join(job_dir, "input.json")
+        if not os.path.exists(json_file):
+            _write_json(json_file, job["json"])
+
+        log_path = os.path.join(job_dir, f"attempt_{attempt}.log")
+        log = open(log_path, "wb")
+        cmd = build_commandlet_command(self.exe, self.project_file, json_file, job["vrm"], output_dir)
+        creationflags = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+        try:
+            process = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT,
+                                       creationflags=creationflags, start_new_session=os.name != "nt")
+        except OSError:
+            log.close()
+            raise
+        return {"process": process, "log": log, "log_path": log_path, "output_dir": output_dir,
+                "attempt": attempt, "started": time.monotonic()}
+
+    @staticmethod
+    def _outputs(output_dir):
+        names = sorted(os.listdir(output_dir))
+        characters = [os.path.join(output_dir, n) for n in names if n.lower().endswith(".character")]
+        thumbnails = [os.path.join(output_dir, n) for n in names if n.lower().endswith((".png", ".jpg", ".jpeg"))]
+        return characters, thumbnails
+
+    def run(self, jobs, progress=None, should_cancel=None):
+        """
+        Run all jobs and return their result manifests in input order.
+
+        Args:
+            jobs: list of make_job() dicts (job_id must be unique)
+            progress: Called with a message string for every launch/finish/retry
+            should_cancel: Polled; when True, running jobs finish but pending ones are dropped
+
+        Returns:
+            list of dicts: job_id, vrm, status ("ok" | "failed" | "timeout" | "cancelled"),
+                           exit_code, attempts, output_dir, characters, thumbnails, log, duration
+        """
+        os.makedirs(self.work_root, exist_ok=True)
+        notify = progress or (lambda message: None)
+        results = [None] * len(jobs)
+        attempts = [0] * len(jobs)
+        pending = deque(range(len(jobs)))
+        running = {}
+        last_start = 0.0
+        batch_start = time.monotonic()
+
+        def finish(idx, status, run=None, exit_code=None, characters=(), thumbnails=()):
+            job = jobs[idx]
+            result = {
+                "job_id": job["job_id"], "vrm": job["vrm"], "status": status, "exit_code": exit_code,
+                "attempts": attempts[idx], "output_dir": run["output_dir"] if run else None,
+                "characters": list(characters), "thumbnails": list(thumbnails),
+                "log": run["log_path"] if run else None,
+                "duration": round(time.monotonic() - run["started"], 1) if run else 0.0,
+            }
+            results[idx] = result
+            job_dir = os.path.join(self.work_root, job["job_id"])
+            if os.path.isdir(job_dir):
+                _write_json(os.path.join(job_dir, "result.json"), result)
+
+        while pending or running:
+            # ── Reap finished / timed-out instances ──
+            for idx, run in list(running.items()):
+                process = run["process"]
+                exit_code = process.poll()
+                timed_out = exit_code is None and time.monotonic() - run["started"] > self.timeout
+                if exit_code is None and not timed_out:
+                    continue
+                if timed_out:
+                    _kill_tree(process)
+                    exit_code = process.returncode
+                run["log"].close()
+                del running[idx]
+
+                characters, thumbnails = self._outputs(run["output_dir"])
+                name = jobs[idx]["job_id"]
+                if characters and not timed_out:
+                    finish(idx, "ok", run, exit_code, characters, thumbnails)
+                    notify(f"[done] {name} (exit {exit_code}, {time.monotonic() - run['started']:.0f}s)")
+                    continue
+                reason = "timeout" if timed_out else f"exit {exit_code}, no .character"
+                if attempts[idx] <= self.retries and not (should_cancel and should_cancel()):
+                    notify(f"[retry] {name}: {reason}")
+                    pending.append(idx)
+                else:
+                    finish(idx, "timeout" if timed_out else "failed", run, exit_code, characters, thumbnails)
+                    notify(f"[failed] {name}: {reason}")
+
+            if should_cancel and should_cancel():
+                while pending:
+                    idx = pending.popleft()
+                    finish(idx, "cancelled")
+
+            # ── Launch while under the cap ──
+            while pending and self._can_start(running, last_start):
+                idx = pending.popleft()
+                attempts[idx] += 1
+                try:
+                    running[idx] = self._start(jobs[idx], attempts[idx])
+                except OSError as e:
+                    finish(idx, "failed")
+                    notify(f"[failed] {jobs[idx]['job_id']}: {e}")
+                    continue
+                last_start = time.monotonic()
+                notify(f"[start] {jobs[idx]['job_id']} (attempt {attempts[idx]}, {len(running)} running)")
+
+            if running:
+                time.sleep(self.poll_interval)
+
+        ok = sum(1 for r in results if r["status"] == "ok")
+        notify(f"[batch] {ok}/{len(jobs)} ok in {time.monotonic() - batch_start:.0f}s")
+        return results
+
+
+def collect_character_outputs(result, user_char_folder):
+    """
+    Move a finished job's .character (and its thumb_<name>_01.png) into the UserCharacter folder.
+
+    Returns:
+        (character file name, thumbnail file name or "")
+    """
+    char_src = result["characters"][0]
+    char_file = os.path.basename(char_src)
+    shutil.move(char_src, os.path.join(user_char_folder, char_file))
+
+    thumb_name = f"thumb_{os.path.splitext(char_file)[0]}_01.png"
+    thumb_src = os.path.join(result["output_dir"], thumb_name)
+    if os.path.exists(thumb_src):
+        shutil.move(thumb_src, os.path.join(user_char_folder, thumb_name))
+        return char_file, thumb_name
+    return char_file, ""
+
+
+def commandlet_prefix(path):
+    """Command prefix for an executable or a stand-in .py script (run with this interpreter)."""
+    if path.lower().endswith(".py"):
+        return [sys.executable, path]
+    return path
@@ -0,0 +1,78 @@
+"""
+Stand-in for `UnrealEditor-Cmd <project> -run=CinevCreateUserCharacter ...` (no UE needed).
+
+Reads -UserCharacterJsonPath / -UserCharacterVrmPath / -OutputPath like the real
+commandlet and writes <DisplayName>.character (a real container, via character_file.py)
+plus thumb_<DisplayName>_01.png into OutputPath. Used to exercise commandlet_scheduler.py
+and `register_vrm.py --commandlet fake_commandlet.py`.
+
+Fault injection (environment variables):
+    FAKE_COMMANDLET_DELAY      seconds to "run" (default 1)
+    FAKE_COMMANDLET_FAIL_RATE  0..1, chance to exit 1 without output
+    FAKE_COMMANDLET_HANG_RATE  0..1, chance to sleep forever (scheduler timeout test)
+"""
+
+import json
+import os
+import random
+import sys
+import time
+
+from character_file import write_character_file
+
+# 1x1 transparent PNG
+_THUMB_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6300010000000500010d0a2db40000000049454e44ae426082")
+
+
+def parse_args(argv):
+    """-Key=value tokens -> {Key: value} (quotes around value stripped)."""
+    params = {}
+    for token in argv:
+        if token.startswith("-") and "=" in token:
+            key, value = token[1:].split("=", 1)
+            params[key] = value.strip('"')
+    return params
+
+
+def main(argv=None):
+    params = parse_args(sys.argv[1:] if argv is None else argv)
+    json_path = params.get("UserCharacterJsonPath")
+    vrm_path = params.get("UserCharacterVrmPath")
+    output_dir = params.get("OutputPath")
+    if not (json_path and vrm_path and output_dir):
+        print("Error: -UserCharacterJsonPath, -UserCharacterVrmPath and -OutputPath are required")
+        return 1
+
+    print(f"LogInit: fake commandlet pid {os.getpid()} vrm={vrm_path}")
+    if random.random() < float(os.environ.get("FAKE_COMMANDLET_HANG_RATE", 0)):
+        print("LogInit: hanging")
+        sys.stdout.flush()
+        while True:
+            time.sleep(60)
+    time.sleep(float(os.environ.get("FAKE_COMMANDLET_DELAY", 1)))
+    if random.random() < float(os.environ.get("FAKE_COMMANDLET_FAIL_RATE", 0)):
+        print("Error: simulated failure")
+        return 1
+
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    name = data.get("DisplayName") or os.path.splitext(os.path.basename(vrm_path))[0]
+    metadata = {
+        "format": "VRM",
+        "gender": data.get("Gender", ""),
+        "displayName": name,
+        "vRMFileName": os.path.basename(vrm_path),
+        "scalingMethod": data.get("ScalingMethod", ""),
+        "modelSourceType": data.get("ModelSourceType", ""),
+    }
+    write_character_file(os.path.join(output_dir, f"{name}.character"), vrm_path, metadata, _THUMB_PNG)
+    with open(os.path.join(output_dir, f"thumb_{name}_01.png"), "wb") as f:
+        f.write(_THUMB_PNG)
+    print(f"Display: created {name}.character")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,18 +2,26 @@
 
 Runs the same pipeline as CharacterCreatorGUI.bulk_register without the GUI.
 Reads paths from character_creator_config.json (shared with the GUI).
+Commandlets run in parallel through commandlet_scheduler.py (--jobs, --timeout,
+--retries, --min-free-ram); --commandlet fake_commandlet.py runs the pipeline without UE.
+assets.info is updated through assets_store.py (journaled, written once at the end).
 """
 
 import argparse
 import json
 import os
-import shutil
 import socket
 import subprocess
 import sys
 import uuid
 from datetime import datetime
 
+from assets_store import AssetsStore
+from character_index import CharacterIndex
+from commandlet_scheduler import (CommandletScheduler, DEFAULT_MAX_CONCURRENT, DEFAULT_MIN_FREE_RAM_MB,
+                                  DEFAULT_RETRIES, DEFAULT_START_INTERVAL, collect_character_outputs,
+                                  commandlet_prefix, make_job)
+
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_FILE = os.path.join(SCRIPT_DIR, "character_creator_config.json")
@@ -75,23 +83,6 @@ def restore_source():
         print(f"[Patch] Restore error: {e}")
 
 
-def get_assets_info_path(user_char_folder):
-    """assets.info lives in the UserCharacter folder (where UE reads it)."""
-    return os.path.join(user_char_folder, "assets.info")
-
-
-def load_assets(assets_path):
-    if os.path.exists(assets_path):
-        with open(assets_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return []
-
-
-def save_assets(data, assets_path):
-    with open(assets_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-
-
 def main():
     parser = argparse.ArgumentParser(description="Register VRM files as user characters")
     parser.add_argument("vrm_files", nargs="+", help="VRM file paths to register")
@@ -99,6 +90,19 @@ def main():
     parser.add_argument("--scaling", default="Original")
     parser.add_argument("--source", default="VRM")
     parser.add_argument("--no-build", action="store_true", help="Skip UE build step")
+    parser.add_argument("--skip-existing", action="store_true",
+                        help="Skip VRMs that already have a .character in UserCharacter (by VRM name)")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_MAX_CONCURRENT,
+                        help=f"Commandlet instances to run at once (default: {DEFAULT_MAX_CONCURRENT})")
+    parser.add_argument("--timeout", type=float, default=30, help="Minutes before a commandlet is killed (default: 30)")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES,
+                        help=f"Retries after a timeout/failure (default: {DEFAULT_RETRIES})")
+    parser.add_argument("--min-free-ram", type=int, default=DEFAULT_MIN_FREE_RAM_MB,
+                        help=f"Only start another instance with this many MB free (default: {DEFAULT_MIN_FREE_RAM_MB})")
+    parser.add_argument("--start-interval", type=float, default=DEFAULT_START_INTERVAL,
+                        help=f"Seconds between instance launches (default: {DEFAULT_START_INTERVAL:g})")
+    parser.add_argument("--commandlet", help="Stand-in executable or .py script instead of UnrealEditor-Cmd "
+                                             "(e.g. fake_commandlet.py); skips ZenServer check, patch and build")
     args = parser.parse_args()
 
     # Validate VRM files
@@ -123,13 +127,17 @@ def main():
     project_file = os.path.normpath(config.get("project_file", ""))
     output_folder = os.path.normpath(config.get("output_folder", ""))
 
-    exe_path = os.path.normpath(os.path.join(ue_dir, "Engine", "Binaries", "Win64", "UnrealEditor-Cmd.exe"))
-    if not os.path.exists(exe_path):
-        print(f"ERROR: UnrealEditor-Cmd.exe not found: {exe_path}")
-        sys.exit(1)
-    if not os.path.exists(project_file):
-        print(f"ERROR: Project file not found: {project_file}")
-        sys.exit(1)
+    use_ue = not args.commandlet
+    if use_ue:
+        exe = os.path.normpath(os.path.join(ue_dir, "Engine", "Binaries", "Win64", "UnrealEditor-Cmd.exe"))
+        if not os.path.exists(exe):
+            print(f"ERROR: UnrealEditor-Cmd.exe not found: {exe}")
+            sys.exit(1)
+        if not os.path.exists(project_file):
+            print(f"ERROR: Project file not found: {project_file}")
+            sys.exit(1)
+    else:
+        exe = commandlet_prefix(os.path.abspath(args.commandlet))
 
     user_char_folder = os.path.normpath(
         os.path.join(os.path.dirname(project_file), "Saved", "SaveGames", "UserCharacter")
@@ -137,16 +145,36 @@ def main():
     os.makedirs(user_char_folder, exist_ok=True)
     os.makedirs(output_folder, exist_ok=True)
 
+    # Library index (only new/changed .character files are read)
+    index = CharacterIndex(user_char_folder)
+    stats = index.update()
+    print(f"Library: {stats['total']} character(s) ({stats['read']} re-indexed)")
+    if args.skip_existing:
+        kept = []
+        for p in vrm_files:
+            existing = index.search(vrm_name=os.path.basename(p))
+            if existing:
+                print(f"Already registered, skipping: {os.path.basename(p)} ({existing[0]['file']})")
+            else:
+                kept.append(p)
+        vrm_files = kept
+        if not vrm_files:
+            print("Nothing to register.")
+            index.close()
+            return
+
     # ZenServer check
-    if not check_zen_server():
+    if use_ue and not check_zen_server():
         print("ERROR: ZenServer (port 8558) is not running.")
         print("Start ZenServer before registering characters.")
+        index.close()
         sys.exit(1)
 
     # Patch + Build (matches GUI: Popen with CREATE_NEW_CONSOLE)
-    patch_source()
+    if use_ue:
+        patch_source()
     try:
-        if not args.no_build:
+        if use_ue and not args.no_build:
             build_bat = os.path.normpath(os.path.join(ue_dir, "Engine", "Build", "BatchFiles", "Build.bat"))
             if os.path.exists(build_bat):
                 print("=== Building (patched source) ===")
@@ -158,93 +186,78 @@ def main():
                     return
                 print("Build OK\n")
 
-        assets_path = get_assets_info_path(user_char_folder)
-        assets_data = load_assets(assets_path)
+        # assets.info lives in the UserCharacter folder (where UE reads it)
+        store = AssetsStore(user_char_folder)
+        recovered = store.load()
+        if recovered:
+            print(f"Recovered {recovered} unsaved assets.info change(s) from an interrupted run")
         added = 0
         failed = 0
         total = len(vrm_files)
 
+        # Step 1: one job per VRM (JSON + isolated output folder, see commandlet_scheduler.py)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        jobs = []
         for i, vrm_path in enumerate(vrm_files):
             stem = os.path.splitext(os.path.basename(vrm_path))[0]
-            display_name = stem[:12]
-            print(f"\n=== [{i+1}/{total}] {display_name} ===")
-
-            # Step 1: JSON
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             json_data = {
                 "Gender": args.gender,
-                "DisplayName": display_name,
+                "DisplayName": stem[:12],
                 "ScalingMethod": args.scaling,
                 "ModelSourceType": args.source,
             }
-            json_file = os.path.join(output_folder, f"{display_name}_{timestamp}.json")
-            with open(json_file, "w", encoding="utf-8") as f:
-                json.dump(json_data, f, indent=2)
-            print(f"  1) JSON: {os.path.basename(json_file)}")
-
-            # Step 2: Commandlet (matches GUI: Popen with CREATE_NEW_CONSOLE)
-            before_files = set(os.listdir(output_folder))
-            cmd = (
-                f'"{exe_path}" "{project_file}" '
-                f'-run=CinevCreateUserCharacter '
-                f'-UserCharacterJsonPath="{json_file}" '
-                f'-UserCharacterVrmPath="{vrm_path}" '
-                f'-OutputPath="{output_folder}" '
-                f'-stdout -nopause -unattended -AllowCommandletRendering -AllowCommandletAudio -RenderOffScreen'
-            )
-            print(f"  2) Commandlet running...")
-            process = subprocess.Popen(cmd, creationflags=subprocess.CREATE_NEW_CONSOLE)
-            process.wait()
-            print(f"     Exit code: {process.returncode}")
-
-            # Step 3: Verify & move
-            after_files = set(os.listdir(output_folder))
-            new_files = after_files - before_files
-            new_characters = [f for f in new_files if f.endswith(".character")]
-
-            thumb_file = ""
-            if new_characters:
-                char_file = new_characters[0]
-                src = os.path.join(output_folder, char_file)
-                dst = os.path.join(user_char_folder, char_file)
-                shutil.move(src, dst)
-                print(f"  3) Moved: {char_file} → UserCharacter/")
-
-                char_stem = os.path.splitext(char_file)[0]
-                thumb_name = f"thumb_{char_stem}_01.png"
-                thumb_src = os.path.join(output_folder, thumb_name)
-                if os.path.exists(thumb_src):
-                    shutil.move(thumb_src, os.path.join(user_char_folder, thumb_name))
-                    thumb_file = thumb_name
-                    print(f"     Thumbnail: {thumb_name}")
-                else:
-                    print(f"     Thumbnail not found: {thumb_name}")
-            else:
-                char_file = f"{display_name}.character"
-                print(f"  3) No new .character detected, using default: {char_file}")
+            jobs.append(make_job(vrm_path, json_data, job_id=f"{i + 1:03d}_{stem}"))
+
+        # Step 2: Commandlets in parallel
+        work_root = os.path.join(output_folder, f"register_{timestamp}")
+        print(f"=== Running {total} commandlet job(s), up to {args.jobs} at a time ===")
+        print(f"    Work folder: {work_root}")
+        scheduler = CommandletScheduler(exe, project_file if use_ue else None, work_root,
+                                        max_concurrent=args.jobs, timeout=args.timeout * 60,
+                                        retries=args.retries, min_free_ram_mb=args.min_free_ram,
+                                        start_interval=args.start_interval)
+        results = scheduler.run(jobs, progress=lambda message: print(f"  {message}"))
+
+        # Step 3: Verify & move, Step 4: assets.info (journaled per entry, compacted once)
+        print()
+        for job, result in zip(jobs, results):
+            display_name = job["json"]["DisplayName"]
+            if result["status"] != "ok":
                 failed += 1
+                print(f"  FAILED {display_name}: {result['status']} after {result['attempts']} attempt(s)"
+                      + (f", log: {result['log']}" if result["log"] else ""))
+                continue
+
+            char_file, thumb_file = collect_character_outputs(result, user_char_folder)
+            row = index.get(char_file)
+            if row and not row["error"]:
+                print(f"  {display_name}: {char_file} ({row['vrm_size'] / (1024 * 1024):.1f} MB VRM)"
+                      + (f", {thumb_file}" if thumb_file else ", no thumbnail"))
+            else:
+                print(f"  WARNING: unreadable .character {char_file}: {row['error'] if row else 'missing'}")
 
-            # Step 4: assets.info
-            preset_id = str(uuid.uuid4())
-            assets_data.insert(0, {
-                "Preset_id": preset_id,
+            store.insert(0, {
+                "Preset_id": str(uuid.uuid4()),
                 "Gender": args.gender,
                 "DisplayName": display_name,
                 "CharacterFilePath": char_file,
                 "CategoryName": "CharacterCategory.VRM",
                 "ThumbnailFileName": thumb_file,
             })
-            save_assets(assets_data, assets_path)
             added += 1
-            print(f"  4) Registered in assets.info")
+        saved = store.compact()
+        if saved["external"]:
+            print("NOTE: assets.info was changed by another program during the run; its edits were kept")
 
         result = f"Done. {added}/{total} registered"
         if failed:
-            result += f", {failed} without .character file"
+            result += f", {failed} failed (see result.json in the work folder)"
         print(f"\n=== {result} ===")
 
     finally:
-        restore_source()
+        if use_ue:
+            restore_source()
+        index.close()
 
 
 if __name__ == "__main__":
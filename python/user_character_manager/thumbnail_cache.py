@@ -0,0 +1,168 @@
+"""
+썸네일 정규화 + GUI 미리보기 캐시
+
+normalize_thumbnail() fits an image inside the in-game thumbnail size (512 px, the
+size of default_thumbnail.png), keeping JPEGs as JPEG and writing everything else as
+an optimized PNG. VRM authors sometimes ship 4096 px thumbnails; they are normalized
+before being embedded in a .character or copied into the UserCharacter folder.
+Thumbnails already within the size keep their bytes unless the re-encode is smaller.
+
+PreviewCache keeps GUI preview-size PNGs on disk, keyed by the SHA-1 of the source
+image bytes (<UserCharacter>/.thumb_cache/<sha1>_<w>x<h>.png), so selecting an entry
+decodes an 80 px PNG instead of the full image. Hashes are memoized per
+(path, size, mtime), so an unchanged file is not even re-read within a session.
+
+Pillow is imported lazily: without it normalize_thumbnail() returns its input and
+the GUIs fall back to showing the file name.
+
+모듈 간 import 금지 규칙 때문에 vroid_character_creator/thumbnail_cache.py 에 같은
+파일이 복사되어 있음 — 수정 시 두 파일을 함께 맞출 것.
+
+Usage:
+    thumb_png = normalize_thumbnail(thumb_png)
+    preview_png_path = PreviewCache(os.path.join(folder, PREVIEW_CACHE_DIR)).preview_path(thumb_path)
+
+    python thumbnail_cache.py <UserCharacter> [--size 512] [--dry-run]   # shrink embedded thumbnails
+"""
+
+import argparse
+import hashlib
+import io
+import os
+import shutil
+import sys
+
+from character_file import CharacterFile, update_character_thumbnail
+
+THUMBNAIL_SIZE = 512
+PREVIEW_SIZE = (80, 80)
+PREVIEW_CACHE_DIR = ".thumb_cache"
+JPEG_QUALITY = 90
+NORMALIZED_EXTENSIONS = (".png", ".jpg", ".jpeg")  # formats normalize_thumbnail keeps
+
+
+def normalize_thumbnail(data, size=THUMBNAIL_SIZE):
+    """
+    Thumbnail bytes fitted inside size x size.
+
+    Larger images are downscaled and re-encoded: JPEG sources as JPEG, anything
+    else as optimized PNG. Images already within size keep their original bytes
+    unless the PNG re-encode is smaller (JPEGs within size are never re-encoded,
+    that would only lose quality). Undecodable input (or no Pillow) is returned as-is.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return data
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            is_jpeg = img.format == "JPEG"
+            resized = max(img.size) > size
+            if not resized and is_jpeg:
+                return data
+            if resized:
+                img.thumbnail((size, size), Image.LANCZOS)
+            else:
+                img.load()
+            out = io.BytesIO()
+            if is_jpeg:
+                if img.mode not in ("L", "RGB"):
+                    img = img.convert("RGB")
+                img.save(out, "JPEG", quality=JPEG_QUALITY, optimize=True)
+            else:
+                if img.mode not in ("1", "L", "LA", "P", "RGB", "RGBA"):
+                    img = img.convert("RGBA")
+                img.save(out, "PNG", optimize=True)
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return data
+    normalized = out.getvalue()
+    if resized or len(normalized) < len(data):
+        return normalized
+    return data
+
+
+def copy_thumbnail(src_path, dest_path, size=THUMBNAIL_SIZE):
+    """Copy an external thumbnail file, normalizing PNG/JPEG on the way (other formats copied as-is)."""
+    if not src_path.lower().endswith(NORMALIZED_EXTENSIONS):
+        shutil.copy2(src_path, dest_path)
+        return
+    with open(src_path, "rb") as f:
+        data = normalize_thumbnail(f.read(), size)
+    tmp_path = f"{dest_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, dest_path)
+
+
+class PreviewCache:
+    """Content-hash keyed on-disk cache of preview-size PNGs."""
+
+    def __init__(self, cache_dir, size=PREVIEW_SIZE):
+        self.cache_dir = cache_dir
+        self.size = tuple(size)
+        self._hashes = {}  # (path, size, mtime_ns) -> sha1
+
+    def content_hash(self, path):
+        st = os.stat(path)
+        key = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+        digest = self._hashes.get(key)
+        if digest is None:
+            with open(path, "rb") as f:
+                digest = hashlib.sha1(f.read()).hexdigest()
+            self._hashes[key] = digest
+        return digest
+
+    def preview_path(self, image_path):
+        """Cached preview PNG for image_path, created on first use."""
+        from PIL import Image
+
+        width, height = self.size
+        cached = os.path.join(self.cache_dir, f"{self.content_hash(image_path)}_{width}x{height}.png")
+        if not os.path.exists(cached):
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with Image.open(image_path) as img:
+                img.thumbnail(self.size)  # JPEG decodes at reduced scale (draft)
+                tmp_path = f"{cached}.{os.getpid()}.tmp"
+                img.save(tmp_path, "PNG")
+            os.replace(tmp_path, cached)
+        return cached
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Shrink thumbnails embedded in .character files")
+    parser.add_argument("folder", help="UserCharacter folder")
+    parser.add_argument("--size", type=int, default=THUMBNAIL_SIZE,
+                        help=f"Longest edge in pixels (default: {THUMBNAIL_SIZE})")
+    parser.add_argument("--dry-run", action="store_true", help="Only report the savings")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.folder):
+        print(f"ERROR: Folder not found: {args.folder}")
+        sys.exit(1)
+
+    changed = saved = 0
+    for name in sorted(os.listdir(args.folder)):
+        if not name.lower().endswith(".character"):
+            continue
+        path = os.path.join(args.folder, name)
+        try:
+            with CharacterFile(path) as char:
+                thumb = char.thumbnail
+            normalized = normalize_thumbnail(thumb, args.size)
+            if normalized is thumb or len(normalized) >= len(thumb):
+                continue
+            if not args.dry_run:
+                update_character_thumbnail(path, normalized)
+        except (OSError, ValueError) as e:
+            print(f"  {name}: FAILED ({e})")
+            continue
+        changed += 1
+        saved += len(thumb) - len(normalized)
+        print(f"  {name}: {len(thumb) / 1024:.0f} KB -> {len(normalized) / 1024:.0f} KB")
+
+    action = "Would shrink" if args.dry_run else "Shrank"
+    print(f"{action} {changed} thumbnail(s), {saved / (1024 * 1024):.1f} MB saved")
+
+
+if __name__ == "__main__":
+    main()
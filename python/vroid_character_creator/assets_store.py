@@ -0,0 +1,390 @@
+"""
+assets.info store — 저널 기반 증분 저장
+
+assets.info stays the canonical file UE reads (a JSON array, indent=2). Edits do not
+rewrite it; each one is appended as a single JSON line to this store's own journal
+(<folder>/.assets.info.journal.<token>) and applied to the in-memory list. compact()
+then writes the whole array once (temp file + rename) and drops the journal — the GUIs
+call it after a short debounce, the batch tools once at the end. A batch of n
+registrations is n small appends plus one rewrite instead of n full rewrites, and UE
+never sees a half-written assets.info.
+
+The first journal line is the SHA-1 of the assets.info the operations were made
+against; the rest are operations keyed by Preset_id ("at"/"index" are positions at
+the time of the edit, used only when the neighbouring Preset_ids are gone):
+    {"base": "<sha1 of assets.info>"}
+    {"op": "insert", "uid": "...", "index": 0, "before": "<Preset_id>", "after": null, "entry": {...}}
+    {"op": "update", "uid": "...", "id": "<Preset_id>", "at": 5, "fields": {...}}
+    {"op": "delete", "uid": "...", "id": "<Preset_id>", "at": 5}
+    {"op": "move", "uid": "...", "id": "<Preset_id>", "at": 5, "index": 4, "before": "...", "after": "..."}
+
+A store holds an exclusive lock on its journal for as long as the journal exists, so
+no other store reads or folds in operations that are still pending. load() replays a
+journal only if nobody holds its lock (its store crashed or exited without compacting)
+and assets.info still matches its base; otherwise the file was rewritten after those
+operations were made (by their own compaction or by someone else) and the journal is
+discarded. Before compacting, the file's size/mtime (then SHA-1, if those changed) is
+compared with what this store last read or wrote. If someone else changed assets.info
+in between (UE, another tool, a text editor), the store reloads it and re-applies only
+its own pending operations — inserts and moves next to the same neighbours — instead
+of overwriting the external edit.
+
+모듈 간 import 금지 규칙 때문에 user_character_manager/assets_store.py 에 같은 파일이
+복사되어 있음 — 수정 시 두 파일을 함께 맞출 것.
+
+Usage:
+    store = AssetsStore(user_char_folder)
+    store.load()
+    store.insert(0, entry)
+    store.update(idx, {"DisplayName": "Alice"})
+    result = store.compact()   # {"written", "entries", "ops", "external"}
+"""
+
+import glob
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:  # Windows
+    import msvcrt
+    fcntl = None
+
+ASSETS_FILE = "assets.info"
+JOURNAL_PREFIX = ".assets.info.journal."  # + one token per AssetsStore instance
+REPLACE_RETRIES = 5  # UE (Windows) may briefly hold assets.info open while reading it
+
+
+def _find(entries, preset_id):
+    if not preset_id:
+        return None
+    for i, entry in enumerate(entries):
+        if entry.get("Preset_id") == preset_id:
+            return i
+    return None
+
+
+def _neighbours(entries, index):
+    """Preset_ids of the entries that end up right before and after position index."""
+    index = max(0, min(index, len(entries)))
+    after = entries[index - 1].get("Preset_id") if index > 0 else None
+    before = entries[index].get("Preset_id") if index < len(entries) else None
+    return before, after
+
+
+def _position(entries, op):
+    """Where an inserted/moved entry goes: next to its neighbour at edit time if that is still there."""
+    idx = _find(entries, op.get("before"))
+    if idx is not None:
+        return idx
+    idx = _find(entries, op.get("after"))
+    if idx is not None:
+        return idx + 1
+    return min(op["index"], len(entries))
+
+
+def apply_op(entries, op):
+    """Apply one journal operation to entries in place."""
+    kind = op.get("op")
+    if kind == "insert":
+        entry = op["entry"]
+        if _find(entries, entry.get("Preset_id")) is None:
+            entries.insert(_position(entries, op), dict(entry))
+        return
+    idx = _find(entries, op.get("id"))
+    if idx is None and not op.get("id") and 0 <= op.get("at", -1) < len(entries):
+        idx = op["at"]  # entry without a Preset_id: fall back to its position
+    if idx is None:
+        return
+    if kind == "update":
+        entries[idx].update(op["fields"])
+    elif kind == "delete":
+        entries.pop(idx)
+    elif kind == "move":
+        entry = entries.pop(idx)
+        entries.insert(_position(entries, op), entry)
+
+
+def _try_lock(f):
+    """Exclusive non-blocking lock on an open journal; False if another store holds it."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _release(f):
+    """Unlock and close a journal, leaving the file for load() to recover."""
+    if msvcrt is not None:
+        try:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        except OSError:
+            pass
+    f.close()
+
+
+def _drop_journal(f, path):
+    """Delete a locked journal and release it."""
+    if fcntl is not None:
+        # Unlink while still locked: a store waiting on the lock then sees st_nlink == 0
+        os.remove(path)
+        f.close()
+        return
+    _release(f)  # Windows cannot delete an open file
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _parse_journal(data):
+    """(base, ops) of journal bytes; base is False without a header. A torn last line is ignored."""
+    lines = data.decode("utf-8", "replace").splitlines()
+    try:
+        header = json.loads(lines[0])
+        base = header["base"]
+    except (IndexError, ValueError, TypeError, KeyError):
+        return False, []
+    ops = []
+    for line in lines[1:]:
+        try:
+            ops.append(json.loads(line))
+        except ValueError:
+            break
+    return base, ops
+
+
+class AssetsStore:
+    """assets.info of one UserCharacter folder with journaled edits and atomic compaction."""
+
+    def __init__(self, folder):
+        self.folder = os.path.abspath(folder)
+        self.path = os.path.join(self.folder, ASSETS_FILE)
+        self.journal_path = None  # created (and locked) with the first edit after a compaction
+        self.entries = []
+        self._journal = None
+        self._ops = []  # applied since the last compaction (re-applied if the file changed externally)
+        self._signature = None  # (size, mtime_ns, sha1) of assets.info as last read/written
+        self._lock = threading.RLock()
+
+    # ── Disk state ──
+
+    def _read_file(self):
+        """(entries, signature) of assets.info on disk; ([], None) if it does not exist."""
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+                st = os.fstat(f.fileno())
+        except FileNotFoundError:
+            return [], None
+        entries = json.loads(data.decode("utf-8")) if data.strip() else []
+        return entries, (st.st_size, st.st_mtime_ns, hashlib.sha1(data).hexdigest())
+
+    def _base(self):
+        return self._signature[2] if self._signature else None
+
+    def changed_on_disk(self):
+        """True if assets.info differs from what this store last read or wrote."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return self._signature is not None
+        if self._signature is None:
+            return True
+        size, mtime_ns, digest = self._signature
+        if (st.st_size, st.st_mtime_ns) == (size, mtime_ns):
+            return False
+        with open(self.path, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest() != digest
+
+    def _claim_orphans(self):
+        """
+        Operations of journals no live store holds, oldest journal first. Journals whose
+        base no longer matches assets.info are already folded in (or outdated) and skipped.
+        Every claimed journal stays locked; the caller drops them once the ops are safe.
+        """
+        base = self._base()
+        claimed, ops = [], []
+        paths = glob.glob(os.path.join(glob.escape(self.folder), glob.escape(JOURNAL_PREFIX) + "*"))
+        for path in sorted(paths, key=lambda p: os.path.getmtime(p) if os.path.exists(p) else 0):
+            if path == self.journal_path:
+                continue
+            try:
+                f = open(path, "r+b")
+            except FileNotFoundError:
+                continue
+            if not _try_lock(f) or (fcntl is not None and os.fstat(f.fileno()).st_nlink == 0):
+                f.close()  # a live store's journal, or one that was just dropped
+                continue
+            f.seek(0)
+            journal_base, journal_ops = _parse_journal(f.read())
+            if journal_base == base:
+                ops.extend(journal_ops)
+            claimed.append((f, path))
+        return claimed, ops
+
+    def load(self):
+        """
+        Read assets.info and replay journals left by an interrupted session.
+
+        Returns:
+            int: number of journal operations recovered
+        """
+        with self._lock:
+            if self._journal is not None:
+                _release(self._journal)  # reloading: pending edits are recovered like any other journal
+                self._journal = self.journal_path = None
+            entries, self._signature = self._read_file()
+            claimed, ops = self._claim_orphans()
+            self._ops, seen = [], set()
+            for op in ops:
+                # A crash while a recovered journal was being taken over can leave an op in two journals
+                uid = op.get("uid")
+                if uid in seen:
+                    continue
+                if uid:
+                    seen.add(uid)
+                apply_op(entries, op)
+                self._ops.append(op)
+            self.entries[:] = entries  # in place: callers may hold a reference to the list
+            if self._ops:
+                self._write_journal()  # take the recovered ops over before dropping their journals
+            for f, path in claimed:
+                _drop_journal(f, path)
+            return len(self._ops)
+
+    def reload_external(self):
+        """If assets.info changed on disk, re-read it and re-apply pending operations. Returns True if it did."""
+        with self._lock:
+            if not self.changed_on_disk():
+                return False
+            entries, self._signature = self._read_file()
+            for op in self._ops:
+                apply_op(entries, op)
+            self.entries[:] = entries
+            if self._ops:
+                self._write_journal()  # pending ops now apply on top of the new base
+            return True
+
+    # ── Journal ──
+
+    def _write_journal(self):
+        """Start a new locked journal (header + pending ops) for the current base and drop the old one."""
+        path = os.path.join(self.folder, f"{JOURNAL_PREFIX}{uuid.uuid4().hex[:12]}")
+        f = open(path, "ab")
+        try:
+            _try_lock(f)  # new name: nobody else can hold it yet
+            lines = [{"base": self._base()}] + self._ops
+            f.write("".join(json.dumps(line, ensure_ascii=False) + "\n" for line in lines).encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        except BaseException:
+            _drop_journal(f, path)
+            raise
+        self._drop_own_journal()
+        self._journal, self.journal_path = f, path
+
+    def _drop_own_journal(self):
+        if self._journal is not None:
+            _drop_journal(self._journal, self.journal_path)
+            self._journal = self.journal_path = None
+
+    # ── Edits ──
+
+    def _record(self, op):
+        op["uid"] = uuid.uuid4().hex
+        apply_op(self.entries, op)
+        self._ops.append(op)
+        if self._journal is None:
+            self._write_journal()
+            return
+        self._journal.write((json.dumps(op, ensure_ascii=False) + "\n").encode("utf-8"))
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+
+    def insert(self, index, entry):
+        with self._lock:
+            before, after = _neighbours(self.entries, index)
+            self._record({"op": "insert", "index": index, "before": before, "after": after,
+                          "entry": dict(entry)})
+
+    def update(self, index, fields):
+        with self._lock:
+            self._record({"op": "update", "id": self.entries[index].get("Preset_id"), "at": index,
+                          "fields": dict(fields)})
+
+    def delete(self, index):
+        with self._lock:
+            self._record({"op": "delete", "id": self.entries[index].get("Preset_id"), "at": index})
+
+    def move(self, index, new_index):
+        with self._lock:
+            rest = self.entries[:index] + self.entries[index + 1:]
+            before, after = _neighbours(rest, new_index)
+            self._record({"op": "move", "id": self.entries[index].get("Preset_id"), "at": index,
+                          "index": new_index, "before": before, "after": after})
+
+    @property
+    def dirty(self):
+        return bool(self._ops)
+
+    # ── Compaction ──
+
+    def _replace(self, tmp_path):
+        for attempt in range(REPLACE_RETRIES):
+            try:
+                os.replace(tmp_path, self.path)
+                return
+            except PermissionError:
+                if attempt == REPLACE_RETRIES - 1:
+                    raise
+                time.sleep(0.2 * (attempt + 1))
+
+    def compact(self, force=False):
+        """
+        Write entries to assets.info (temp file + rename) and drop the journal.
+
+        Args:
+            force: Rewrite even if nothing is pending (explicit "save")
+
+        Returns:
+            dict: written (bool), entries, ops (operations folded in),
+                  external (assets.info had changed on disk and was merged)
+        """
+        with self._lock:
+            ops = len(self._ops)
+            if not (ops or force):
+                return {"written": False, "entries": len(self.entries), "ops": 0, "external": False}
+            external = self.reload_external()
+
+            data = json.dumps(self.entries, indent=2, ensure_ascii=False).encode("utf-8")
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._replace(tmp_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            st = os.stat(self.path)
+            self._signature = (st.st_size, st.st_mtime_ns, hashlib.sha1(data).hexdigest())
+
+            # A crash before this leaves a journal whose base no longer matches the new
+            # assets.info, so load() discards it instead of replaying folded-in operations.
+            self._drop_own_journal()
+            self._ops = []
+            return {"written": True, "entries": len(self.entries), "ops": ops, "external": external}
@@ -0,0 +1,112 @@
+"""
+Treeview 증분 갱신 — 바뀐 행만 건드리는 diff 레이어
+
+TreeviewSync keeps a flat ttk.Treeview in step with a list of objects (the assets.info
+entries). Each object gets a stable row id for as long as it lives in the list, so
+sync() can diff the new row list against what the tree shows:
+    removed objects      -> one delete() call
+    new objects          -> insert()
+    changed values       -> item(values=...) for those rows only
+    reordered objects    -> move() for the rows that are out of place
+Move up/down of one entry is a single move() and keeps the row selected; apply is a
+single item() update. Rows that did not change are never touched, which is what keeps
+a 3k-entry catalog responsive (Treeview itself only draws the visible rows).
+
+모듈 간 import 금지 규칙 때문에 user_character_manager/tree_sync.py 에 같은 파일이
+복사되어 있음 — 수정 시 두 파일을 함께 맞출 것.
+
+Usage:
+    view = TreeviewSync(tree, row_values=lambda entry: (...), placeholder=("", "항목 없음", ...))
+    view.sync(assets_data)
+    indices = view.selected_indices()
+    tree.selection_set(view.iid(idx))
+"""
+
+PLACEHOLDER_IID = "empty_placeholder"
+
+
+class TreeviewSync:
+    """Diff-based updates of a flat ttk.Treeview from a list of objects."""
+
+    def __init__(self, tree, row_values, placeholder=None):
+        """
+        Args:
+            tree: ttk.Treeview (flat, no child rows)
+            row_values: object -> tuple of column values
+            placeholder: values of the row shown while the list is empty (None = no row)
+        """
+        self.tree = tree
+        self.row_values = row_values
+        self.placeholder = placeholder
+        self._iids = []  # row id per list position
+        self._positions = {}  # row id -> list position
+        self._values = {}  # row id -> values last written to the tree
+        self._has_placeholder = False
+
+    @staticmethod
+    def _row_id(obj):
+        # Identity of the object itself: survives edits and moves, changes when the list is reloaded
+        return f"r{id(obj):x}"
+
+    def sync(self, objects):
+        """
+        Bring the tree in line with objects.
+
+        Returns:
+            dict: inserted, updated, moved, deleted (row counts, for logging/profiling)
+        """
+        tree = self.tree
+        new_iids = [self._row_id(obj) for obj in objects]
+        new_set = set(new_iids)
+        stats = {"inserted": 0, "updated": 0, "moved": 0, "deleted": 0}
+
+        if self._has_placeholder and objects:
+            tree.delete(PLACEHOLDER_IID)
+            self._has_placeholder = False
+
+        stale = [iid for iid in self._iids if iid not in new_set]
+        if stale:
+            tree.delete(*stale)
+            for iid in stale:
+                del self._values[iid]
+            stats["deleted"] = len(stale)
+
+        # Rows currently in the tree, in tree order: survivors, then inserts appended at the end
+        order = [iid for iid in self._iids if iid in new_set]
+        for iid, obj in zip(new_iids, objects):
+            values = tuple(self.row_values(obj))
+            old = self._values.get(iid)
+            if old is None:
+                tree.insert("", "end", iid=iid, values=values)
+                order.append(iid)
+                stats["inserted"] += 1
+            elif old != values:
+                tree.item(iid, values=values)
+                stats["updated"] += 1
+            self._values[iid] = values
+
+        # Reorder: walk the target order and move only rows that are not already in place
+        if order != new_iids:
+            for i, iid in enumerate(new_iids):
+                if order[i] != iid:
+                    order.remove(iid)
+                    order.insert(i, iid)
+                    tree.move(iid, "", i)
+                    stats["moved"] += 1
+
+        self._iids = new_iids
+        self._positions = {iid: i for i, iid in enumerate(new_iids)}
+
+        if not objects and self.placeholder is not None and not self._has_placeholder:
+            tree.insert("", "end", iid=PLACEHOLDER_IID, values=self.placeholder)
+            self._has_placeholder = True
+        return stats
+
+    def iid(self, index):
+        """Row id of the object at list position index."""
+        return self._iids[index]
+
+    def selected_indices(self):
+        """Sorted list positions of the selected rows."""
+        positions = (self._positions.get(iid) for iid in self.tree.selection())
+        return sorted(i for i in positions if i is not None)
@@ -7,131 +7,19 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import json
 import os
-import shutil
-import struct
-import uuid
+import threading
 
-
-CONFIG_FILE = os.path.join(os.path.dirname(__file__), "vroid_creator_config.json")
-
-# 기본 썸네일 (썸네일 추출 실패 시 fallback)
-_DEFAULT_THUMB_PATH = os.path.join(os.path.dirname(__file__), "default_thumbnail.png")
-with open(_DEFAULT_THUMB_PATH, "rb") as _f:
-    DEFAULT_THUMB_PNG = _f.read()
+from assets_store import AssetsStore
+from character_file import read_character_metadata, update_character_metadata
+from character_index import CharacterIndex
+from thumbnail_cache import PREVIEW_CACHE_DIR, PreviewCache, copy_thumbnail
+from tree_sync import TreeviewSync
+from vroid_register import commit_assets, extract_vrm_meta, register_vrms
 
 
-def read_vrm_json(vrm_path):
-    """VRM (glTF 2.0) 파일에서 JSON chunk 파싱"""
-    with open(vrm_path, "rb") as f:
-        # glTF header: magic(4) + version(4) + length(4)
-        magic = f.read(4)
-        if magic != b"glTF":
-            return None
-        f.read(4)  # version
-        f.read(4)  # total length
-        # Chunk 0: JSON
-        chunk_len = struct.unpack("<I", f.read(4))[0]
-        chunk_type = f.read(4)  # b"JSON"
-        if chunk_type != b"JSON":
-            return None
-        json_bytes = f.read(chunk_len)
-        return json.loads(json_bytes.decode("utf-8"))
-
-
-def _read_image_from_buffer(vrm_path, gltf, img_idx):
-    """glTF images[img_idx]의 bufferView에서 바이너리 데이터 읽기"""
-    images = gltf.get("images", [])
-    if img_idx is None or img_idx >= len(images):
-        return None
-    bv_idx = images[img_idx].get("bufferView")
-    if bv_idx is None:
-        return None
-    bvs = gltf.get("bufferViews", [])
-    if bv_idx >= len(bvs):
-        return None
-    bv = bvs[bv_idx]
-    offset = bv.get("byteOffset", 0)
-    length = bv["byteLength"]
-    with open(vrm_path, "rb") as f:
-        f.read(12)  # glTF header
-        json_chunk_len = struct.unpack("<I", f.read(4))[0]
-        f.read(4)  # JSON type
-        f.read(json_chunk_len)  # skip JSON data
-        # BIN chunk header
-        f.read(4)  # bin chunk len
-        f.read(4)  # bin chunk type (b"BIN\x00")
-        bin_start = f.tell()
-        f.seek(bin_start + offset)
-        return f.read(length)
-
-
-def extract_vrm_meta(vrm_path):
-    """VRM 0.x / 1.0 에서 title과 썸네일 바이너리 추출.
-    Returns (title: str|None, thumb_data: bytes|None)
-    """
-    gltf = read_vrm_json(vrm_path)
-    if not gltf:
-        return None, None
-
-    extensions = gltf.get("extensions", {})
-    title = None
-    thumb_data = None
-
-    # VRM 1.0: extensions.VRMC_vrm.meta
-    vrmc = extensions.get("VRMC_vrm", {})
-    if vrmc:
-        meta = vrmc.get("meta", {})
-        title = meta.get("name") or None
-        # thumbnailImage → images[idx] 직접 참조
-        img_idx = meta.get("thumbnailImage")
-        if img_idx is not None:
-            thumb_data = _read_image_from_buffer(vrm_path, gltf, img_idx)
-
-    # VRM 0.x: extensions.VRM.meta
-    if not vrmc:
-        vrm0 = extensions.get("VRM", {})
-        meta = vrm0.get("meta", {})
-        title = meta.get("title") or None
-        # texture → textures[idx].source → images[idx]
-        tex_idx = meta.get("texture")
-        if tex_idx is not None:
-            textures = gltf.get("textures", [])
-            if tex_idx < len(textures):
-                img_idx = textures[tex_idx].get("source")
-                thumb_data = _read_image_from_buffer(vrm_path, gltf, img_idx)
-
-    return title, thumb_data
-
-
-def create_character_file(output_path, vrm_path, metadata, thumb_data=None):
-    """순수 Python으로 .character 바이너리 생성"""
-    vrm_name = os.path.basename(vrm_path)
-
-    meta_json = json.dumps(metadata, indent="\t", ensure_ascii=False)
-    # UE FBufferArchive: CRLF + trailing space
-    meta_json = meta_json.replace("\n", "\r\n") + " "
-    meta_bytes = meta_json.encode("utf-8")
-
-    header = b"CINEV_CHAR_V1\x00"
-    vrm_name_bytes = vrm_name.encode("utf-8") + b"\x00"
-
-    with open(vrm_path, "rb") as f:
-        vrm_data = f.read()
-
-    if thumb_data is None:
-        thumb_data = DEFAULT_THUMB_PNG
-
-    with open(output_path, "wb") as f:
-        f.write(struct.pack("<I", len(header)))
-        f.write(header)
-        f.write(struct.pack("<I", len(meta_bytes)))
-        f.write(meta_bytes)
-        f.write(struct.pack("<I", len(vrm_name_bytes)))
-        f.write(vrm_name_bytes)
-        f.write(struct.pack("<I", len(vrm_data)))
-        f.write(vrm_data)
-        f.write(struct.pack("<I", len(thumb_data)))
-        f.write(thumb_data)
+CONFIG_FILE = os.path.join(os.path.dirname(__file__), "vroid_creator_config.json")
+# assets.info is rewritten once edits pause this long (each edit is journaled immediately)
+ASSETS_SAVE_DELAY_MS = 1000
 
 
 class VRoidCreatorGUI:
@@ -147,13 +35,19 @@ class VRoidCreatorGUI:
         self.scaling_var = tk.StringVar(value="Original")
         self.pending_vrm_files = []
         self.vrm_meta_cache = {}  # vrm_path → (title, thumb_data)
-        self.assets_data = []
+        self.assets_data = []  # AssetsStore.entries; edit through self.assets_store
+        self.assets_store = None
+        self._assets_save_job = None
+        self.character_index = None
+        self.character_rows = {}
+        self.preview_cache = None
         self.selected_asset_idx = None
 
         self.load_config()
         self.create_widgets()
 
         self.user_char_folder_var.trace_add("write", lambda *_: self.save_config())
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
     # ── Config ──
 
@@ -163,17 +57,6 @@ class VRoidCreatorGUI:
                 cfg = json.load(f)
             self.user_char_folder_var.set(cfg.get("user_char_folder", ""))
 
-        # Auto-load assets.info if available
-        folder = self.user_char_folder_var.get()
-        if folder:
-            assets_path = os.path.join(folder, "assets.info")
-            if os.path.exists(assets_path):
-                try:
-                    with open(assets_path, "r", encoding="utf-8") as f:
-                        self.assets_data = json.load(f)
-                except Exception:
-                    pass
-
     def save_config(self):
         cfg = {"user_char_folder": self.user_char_folder_var.get()}
         with open(CONFIG_FILE, "w", encoding="utf-8") as f:
@@ -285,7 +168,13 @@ class VRoidCreatorGUI:
 
         self.create_assets_editor(right_pane)
 
+        # Auto-load assets.info if available
+        try:
+            self._get_assets_store()
+        except Exception as e:
+            self.log(f"assets.info 로드 실패: {str(e)}")
         self.update_folder_status()
+        self._update_character_index()
         self.assets_refresh_tree()
 
     def create_assets_editor(self, parent):
@@ -326,6 +215,9 @@ class VRoidCreatorGUI:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         self.assets_tree.bind("<<TreeviewSelect>>", self.assets_on_select)
+        # Rows are keyed by entry identity; refreshes only touch inserted/changed/moved rows
+        self.assets_view = TreeviewSync(self.assets_tree, self._asset_row_values,
+                                        placeholder=("", "항목 없음", "", "", "", "", ""))
 
         # Count + Move + Refresh
         count_frame = tk.Frame(editor_frame, bg="white")
@@ -505,83 +397,79 @@ class VRoidCreatorGUI:
             messagebox.showerror("오류", "UserCharacter 폴더를 설정하세요.")
             return
 
-        # Load existing assets.info
-        assets_path = os.path.join(folder, "assets.info")
-        if os.path.exists(assets_path):
-            with open(assets_path, "r", encoding="utf-8") as f:
-                assets_data = json.load(f)
-        else:
-            assets_data = []
-
+        vrm_files = list(self.pending_vrm_files)
+        meta_cache = dict(self.vrm_meta_cache)
         gender = self.gender_var.get()
         scaling = self.scaling_var.get()
-        added = 0
-
-        for i, vrm_path in enumerate(self.pending_vrm_files):
-            vrm_name = os.path.basename(vrm_path)
-            stem = os.path.splitext(vrm_name)[0]
-
-            # VRM 내장 메타 추출
-            title, thumb_data = self.vrm_meta_cache.get(vrm_path, (None, None))
-            if title is None and thumb_data is None:
-                title, thumb_data = extract_vrm_meta(vrm_path)
-
-            # displayName: VRM 내장 title → 파일명 fallback (12자 제한)
-            display_name = (title or stem)[:12]
-
-            self.log(f"\n[{i+1}/{len(self.pending_vrm_files)}] {vrm_name}")
-            if title:
-                self.log(f"  VRM 내장 이름: {title}")
-
-            # VRM이 UserCharacter 폴더에 없으면 복사
-            vrm_dest = os.path.join(folder, vrm_name)
-            if os.path.normpath(vrm_path) != os.path.normpath(vrm_dest):
-                shutil.copy2(vrm_path, vrm_dest)
-                self.log(f"  VRM 복사 → UserCharacter/")
-
-            # 썸네일 로그
-            if thumb_data:
-                thumb_kb = len(thumb_data) / 1024
-                self.log(f"  VRM 내장 썸네일 ({thumb_kb:.0f} KB) → .character에 삽입")
+        total = len(vrm_files)
+        done = [0]
+
+        self.reg_btn.config(state=tk.DISABLED, text="등록 중...")
+        self.log(f"\n=== {total}개 등록 시작 ===")
+
+        # 워커 풀에서 .character 생성, assets.info는 _register_finished 에서 이 창의 store로 한 번에 반영
+        def on_result(r):
+            done[0] += 1
+            self.root.after(0, self._log_register_result, r, done[0], total)
+
+        def work():
+            try:
+                results = register_vrms(folder, vrm_files, gender, scaling,
+                                        progress=on_result, meta_cache=meta_cache, commit=False)
+            except Exception as e:
+                self.root.after(0, self._register_finished, folder, gender, None, str(e))
+                return
+            self.root.after(0, self._register_finished, folder, gender, results, None)
+
+        threading.Thread(target=work, daemon=True).start()
+
+    def _log_register_result(self, r, done, total):
+        vrm_name = os.path.basename(r["vrm"])
+        if r["error"]:
+            self.log(f"[{done}/{total}] {vrm_name} 실패: {r['error']}")
+            return
+        self.log(f"[{done}/{total}] {vrm_name}")
+        if r["title"]:
+            self.log(f"  VRM 내장 이름: {r['title']}")
+        if r["thumbnail"]:
+            if r["thumbnail"] != r["thumbnail_source"]:
+                self.log(f"  VRM 내장 썸네일 ({r['thumbnail_source'] / 1024:.0f} KB → {r['thumbnail'] / 1024:.0f} KB)"
+                         " → .character에 삽입")
             else:
-                self.log(f"  썸네일 없음 (빈 이미지 사용)")
-
-            # .character 생성
-            char_name = f"{stem}.character"
-            char_path = os.path.join(folder, char_name)
-
-            metadata = {
-                "format": "VRM",
-                "gender": gender,
-                "displayName": display_name,
-                "vRMFileName": vrm_name,
-                "scalingMethod": scaling,
-                "modelSourceType": "VRoid",
-            }
-
-            create_character_file(char_path, vrm_dest, metadata, thumb_data)
-            size_mb = os.path.getsize(char_path) / (1024 * 1024)
-            self.log(f"  .character 생성: {char_name} ({size_mb:.1f} MB)")
-
-            # assets.info에 추가
-            preset_id = str(uuid.uuid4())
-            entry = {
-                "Preset_id": preset_id,
-                "Gender": gender,
-                "DisplayName": display_name,
-                "CharacterFilePath": char_name,
-                "CategoryName": "CharacterCategory.VRM",
-                "ThumbnailFileName": "",
-            }
-            assets_data.insert(0, entry)
-            added += 1
-            self.log(f"  assets.info 등록 완료 (ID: {preset_id[:8]}...)")
-
-        # Save assets.info
-        with open(assets_path, "w", encoding="utf-8") as f:
-            json.dump(assets_data, f, indent=2, ensure_ascii=False)
-
-        self.log(f"\n=== {added}개 등록 완료 ===")
+                self.log(f"  VRM 내장 썸네일 ({r['thumbnail'] / 1024:.0f} KB) → .character에 삽입")
+        else:
+            self.log("  썸네일 없음 (빈 이미지 사용)")
+        placement = {"in_place": "UserCharacter 안 (그대로)", "linked": "하드 링크", "copied": "복사"}[r["placement"]]
+        self.log(f"  VRM → UserCharacter/: {placement}")
+        self.log(f"  .character 생성: {r['character']} ({r['size'] / (1024 * 1024):.1f} MB)")
+
+    def _register_finished(self, folder, gender, results, error):
+        self.reg_btn.config(state=tk.NORMAL, text="등록")
+        if error:
+            self.log(f"\n등록 실패: {error}")
+            messagebox.showerror("오류", f"등록 실패:\n{error}")
+            return
+
+        # assets.info: add the new entries through this window's store (Tk thread), then compact once
+        preset_id = self._selected_preset_id()
+        try:
+            store = self._get_assets_store()
+            if store is not None and store.folder == os.path.abspath(folder):
+                store.reload_external()
+                commit_assets(store, results, gender)
+                self._assets_compact()
+            else:  # the folder was switched while registering
+                store = AssetsStore(folder)
+                store.load()
+                commit_assets(store, results, gender)
+                store.compact()
+        except (OSError, ValueError) as e:
+            self.log(f"assets.info 저장 실패: {str(e)}")
+
+        added = sum(1 for r in results if not r["error"])
+        failed = len(results) - added
+        result_msg = f"{added}개 등록 완료" + (f", {failed}개 실패" if failed else "")
+        self.log(f"\n=== {result_msg} ===")
         self.update_folder_status()
 
         # Clear list
@@ -590,68 +478,26 @@ class VRoidCreatorGUI:
         self.vrm_listbox.delete(0, tk.END)
         self.count_label.config(text="선택된 파일 없음", fg="#999")
 
-        # Refresh assets.info editor
-        self.assets_data = assets_data
+        # Refresh assets.info editor (new entries were inserted above the selection)
+        self._update_character_index()
         self.assets_refresh_tree()
+        self._reselect_preset(preset_id)
 
-        messagebox.showinfo("완료", f"{added}개 VRoid 캐릭터 등록 완료")
+        messagebox.showinfo("완료", f"{result_msg} (VRoid)")
 
     # ── .character metadata helpers ──
 
     @staticmethod
     def read_character_metadata(char_path):
-        """Read metadata JSON embedded in a .character file"""
-        with open(char_path, "rb") as f:
-            data = f.read()
-        idx = data.find(b"{")
-        if idx < 0:
-            return None
-        depth = 0
-        end = idx
-        for i in range(idx, len(data)):
-            if data[i:i+1] == b"{":
-                depth += 1
-            elif data[i:i+1] == b"}":
-                depth -= 1
-                if depth == 0:
-                    end = i + 1
-                    break
-        json_str = data[idx:end].decode("utf-8", errors="replace")
-        return json.loads(json_str)
+        """Read metadata JSON embedded in a .character file (section table only, VRM payload is skipped)"""
+        return read_character_metadata(char_path)
 
     @staticmethod
     def write_character_metadata(char_path, updates):
         """Update metadata JSON embedded in a .character file.
-        Format: [len][header] [len][meta_json] [len][vrm_name] [len][vrm_data] [len][thumb]
-        Must rewrite with correct length prefixes.
+        Rewrites to a temp file and renames it over the original; VRM/thumbnail sections are copied file-to-file.
         """
-        with open(char_path, "rb") as f:
-            data = f.read()
-        pos = 0
-
-        def read_section(p):
-            length = struct.unpack("<I", data[p:p+4])[0]
-            return data[p+4:p+4+length], p + 4 + length
-
-        header, pos = read_section(pos)
-        meta_bytes, pos = read_section(pos)
-        vrm_name, pos = read_section(pos)
-        vrm_data, pos = read_section(pos)
-        thumb_data, pos = read_section(pos)
-
-        # Parse and update metadata
-        meta_str = meta_bytes.decode("utf-8", errors="replace").rstrip()
-        meta = json.loads(meta_str)
-        meta.update(updates)
-        new_meta_json = json.dumps(meta, indent="\t", ensure_ascii=False)
-        new_meta_json = new_meta_json.replace("\n", "\r\n") + " "
-        new_meta_bytes = new_meta_json.encode("utf-8")
-
-        # Rewrite with correct length prefixes
-        with open(char_path, "wb") as f:
-            for section in (header, new_meta_bytes, vrm_name, vrm_data, thumb_data):
-                f.write(struct.pack("<I", len(section)))
-                f.write(section)
+        update_character_metadata(char_path, updates)
         return True
 
     def _get_character_file_path(self, char_filename):
@@ -662,8 +508,71 @@ class VRoidCreatorGUI:
         full_path = os.path.join(folder, char_filename)
         return full_path if os.path.exists(full_path) else None
 
+    def _get_character_index(self):
+        """Open (or reuse) the library index of the current UserCharacter folder"""
+        folder = self.user_char_folder_var.get()
+        if not folder or not os.path.isdir(folder):
+            return None
+        if self.character_index is not None and self.character_index.folder != os.path.abspath(folder):
+            self.character_index.close()
+            self.character_index = None
+            self.character_rows = {}
+        if self.character_index is None:
+            try:
+                self.character_index = CharacterIndex(folder)
+            except Exception as e:
+                self.log(f"캐릭터 인덱스 열기 실패: {str(e)}")
+                return None
+        return self.character_index
+
+    def _update_character_index(self):
+        """Re-read new/changed .character files into the index (unchanged files are skipped by size/mtime)"""
+        index = self._get_character_index()
+        if index is None:
+            return
+        try:
+            stats = index.update()
+            self.character_rows = index.all()
+        except Exception as e:
+            self.log(f"캐릭터 인덱스 갱신 실패: {str(e)}")
+            return
+        if stats["read"] or stats["removed"]:
+            self.log(f"캐릭터 인덱스: {stats['total']}개 ({stats['read']}개 갱신, {stats['removed']}개 삭제)")
+
+    def _lookup_character_metadata(self, char_path):
+        """Metadata of a .character from the index (file is re-read only if it changed on disk)"""
+        index = self._get_character_index()
+        if index is None or os.path.dirname(os.path.abspath(char_path)) != index.folder:
+            return self.read_character_metadata(char_path)
+        row = index.get(os.path.basename(char_path))
+        if row is None:
+            return None
+        if row["error"]:
+            raise ValueError(row["error"])
+        self.character_rows[row["file"]] = row
+        return row["metadata"]
+
     # ── Assets.info editor ──
 
+    def _get_assets_store(self):
+        """Open (or reuse) the assets.info store of the current UserCharacter folder"""
+        folder = self.user_char_folder_var.get()
+        if not folder or not os.path.isdir(folder):
+            return None
+        if self.assets_store is not None and self.assets_store.folder != os.path.abspath(folder):
+            try:
+                self.assets_store.compact()  # flush the previous folder's pending edits
+            except Exception as e:
+                self.log(f"assets.info 저장 실패: {str(e)}")
+            self.assets_store = None
+        if self.assets_store is None:
+            self.assets_store = AssetsStore(folder)
+            recovered = self.assets_store.load()
+            self.assets_data = self.assets_store.entries
+            if recovered:
+                self.log(f"assets.info: 저장되지 않았던 변경 {recovered}개 복구 (저널)")
+        return self.assets_store
+
     def assets_load(self):
         """Load assets.info file"""
         folder = self.user_char_folder_var.get()
@@ -676,51 +585,76 @@ class VRoidCreatorGUI:
             return
 
         try:
-            with open(assets_path, "r", encoding="utf-8") as f:
-                self.assets_data = json.load(f)
+            # Re-read only if assets.info changed on disk (pending edits are re-applied on top)
+            preset_id = self._selected_preset_id()
+            reloaded = self._get_assets_store().reload_external()
+            self._update_character_index()
             self.assets_refresh_tree()
+            if reloaded:
+                self._reselect_preset(preset_id)
             self.log(f"assets.info 로드: {len(self.assets_data)}개")
         except Exception as e:
             self.log(f"assets.info 로드 실패: {str(e)}")
             messagebox.showerror("오류", "assets.info 로드에 실패했습니다.")
 
     def assets_auto_save(self):
-        """Auto-save assets.info after any change"""
-        folder = self.user_char_folder_var.get()
-        if not folder:
+        """Schedule writing assets.info after an edit.
+        Edits are already journaled; assets.info itself is rewritten once edits pause for ASSETS_SAVE_DELAY_MS.
+        """
+        if self._assets_save_job is not None:
+            self.root.after_cancel(self._assets_save_job)
+        self._assets_save_job = self.root.after(ASSETS_SAVE_DELAY_MS, self._assets_compact)
+
+    def _assets_compact(self):
+        """Fold the journal into assets.info (temp file + rename)"""
+        if self._assets_save_job is not None:
+            self.root.after_cancel(self._assets_save_job)
+            self._assets_save_job = None
+        if self.assets_store is None:
             return
-        assets_path = os.path.join(folder, "assets.info")
+        preset_id = self._selected_preset_id()
         try:
-            with open(assets_path, "w", encoding="utf-8") as f:
-                json.dump(self.assets_data, f, indent=2, ensure_ascii=False)
-            self.log(f"assets.info 자동 저장 ({len(self.assets_data)}개)")
+            result = self.assets_store.compact()
+        except Exception as e:
+            self.log(f"자동 저장 실패: {str(e)}")
+            return
+        if result["external"]:
+            self.log("assets.info가 다른 프로그램에서 변경됨 → 다시 읽고 편집 내용을 병합했습니다")
+            self.assets_refresh_tree()
+            self._reselect_preset(preset_id)
+        if result["written"]:
+            self.log(f"assets.info 자동 저장 ({result['entries']}개, 변경 {result['ops']}건)")
             self.assets_count_label.config(text="저장됨", fg="#00AA00")
             self.root.after(2000, lambda: self.assets_count_label.config(
                 text=f"{len(self.assets_data)}개", fg="#666"))
-        except Exception as e:
-            self.log(f"자동 저장 실패: {str(e)}")
+
+    def on_close(self):
+        """Write pending assets.info edits before closing"""
+        self._assets_compact()
+        self.root.destroy()
+
+    def _asset_row_values(self, entry):
+        """Treeview column values of one assets.info entry"""
+        # ScalingMethod / ModelSourceType는 .character에만 있으므로 인덱스 캐시에서 채움
+        char_row = self.character_rows.get(entry.get("CharacterFilePath", "")) or {}
+        preset_id = entry.get("Preset_id", "")
+        short_id = preset_id[:8] + "..." if len(preset_id) > 12 else preset_id
+        return (
+            short_id,
+            entry.get("CharacterFilePath", ""),
+            entry.get("CategoryName", ""),
+            entry.get("DisplayName", ""),
+            entry.get("Gender", ""),
+            entry.get("ScalingMethod") or char_row.get("scaling_method") or "",
+            entry.get("ModelSourceType") or char_row.get("model_source_type") or "",
+        )
 
     def assets_refresh_tree(self):
-        """Refresh the treeview with current data"""
-        self.assets_tree.delete(*self.assets_tree.get_children())
-        for i, entry in enumerate(self.assets_data):
-            preset_id = entry.get("Preset_id", "")
-            short_id = preset_id[:8] + "..." if len(preset_id) > 12 else preset_id
-            self.assets_tree.insert("", tk.END, iid=str(i), values=(
-                short_id,
-                entry.get("CharacterFilePath", ""),
-                entry.get("CategoryName", ""),
-                entry.get("DisplayName", ""),
-                entry.get("Gender", ""),
-                entry.get("ScalingMethod", ""),
-                entry.get("ModelSourceType", ""),
-            ))
+        """Refresh the treeview with current data (only rows that changed are touched)"""
+        self.assets_view.sync(self.assets_data)
         self.assets_count_label.config(text=f"{len(self.assets_data)}개")
 
         if not self.assets_data:
-            self.assets_tree.insert("", tk.END, iid="empty_placeholder", values=(
-                "", "항목 없음", "", "", "", "", ""
-            ))
             self.assets_apply_btn.config(state=tk.DISABLED)
             self.assets_delete_btn.config(state=tk.DISABLED)
             self.move_up_btn.config(state=tk.DISABLED)
@@ -728,10 +662,34 @@ class VRoidCreatorGUI:
 
     def _get_selected_indices(self):
         """Get sorted list of selected indices from treeview"""
-        selection = self.assets_tree.selection()
-        if not selection:
-            return []
-        return sorted(int(s) for s in selection if s != "empty_placeholder")
+        return self.assets_view.selected_indices()
+
+    def _selected_preset_id(self):
+        """Preset_id of the entry in the edit form (None if nothing is selected)"""
+        idx = self.selected_asset_idx
+        if idx is None or idx >= len(self.assets_data):
+            return None
+        return self.assets_data[idx].get("Preset_id") or None
+
+    def _reselect_preset(self, preset_id):
+        """After entries shifted (assets.info re-read, new registrations), select the edited preset again by Preset_id.
+        Positions may have shifted, so selected_asset_idx is never reused as-is; if the preset is gone
+        (or had no id) the selection and edit form are cleared so Apply cannot hit another entry.
+        """
+        idx = next((i for i, e in enumerate(self.assets_data) if preset_id and e.get("Preset_id") == preset_id), None)
+        if idx is None:
+            self.selected_asset_idx = None
+            if self.assets_tree.selection():
+                self.assets_tree.selection_remove(*self.assets_tree.selection())
+            self._clear_edit_form()
+            self.assets_apply_btn.config(state=tk.DISABLED)
+            self.assets_delete_btn.config(state=tk.DISABLED)
+            self.move_up_btn.config(state=tk.DISABLED)
+            self.move_down_btn.config(state=tk.DISABLED)
+            return
+        self.assets_tree.selection_set(self.assets_view.iid(idx))
+        self.assets_tree.see(self.assets_view.iid(idx))
+        self.assets_on_select(None)
 
     def _clear_edit_form(self):
         """Clear all edit form fields"""
@@ -777,7 +735,7 @@ class VRoidCreatorGUI:
         char_path = self._get_character_file_path(entry.get("CharacterFilePath", ""))
         if char_path:
             try:
-                meta = self.read_character_metadata(char_path)
+                meta = self._lookup_character_metadata(char_path)
                 if meta:
                     dn = meta.get("displayName", meta.get("DisplayName", ""))
                     sc = meta.get("scalingMethod", meta.get("ScalingMethod", ""))
@@ -842,12 +800,14 @@ class VRoidCreatorGUI:
             return
         idx = self.selected_asset_idx
 
-        self.assets_data[idx]["Preset_id"] = self.asset_preset_id_var.get()
-        self.assets_data[idx]["Gender"] = self.asset_gender_var.get()
-        self.assets_data[idx]["DisplayName"] = self.asset_display_name_var.get()
-        self.assets_data[idx]["CharacterFilePath"] = self.asset_char_file_var.get()
-        self.assets_data[idx]["CategoryName"] = self.asset_category_var.get()
-        self.assets_data[idx]["ThumbnailFileName"] = self.asset_thumbnail_var.get()
+        self.assets_store.update(idx, {
+            "Preset_id": self.asset_preset_id_var.get(),
+            "Gender": self.asset_gender_var.get(),
+            "DisplayName": self.asset_display_name_var.get(),
+            "CharacterFilePath": self.asset_char_file_var.get(),
+            "CategoryName": self.asset_category_var.get(),
+            "ThumbnailFileName": self.asset_thumbnail_var.get(),
+        })
 
         # Write metadata back to .character file
         char_path = self._get_character_file_path(self.asset_char_file_var.get())
@@ -871,8 +831,8 @@ class VRoidCreatorGUI:
         }
 
         self.assets_refresh_tree()
-        self.assets_tree.selection_set(str(idx))
-        self.assets_tree.see(str(idx))
+        self.assets_tree.selection_set(self.assets_view.iid(idx))
+        self.assets_tree.see(self.assets_view.iid(idx))
         self.assets_auto_save()
         self.assets_apply_btn.config(state=tk.DISABLED)
 
@@ -882,12 +842,12 @@ class VRoidCreatorGUI:
         if not indices or indices[0] <= 0:
             return
         for idx in indices:
-            self.assets_data[idx], self.assets_data[idx - 1] = self.assets_data[idx - 1], self.assets_data[idx]
+            self.assets_store.move(idx, idx - 1)
         new_indices = [i - 1 for i in indices]
         self.assets_refresh_tree()
         for i in new_indices:
-            self.assets_tree.selection_add(str(i))
-        self.assets_tree.see(str(new_indices[0]))
+            self.assets_tree.selection_add(self.assets_view.iid(i))
+        self.assets_tree.see(self.assets_view.iid(new_indices[0]))
         self.selected_asset_idx = new_indices[-1]
         self.assets_auto_save()
 
@@ -897,12 +857,12 @@ class VRoidCreatorGUI:
         if not indices or indices[-1] >= len(self.assets_data) - 1:
             return
         for idx in reversed(indices):
-            self.assets_data[idx], self.assets_data[idx + 1] = self.assets_data[idx + 1], self.assets_data[idx]
+            self.assets_store.move(idx, idx + 1)
         new_indices = [i + 1 for i in indices]
         self.assets_refresh_tree()
         for i in new_indices:
-            self.assets_tree.selection_add(str(i))
-        self.assets_tree.see(str(new_indices[-1]))
+            self.assets_tree.selection_add(self.assets_view.iid(i))
+        self.assets_tree.see(self.assets_view.iid(new_indices[-1]))
         self.selected_asset_idx = new_indices[-1]
         self.assets_auto_save()
 
@@ -924,7 +884,7 @@ class VRoidCreatorGUI:
             self.selected_asset_idx = None
             self._clear_edit_form()
             for idx in reversed(indices):
-                self.assets_data.pop(idx)
+                self.assets_store.delete(idx)
             self.assets_refresh_tree()
             self.assets_auto_save()
             self.assets_apply_btn.config(state=tk.DISABLED)
@@ -949,13 +909,20 @@ class VRoidCreatorGUI:
             else:
                 dest = os.path.join(folder, os.path.basename(path))
                 try:
-                    shutil.copy2(path, dest)
+                    copy_thumbnail(path, dest)
                     self.asset_thumbnail_var.set(os.path.basename(path))
                     self.log(f"썸네일 복사: {os.path.basename(path)}")
                 except Exception as e:
                     self.log(f"썸네일 복사 실패: {str(e)}")
                     self.asset_thumbnail_var.set(os.path.basename(path))
 
+    def _get_preview_cache(self, folder):
+        """Preview cache of the UserCharacter folder (<folder>/.thumb_cache, keyed by image content hash)"""
+        cache_dir = os.path.join(os.path.abspath(folder), PREVIEW_CACHE_DIR)
+        if self.preview_cache is None or self.preview_cache.cache_dir != cache_dir:
+            self.preview_cache = PreviewCache(cache_dir)
+        return self.preview_cache
+
     def _update_thumb_preview(self):
         """Update thumbnail preview image"""
         thumb_name = self.asset_thumbnail_var.get()
@@ -971,9 +938,8 @@ class VRoidCreatorGUI:
             return
         try:
             from PIL import Image, ImageTk
-            img = Image.open(thumb_path)
-            img.thumbnail((80, 80))
-            self._thumb_photo = ImageTk.PhotoImage(img)
+            with Image.open(self._get_preview_cache(folder).preview_path(thumb_path)) as img:
+                self._thumb_photo = ImageTk.PhotoImage(img)
             self._thumb_preview_label.config(image=self._thumb_photo, text="")
         except ImportError:
             self._thumb_preview_label.config(image="", text=f"[{thumb_name}]")
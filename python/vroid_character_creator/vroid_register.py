@@ -0,0 +1,320 @@
+"""
+VRoid 일괄 등록 — GUI 없이 .character 생성 + assets.info 등록 (워커 풀)
+
+Per VRM, on a thread pool (the work is disk-bound):
+    1. One open reads the glTF header + JSON chunk -> title and embedded thumbnail.
+    2. The VRM is placed in the UserCharacter folder: left alone if it is already
+       there, hard-linked when source and folder share a volume, otherwise copied
+       in the same pass that streams it into the .character (read once).
+    3. The embedded thumbnail is fitted to 512 px and re-encoded (thumbnail_cache.py).
+    4. The .character is written atomically (temp file + rename).
+
+All assets.info entries are journaled and committed in one atomic write at the
+end (assets_store.py), so an interrupted batch never leaves a half-written
+assets.info. Re-registering a VRM updates its existing entry (same .character
+file) instead of adding a duplicate.
+
+Usage:
+    python vroid_register.py <UserCharacter> a.vrm b.vrm D:/VRoidExports --gender Female --jobs 4
+
+    from vroid_register import register_vrms
+    results = register_vrms(user_char_folder, vrm_paths, gender="Female")
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from assets_store import AssetsStore
+from character_file import write_character_file
+from thumbnail_cache import normalize_thumbnail
+
+DEFAULT_JOBS = 4
+DISPLAY_NAME_LIMIT = 12
+
+# 기본 썸네일 (썸네일 추출 실패 시 fallback)
+_DEFAULT_THUMB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "default_thumbnail.png")
+with open(_DEFAULT_THUMB_PATH, "rb") as _f:
+    DEFAULT_THUMB_PNG = _f.read()
+
+
+# ── VRM meta ──
+
+def _item(items, idx):
+    """items[idx] if idx is a valid index and the item an object, else None (UniVRM writes -1 for "none")."""
+    if not isinstance(items, list) or type(idx) is not int or not 0 <= idx < len(items):
+        return None
+    item = items[idx]
+    return item if isinstance(item, dict) else None
+
+
+def _image_buffer_view(gltf, img_idx):
+    """glTF images[img_idx]의 bufferView (byteOffset, byteLength). 없거나 잘못되었으면 None."""
+    image = _item(gltf.get("images"), img_idx)
+    view = _item(gltf.get("bufferViews"), image.get("bufferView")) if image else None
+    if view is None:
+        return None
+    offset, length = view.get("byteOffset", 0), view.get("byteLength")
+    if type(offset) is not int or type(length) is not int or offset < 0 or length <= 0:
+        return None
+    return offset, length
+
+
+def _vrm_title_and_thumbnail(gltf):
+    """(title, thumbnail image index) from VRM 1.0 VRMC_vrm.meta or VRM 0.x VRM.meta."""
+    extensions = gltf.get("extensions") or {}
+
+    # VRM 1.0: thumbnailImage → images[idx] 직접 참조
+    vrmc = extensions.get("VRMC_vrm") or {}
+    if vrmc:
+        meta = vrmc.get("meta") or {}
+        title = meta.get("name")
+        return (title if isinstance(title, str) else None) or None, meta.get("thumbnailImage")
+
+    # VRM 0.x: texture → textures[idx].source → images[idx]
+    meta = (extensions.get("VRM") or {}).get("meta") or {}
+    texture = _item(gltf.get("textures"), meta.get("texture"))
+    title = meta.get("title")
+    return (title if isinstance(title, str) else None) or None, texture.get("source") if texture else None
+
+
+def extract_vrm_meta(vrm_path):
+    """VRM 0.x / 1.0 에서 title과 썸네일 바이너리 추출 (파일은 한 번만 열기).
+    Returns (title: str|None, thumb_data: bytes|None)
+    """
+    with open(vrm_path, "rb") as f:
+        # glTF header: magic(4) + version(4) + length(4), then chunk 0 header: length(4) + b"JSON"
+        head = f.read(20)
+        if len(head) < 20 or head[:4] != b"glTF" or head[16:20] != b"JSON":
+            return None, None
+        json_len = struct.unpack_from("<I", head, 12)[0]
+        gltf = json.loads(f.read(json_len).decode("utf-8"))
+        if not isinstance(gltf, dict):
+            return None, None
+
+        title, img_idx = _vrm_title_and_thumbnail(gltf)
+        view = _image_buffer_view(gltf, img_idx)
+        if view is None:
+            return title, None
+        offset, length = view
+        # BIN 데이터 시작: header(12) + JSON 청크 헤더(8) + JSON + BIN 청크 헤더(8)
+        f.seek(20 + json_len + 8 + offset)
+        return title, f.read(length)
+
+
+# ── Per-VRM work ──
+
+def _link_vrm(vrm_path, vrm_dest):
+    """Put vrm_path at vrm_dest without copying bytes.
+
+    Returns:
+        "in_place" | "linked", or None if a copy is needed (other volume, no hard-link support)
+    """
+    if os.path.normcase(os.path.abspath(vrm_path)) == os.path.normcase(os.path.abspath(vrm_dest)):
+        return "in_place"
+    if os.path.exists(vrm_dest) and os.path.samefile(vrm_path, vrm_dest):
+        return "linked"  # linked by an earlier run; rename onto the same file would leave the temp link
+    tmp_path = f"{vrm_dest}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.link(vrm_path, tmp_path)
+    except (OSError, AttributeError):
+        return None
+    os.replace(tmp_path, vrm_dest)
+    return "linked"
+
+
+def register_one(vrm_path, folder, gender="Female", scaling="Original", meta=None):
+    """
+    Create <stem>.character (and the VRM copy/link) in folder for one VRM.
+
+    Args:
+        meta: (title, thumb_data) if already extracted (e.g. by the GUI preview)
+
+    Returns:
+        dict: vrm, character, display_name, title, thumbnail (bytes embedded, 0 = default),
+              thumbnail_source (bytes in the VRM),
+              placement ("in_place" | "linked" | "copied"), size, error
+    """
+    vrm_name = os.path.basename(vrm_path)
+    stem = os.path.splitext(vrm_name)[0]
+    result = {"vrm": vrm_path, "character": f"{stem}.character", "display_name": None, "title": None,
+              "thumbnail": 0, "thumbnail_source": 0, "placement": None, "size": 0, "error": None}
+    try:
+        title, source_thumb = meta if meta is not None else extract_vrm_meta(vrm_path)
+        thumb_data = normalize_thumbnail(source_thumb) if source_thumb else None
+        # displayName: VRM 내장 title → 파일명 fallback (12자 제한)
+        display_name = (title or stem)[:DISPLAY_NAME_LIMIT]
+        metadata = {
+            "format": "VRM",
+            "gender": gender,
+            "displayName": display_name,
+            "vRMFileName": vrm_name,
+            "scalingMethod": scaling,
+            "modelSourceType": "VRoid",
+        }
+
+        vrm_dest = os.path.join(folder, vrm_name)
+        char_path = os.path.join(folder, result["character"])
+        placement = _link_vrm(vrm_path, vrm_dest)
+        if placement:
+            write_character_file(char_path, vrm_dest, metadata, thumb_data or DEFAULT_THUMB_PNG)
+        else:
+            write_character_file(char_path, vrm_path, metadata, thumb_data or DEFAULT_THUMB_PNG,
+                                 vrm_copy_path=vrm_dest)
+            placement = "copied"
+
+        result.update(display_name=display_name, title=title, thumbnail=len(thumb_data or b""),
+                      thumbnail_source=len(source_thumb or b""),
+                      placement=placement, size=os.path.getsize(char_path))
+    except (OSError, ValueError, KeyError, TypeError, IndexError, AttributeError, struct.error) as e:
+        # 잘못된 glTF JSON (필드 누락/타입 오류) 도 이 VRM만 실패 처리
+        result["error"] = str(e) if isinstance(e, (OSError, ValueError)) else f"{type(e).__name__}: {e}"
+    return result
+
+
+# ── assets.info ──
+
+def commit_assets(store, results, gender="Female"):
+    """
+    Add (or update) one assets.info entry per successful result in an AssetsStore.
+
+    New entries go to the top, the last VRM of the batch first (same order as registering
+    one by one). Entries whose CharacterFilePath already exists keep their Preset_id.
+    Each edit is journaled (assets_store.py); the caller compacts once afterwards, so an
+    interrupted batch is recovered on the next load and assets.info is written exactly once.
+
+    Returns:
+        list: the store's entries
+    """
+    for r in results:
+        if r["error"]:
+            continue
+        idx = next((i for i, entry in enumerate(store.entries)
+                    if entry.get("CharacterFilePath") == r["character"]), None)
+        if idx is not None:
+            store.update(idx, {"Gender": gender, "DisplayName": r["display_name"]})
+            r["preset_id"], r["updated"] = store.entries[idx].get("Preset_id", ""), True
+            continue
+        entry = {
+            "Preset_id": str(uuid.uuid4()),
+            "Gender": gender,
+            "DisplayName": r["display_name"],
+            "CharacterFilePath": r["character"],
+            "CategoryName": "CharacterCategory.VRM",
+            "ThumbnailFileName": "",
+        }
+        store.insert(0, entry)
+        r["preset_id"], r["updated"] = entry["Preset_id"], False
+    return store.entries
+
+
+def register_vrms(folder, vrm_paths, gender="Female", scaling="Original", jobs=None, progress=None,
+                  meta_cache=None, commit=True):
+    """
+    Register VRMs into a UserCharacter folder on a worker pool, then commit assets.info once.
+
+    A VRM that fails is reported in its result's "error"; the others are still committed.
+
+    Args:
+        progress: Called with each result dict as it finishes
+        meta_cache: {vrm_path: (title, thumb_data)} already extracted by the caller
+        commit: False leaves assets.info to the caller (commit_assets on its own AssetsStore,
+                e.g. the GUI's, on the Tk thread)
+
+    Returns:
+        list of result dicts in input order (see register_one; plus preset_id/updated if committed)
+    """
+    folder = os.path.abspath(folder)
+    meta_cache = meta_cache or {}
+    results = [None] * len(vrm_paths)
+
+    # 같은 파일명이 두 번 오면 같은 .character를 덮어쓰므로 뒤쪽은 실패 처리
+    first_by_name = {}
+    work = []
+    for i, path in enumerate(vrm_paths):
+        key = os.path.basename(path).lower()
+        if key in first_by_name:
+            results[i] = {"vrm": path, "character": None, "error": f"duplicate file name (also {first_by_name[key]})"}
+            if progress:
+                progress(results[i])
+            continue
+        first_by_name[key] = path
+        work.append(i)
+
+    with ThreadPoolExecutor(max_workers=jobs or DEFAULT_JOBS) as pool:
+        futures = {pool.submit(register_one, vrm_paths[i], folder, gender, scaling, meta_cache.get(vrm_paths[i])): i
+                   for i in work}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:  # anything register_one did not anticipate: fail this VRM only
+                result = {"vrm": vrm_paths[i], "character": None, "error": f"{type(e).__name__}: {e}"}
+            results[i] = result
+            if progress:
+                progress(result)
+
+    if commit:
+        store = AssetsStore(folder)
+        store.load()
+        commit_assets(store, results, gender)
+        store.compact()
+    return results
+
+
+def collect_vrm_files(paths):
+    """Expand folders to the .vrm files directly inside them; files are kept as given."""
+    vrm_files = []
+    for p in paths:
+        if os.path.isdir(p):
+            vrm_files.extend(os.path.join(p, name) for name in sorted(os.listdir(p))
+                             if name.lower().endswith(".vrm"))
+        else:
+            vrm_files.append(p)
+    return [os.path.normpath(p) for p in vrm_files]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Register VRoid VRMs as user characters without UE")
+    parser.add_argument("folder", help="UserCharacter folder")
+    parser.add_argument("vrm_files", nargs="+", help="VRM files or folders containing VRMs")
+    parser.add_argument("--gender", default="Female", choices=["Female", "Male"])
+    parser.add_argument("--scaling", default="Original", choices=["Original", "CineV"])
+    parser.add_argument("--jobs", "-j", type=int, default=None, help=f"Worker threads (default: {DEFAULT_JOBS})")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.folder):
+        print(f"ERROR: Folder not found: {args.folder}")
+        sys.exit(1)
+    vrm_files = collect_vrm_files(args.vrm_files)
+    if not vrm_files:
+        print("ERROR: No VRM files found.")
+        sys.exit(1)
+
+    total = len(vrm_files)
+    done = [0]
+
+    def report(r):
+        done[0] += 1
+        if r["error"]:
+            print(f"[{done[0]}/{total}] FAILED {os.path.basename(r['vrm'])}: {r['error']}")
+        else:
+            print(f"[{done[0]}/{total}] {r['character']} ({r['display_name']}, {r['placement']}, "
+                  f"{r['size'] / (1024 * 1024):.1f} MB)")
+
+    start = time.perf_counter()
+    results = register_vrms(args.folder, vrm_files, args.gender, args.scaling, args.jobs, progress=report)
+    failed = sum(1 for r in results if r["error"])
+    updated = sum(1 for r in results if r.get("updated"))
+    print(f"\n=== {total - failed}/{total} registered ({updated} updated) in {time.perf_counter() - start:.1f}s ===")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()